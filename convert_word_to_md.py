@@ -3,27 +3,402 @@
 
 import os
 import re
+import json
+import time
+import queue
+import signal
+import hashlib
+import threading
+import zipfile
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from docx import Document
 import sys
 
-def extract_text_from_docx(file_path):
-    """从Word文档提取文本内容"""
+# 解析引擎：python-docx 构建完整对象树；stream 直接流式解析 document.xml
+ENGINES = ('python-docx', 'stream')
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+STYLES_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+IMAGE_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+V_NS = '{urn:schemas-microsoft-com:vml}'
+
+# 图片按内容哈希命名存放在输出目录下的这个子目录中，所有文档共享
+ASSETS_DIRNAME = 'assets'
+
+# 默认的标题启发式规则（按顺序匹配，先命中者生效），级别 0 表示正文
+DEFAULT_HEADING_RULES = [
+    # 转写稿的说话人行：周子轩(00:00:04): ……
+    (r'\S{1,20}[(（]\d{1,2}:\d{2}(?::\d{2})?[)）]', 0),
+    # 单独一行的说话人标签：Kaid:
+    (r'[^\s:：]{1,30}[:：]$', 0),
+    # 链接
+    (r'(?:https?://|www\.)', 0),
+    # 第一章 / 第二部分
+    (r'第[一二三四五六七八九十百零\d]+[章部篇节]', 2),
+    # 一、 / 二．
+    (r'[一二三四五六七八九十]+[、.．]', 2),
+    # （一） / (二)
+    (r'[(（][一二三四五六七八九十]+[)）]', 3),
+    # 1.2.3 / 1.2 / 1.
+    (r'\d+\.\d+\.\d+\s*\S', 4),
+    (r'\d+\.\d+\s*\S', 3),
+    (r'\d+[.．、]\s*\S', 3),
+]
+
+class HeadingClassifier:
+    """段落标题分级器
+
+    优先使用Word段落样式和大纲级别；没有样式信息时，再用预编译的启发式规则判断。
+    所有规则合并为一个正则，每个段落只匹配一次。返回Markdown标题级别（2-4），
+    正文返回 0；一级标题留给文档主题。规则只决定级别，长度和句末标点的限制对规则和兜底都适用。
+
+    Args:
+        rules (list): (正则, 级别) 列表，按顺序匹配，默认 DEFAULT_HEADING_RULES
+        max_length (int): 启发式判断中标题的最大长度
+    """
+
+    STYLE_PATTERN = re.compile(r'heading (\d)$')
+    SENTENCE_END = re.compile(r'[。！？!?；;]')
+
+    def __init__(self, rules=None, max_length=50):
+        rules = DEFAULT_HEADING_RULES if rules is None else rules
+        self.levels = {}
+        alternatives = []
+        for index, (pattern, level) in enumerate(rules):
+            self.levels[f'r{index}'] = level
+            alternatives.append(f'(?P<r{index}>{pattern})')
+        self.pattern = re.compile('|'.join(alternatives)) if alternatives else None
+        self.max_length = max_length
+
+    def classify(self, text, style_name=None, outline_level=None):
+        """判断段落的标题级别，正文返回 0"""
+        # 1. 段落或样式上的大纲级别（0-8，9 为正文）
+        if outline_level is not None and outline_level < 9:
+            return min(outline_level + 2, 4)
+        # 2. 标题样式名
+        if style_name:
+            name = style_name.lower()
+            if name in ('title', '标题'):
+                return 2
+            match = self.STYLE_PATTERN.match(name)
+            if match:
+                return min(int(match.group(1)) + 1, 4)
+        # 3. 启发式判断只认较短且不含句末标点的行，编号开头的长句仍是正文
+        if len(text) >= self.max_length or self.SENTENCE_END.search(text):
+            return 0
+        # 4. 规则决定级别（说话人、链接等规则为 0）；都不匹配时视为二级标题
+        match = self.pattern.match(text) if self.pattern else None
+        return self.levels[match.lastgroup] if match else 2
+
+DEFAULT_CLASSIFIER = HeadingClassifier()
+
+def _main_document_part(zf):
+    """从 _rels/.rels 找到主文档部件路径，通常为 word/document.xml"""
     try:
-        doc = Document(file_path)
-        content = []
-
-        for paragraph in doc.paragraphs:
-            text = paragraph.text.strip()
-            if text:
-                # 检测是否是标题（通常标题较短且不包含太多标点）
-                if len(text) < 50 and not '。' in text:
-                    content.append(f"## {text}")
-                else:
-                    content.append(text)
-                content.append("")  # 添加空行
+        rels = ET.fromstring(zf.read('_rels/.rels'))
+    except KeyError:
+        return 'word/document.xml'
+    for rel in rels.iter(f'{REL_NS}Relationship'):
+        if rel.get('Type') == OFFICE_DOCUMENT_REL:
+            return rel.get('Target').lstrip('/')
+    return 'word/document.xml'
+
+def _part_relationships(zf, part):
+    """读取部件的关系表，返回 {rId: (类型, zip内路径)}，外部链接不包含在内"""
+    directory, name = os.path.split(part)
+    try:
+        rels = ET.fromstring(zf.read(f'{directory}/_rels/{name}.rels'))
+    except KeyError:
+        return {}
+    result = {}
+    for rel in rels.iter(f'{REL_NS}Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target')
+        if target.startswith('/'):
+            member = target.lstrip('/')
+        else:
+            member = os.path.normpath(os.path.join(directory, target)).replace(os.sep, '/')
+        result[rel.get('Id')] = (rel.get('Type'), member)
+    return result
+
+def _related_part(zf, part, rel_type):
+    """查找某个部件的关联部件路径，例如主文档对应的 styles.xml"""
+    for kind, member in _part_relationships(zf, part).values():
+        if kind == rel_type:
+            return member
+    return None
+
+def _outline_level(element):
+    """读取段落或样式 pPr 上的 w:outlineLvl，没有时返回 None"""
+    ppr = element.find(f'{W_NS}pPr')
+    if ppr is None:
+        return None
+    outline = ppr.find(f'{W_NS}outlineLvl')
+    if outline is None:
+        return None
+    return int(outline.get(f'{W_NS}val'))
+
+def _parse_styles(root):
+    """解析样式表，返回 ({样式ID: (样式名, 大纲级别)}, 默认段落样式ID)
+
+    大纲级别沿 basedOn 继承链解析。
+    """
+    raw = {}
+    default_id = None
+    if root is not None:
+        for style in root.iter(f'{W_NS}style'):
+            if style.get(f'{W_NS}type') != 'paragraph':
+                continue
+            style_id = style.get(f'{W_NS}styleId')
+            name = style.find(f'{W_NS}name')
+            based_on = style.find(f'{W_NS}basedOn')
+            raw[style_id] = (
+                name.get(f'{W_NS}val') if name is not None else None,
+                _outline_level(style),
+                based_on.get(f'{W_NS}val') if based_on is not None else None,
+            )
+            if style.get(f'{W_NS}default') in ('1', 'true', 'on'):
+                default_id = style_id
+
+    styles = {}
+    for style_id, (name, outline, based_on) in raw.items():
+        seen = {style_id}
+        while outline is None and based_on in raw and based_on not in seen:
+            seen.add(based_on)
+            outline, based_on = raw[based_on][1], raw[based_on][2]
+        styles[style_id] = (name, outline)
+    return styles, default_id
+
+def _paragraph_style(paragraph, styles, default_id):
+    """返回段落的 (样式名, 大纲级别)，段落自身的大纲级别优先"""
+    style_id = default_id
+    ppr = paragraph.find(f'{W_NS}pPr')
+    if ppr is not None:
+        pstyle = ppr.find(f'{W_NS}pStyle')
+        if pstyle is not None:
+            style_id = pstyle.get(f'{W_NS}val')
+    name, outline = styles.get(style_id, (None, None))
+    own_outline = _outline_level(paragraph)
+    return name, own_outline if own_outline is not None else outline
+
+def _run_text(run):
+    """与 python-docx 的 Run.text 规则一致"""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == f'{W_NS}t':
+            parts.append(child.text or '')
+        elif tag in (f'{W_NS}tab', f'{W_NS}ptab'):
+            parts.append('\t')
+        elif tag == f'{W_NS}br':
+            # 只有换行符算文本，分页/分栏符为空
+            if child.get(f'{W_NS}type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag == f'{W_NS}cr':
+            parts.append('\n')
+        elif tag == f'{W_NS}noBreakHyphen':
+            parts.append('-')
+    return ''.join(parts)
+
+def _paragraph_text(paragraph):
+    """与 python-docx 的 Paragraph.text 规则一致：只取直接子级的 w:r 和 w:hyperlink"""
+    parts = []
+    for child in paragraph:
+        if child.tag == f'{W_NS}r':
+            parts.append(_run_text(child))
+        elif child.tag == f'{W_NS}hyperlink':
+            parts.extend(_run_text(run) for run in child.findall(f'{W_NS}r'))
+    return ''.join(parts)
+
+def _paragraph_image_ids(paragraph):
+    """段落中嵌入图片的关系ID（DrawingML 的 a:blip 和旧式 VML 的 v:imagedata）"""
+    ids = []
+    for blip in paragraph.iter(f'{A_NS}blip'):
+        if blip.get(f'{R_NS}embed'):
+            ids.append(blip.get(f'{R_NS}embed'))
+    for image in paragraph.iter(f'{V_NS}imagedata'):
+        if image.get(f'{R_NS}id'):
+            ids.append(image.get(f'{R_NS}id'))
+    return ids
+
+def _table_rows(table):
+    """把 w:tbl 展开为二维文本列表
+
+    横向合并（gridSpan）的单元格按跨度重复文本，纵向合并的后续单元格留空；
+    单元格内多个段落用换行连接，嵌套表格不展开。
+    """
+    rows = []
+    for tr in table.findall(f'{W_NS}tr'):
+        row = []
+        for tc in tr.findall(f'{W_NS}tc'):
+            text = '\n'.join(_paragraph_text(p) for p in tc.findall(f'{W_NS}p'))
+            span = 1
+            tcpr = tc.find(f'{W_NS}tcPr')
+            if tcpr is not None:
+                grid_span = tcpr.find(f'{W_NS}gridSpan')
+                if grid_span is not None:
+                    span = int(grid_span.get(f'{W_NS}val', '1'))
+                v_merge = tcpr.find(f'{W_NS}vMerge')
+                if v_merge is not None and v_merge.get(f'{W_NS}val', 'continue') == 'continue':
+                    text = ''
+            row.extend([text] * span)
+        rows.append(row)
+    return rows
+
+def iter_docx_blocks(file_path):
+    """流式读取Word文档正文，按顺序逐块产出段落和表格
+
+    段落产出 ('paragraph', 文本, 样式名, 大纲级别, 图片列表)，
+    图片列表为 [(扩展名, 二进制内容)]；表格产出 ('table', 二维文本列表)。
+
+    直接从 zip 中增量解析主文档 XML，不构建 python-docx 对象树；
+    每处理完一个正文子元素就从树上摘除，内存占用与文档长度无关。
+    与 Document.iter_inner_content() 一样只包含 w:body 的直接子段落和表格。
+    """
+    with zipfile.ZipFile(file_path) as zf:
+        part = _main_document_part(zf)
+        relationships = _part_relationships(zf, part)
+        styles_part = _related_part(zf, part, STYLES_REL)
+        styles_root = ET.fromstring(zf.read(styles_part)) if styles_part else None
+        styles, default_id = _parse_styles(styles_root)
+
+        def read_image(rel_id):
+            kind, member = relationships.get(rel_id, (None, None))
+            if kind != IMAGE_REL:
+                return None
+            return os.path.splitext(member)[1].lower(), zf.read(member)
+
+        with zf.open(part) as xml_file:
+            depth = 0
+            body = None
+            for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and elem.tag == f'{W_NS}body':
+                        body = elem
+                    continue
+                depth -= 1
+                if depth == 2 and body is not None:
+                    if elem.tag == f'{W_NS}p':
+                        images = [read_image(rel_id) for rel_id in _paragraph_image_ids(elem)]
+                        yield (('paragraph', _paragraph_text(elem))
+                               + _paragraph_style(elem, styles, default_id)
+                               + ([image for image in images if image],))
+                    elif elem.tag == f'{W_NS}tbl':
+                        yield ('table', _table_rows(elem))
+                    body.remove(elem)
+
+def _python_docx_blocks(file_path):
+    """python-docx 引擎：构建完整的 Document 对象后按顺序产出段落和表格"""
+    from docx.table import Table
+
+    doc = Document(file_path)
+    styles, default_id = _parse_styles(doc.styles.element)
 
-        return "\n".join(content)
+    def read_image(rel_id):
+        rel = doc.part.rels.get(rel_id)
+        if rel is None or rel.is_external or rel.reltype != IMAGE_REL:
+            return None
+        return os.path.splitext(rel.target_part.partname)[1].lower(), rel.target_part.blob
+
+    for block in doc.iter_inner_content():
+        if isinstance(block, Table):
+            yield ('table', _table_rows(block._tbl))
+            continue
+        images = [read_image(rel_id) for rel_id in _paragraph_image_ids(block._p)]
+        yield (('paragraph', block.text)
+               + _paragraph_style(block._p, styles, default_id)
+               + ([image for image in images if image],))
+
+def iter_blocks(file_path, engine='python-docx'):
+    """按指定引擎逐块产出Word文档正文的段落和表格，格式见 iter_docx_blocks"""
+    if engine == 'stream':
+        yield from iter_docx_blocks(file_path)
+    elif engine == 'python-docx':
+        yield from _python_docx_blocks(file_path)
+    else:
+        raise ValueError(f"未知的解析引擎: {engine}（可选：{', '.join(ENGINES)}）")
+
+def store_asset(assets_dir, data, ext):
+    """按内容哈希把图片存入共享目录，返回文件名
+
+    相同内容只写一次；先写临时文件再原子替换，多个进程同时写入也是安全的。
+    assets_dir 为 None 时只计算文件名，不写磁盘。
+    """
+    name = f"{hashlib.sha256(data).hexdigest()[:16]}{ext}"
+    if assets_dir is None:
+        return name
+    path = os.path.join(assets_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(assets_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return name
+
+def _markdown_cell(text):
+    """单元格文本转义：竖线转义，换行改为 <br>"""
+    return text.strip().replace('|', '\\|').replace('\n', '<br>')
+
+def table_to_markdown(rows):
+    """二维文本列表转Markdown表格，第一行作为表头，列数按最宽的一行补齐"""
+    rows = [row for row in rows if row]
+    if not rows:
+        return ''
+    width = max(len(row) for row in rows)
+    lines = []
+    for index, row in enumerate(rows):
+        cells = [_markdown_cell(cell) for cell in row] + [''] * (width - len(row))
+        lines.append('| ' + ' | '.join(cells) + ' |')
+        if index == 0:
+            lines.append('|' + ' --- |' * width)
+    return '\n'.join(lines)
+
+def docx_to_markdown_body(file_path, engine='python-docx', classifier=None, assets_dir=None):
+    """从Word文档提取Markdown正文，读取失败时抛出异常
+
+    表格输出为Markdown表格；图片存入 assets_dir（按内容哈希去重），
+    正文中以相对路径 assets/<哈希>.<扩展名> 引用。
+    """
+    classifier = classifier or DEFAULT_CLASSIFIER
+    content = []
+
+    for block in iter_blocks(file_path, engine):
+        if block[0] == 'table':
+            table = table_to_markdown(block[1])
+            if table:
+                content.append(table)
+                content.append("")
+            continue
+
+        _, paragraph_text, style_name, outline_level, images = block
+        text = paragraph_text.strip()
+        if text:
+            level = classifier.classify(text, style_name, outline_level)
+            if level:
+                content.append(f"{'#' * level} {text}")
+            else:
+                content.append(text)
+            content.append("")  # 添加空行
+        for ext, data in images:
+            content.append(f"![]({ASSETS_DIRNAME}/{store_asset(assets_dir, data, ext)})")
+            content.append("")
+
+    return "\n".join(content)
+
+def extract_text_from_docx(file_path, engine='python-docx'):
+    """从Word文档提取文本内容"""
+    try:
+        return docx_to_markdown_body(file_path, engine)
     except Exception as e:
         print(f"读取文件 {file_path} 失败: {e}")
         return None
@@ -32,8 +407,9 @@ def get_main_theme(content):
     """从内容中提取主题（取前100个字符中的关键内容）"""
     # 移除markdown标记
     clean_content = re.sub(r'#+ ', '', content)
-    # 取第一行作为主题
-    first_line = clean_content.split('\n')[0] if clean_content else ""
+    # 取第一行作为主题（跳过图片和表格行）
+    lines = [line for line in clean_content.split('\n') if not line.startswith(('![', '|'))]
+    first_line = lines[0] if lines else ""
     # 限制长度
     theme = first_line[:30] if len(first_line) > 30 else first_line
     # 清理特殊字符
@@ -50,46 +426,43 @@ def extract_date_from_filename(filename):
     # 如果没有日期，返回标记
     return "待补充日期"
 
-def convert_word_to_markdown(input_dir, output_dir):
-    """批量转换Word文档为Markdown"""
-
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    docx_files = [f for f in os.listdir(input_dir) if f.endswith('.docx')]
-
-    print(f"找到 {len(docx_files)} 个Word文档")
-    print("-" * 50)
+def prepare_markdown(input_dir, docx_file, engine='python-docx', assets_dir=None):
+    """解析单个Word文档，生成目标文件名和Markdown内容
 
-    converted_count = 0
-
-    for docx_file in docx_files:
-        input_path = os.path.join(input_dir, docx_file)
+    除了按内容寻址、可并发写入的图片外不写任何文件，因此可以放到子进程中并行执行。
 
-        # 提取文档内容
-        content = extract_text_from_docx(input_path)
-        if not content:
-            continue
+    Returns:
+        dict: source / filename / content / error，读取失败时 error 为异常信息
+    """
+    input_path = os.path.join(input_dir, docx_file)
+    result = {'source': docx_file, 'filename': None, 'content': None, 'error': None}
 
-        # 获取主题
-        theme = get_main_theme(content)
-        if not theme:
-            # 如果无法从内容提取主题，使用文件名
-            theme = docx_file.replace('.docx', '').replace('微信', '').strip()
-            theme = re.sub(r'[\d\-\s]+', '', theme)  # 移除数字和横线
+    # 提取文档内容
+    try:
+        content = docx_to_markdown_body(input_path, engine, assets_dir=assets_dir)
+    except Exception as e:
+        result['error'] = f"读取文件 {input_path} 失败: {e}"
+        return result
+    if not content:
+        return result
 
-        # 获取日期
-        date = extract_date_from_filename(docx_file)
+    # 获取主题
+    theme = get_main_theme(content)
+    if not theme:
+        # 如果无法从内容提取主题，使用文件名
+        theme = docx_file.replace('.docx', '').replace('微信', '').strip()
+        theme = re.sub(r'[\d\-\s]+', '', theme)  # 移除数字和横线
 
-        # 生成新文件名：主题_日期.md
-        new_filename = f"{theme}_{date}.md"
-        # 清理文件名中的特殊字符
-        new_filename = re.sub(r'[<>:"/\\|?*]', '_', new_filename)
+    # 获取日期
+    date = extract_date_from_filename(docx_file)
 
-        output_path = os.path.join(output_dir, new_filename)
+    # 生成新文件名：主题_日期.md
+    new_filename = f"{theme}_{date}.md"
+    # 清理文件名中的特殊字符
+    result['filename'] = re.sub(r'[<>:"/\\|?*]', '_', new_filename)
 
-        # 添加文档元数据
-        markdown_content = f"""# {theme}
+    # 添加文档元数据
+    result['content'] = f"""# {theme}
 
 **日期**: {date}
 **原始文件**: {docx_file}
@@ -98,25 +471,440 @@ def convert_word_to_markdown(input_dir, output_dir):
 
 {content}
 """
+    return result
+
+def list_docx_files(input_dir):
+    """列出目录中的Word文档（排除Word打开文件时生成的 ~$ 锁文件）"""
+    return sorted(f for f in os.listdir(input_dir)
+                  if f.endswith('.docx') and not f.startswith('~$'))
+
+def iter_prepared(input_dir, docx_files, jobs=1, engine='python-docx', executor=None,
+                  assets_dir=None):
+    """按输入顺序逐个产出解析结果
+
+    jobs > 1 时使用进程池并行解析；结果按提交顺序流式返回，
+    前面的文档一完成就立即交给调用方，报告顺序与串行模式一致。
+    传入 executor 时复用调用方的进程池（如监听模式下常驻的进程池）。
+    """
+    if executor is None and jobs <= 1:
+        for docx_file in docx_files:
+            yield prepare_markdown(input_dir, docx_file, engine, assets_dir)
+        return
+
+    count = len(docx_files)
+    args = ([input_dir] * count, docx_files, [engine] * count, [assets_dir] * count)
+    if executor is not None:
+        yield from executor.map(prepare_markdown, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(prepare_markdown, *args)
+
+MANIFEST_NAME = '.convert_manifest.json'
+
+def file_sha256(file_path):
+    """计算文件内容的SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_manifest(output_dir):
+    """读取输出目录中的转换清单，不存在或损坏时返回空清单"""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'version': 1, 'files': {}}
+    manifest.setdefault('files', {})
+    return manifest
+
+def save_manifest(output_dir, manifest):
+    """原子地写回转换清单，避免中断时留下半个文件"""
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def manifest_key(input_dir, docx_file, output_dir):
+    """清单中的源文件路径，相对于输出目录保存，与运行时的工作目录无关"""
+    return os.path.relpath(os.path.join(input_dir, docx_file), output_dir)
+
+class OutputNameIndex:
+    """输出文件名索引：记录每个输出文件名归哪个源文件所有
+
+    每次运行开始时由转换清单和输出目录的一次 listdir 构建，之后的冲突检测不需要再扫描输出目录。
+    输出目录中清单不认识的文件（手写的，或清单出现之前转换的）归 EXISTING 所有，不会被覆盖。
+    同名时按处理顺序依次加 _2、_3 …… 后缀；每个基础名记住下一个可用后缀，
+    单个文件的分配是常数时间。已经分配过后缀的源文件会保留原来的名字。
+    """
+
+    # 输出目录中已有、但不属于任何源文件的文件
+    EXISTING = object()
+
+    def __init__(self, entries, existing=()):
+        self.owners = dict.fromkeys(existing, self.EXISTING)
+        self.owners.update((entry['output'], key) for key, entry in entries.items())
+        self.next_suffix = {}
+
+    def owner(self, filename):
+        """返回占用该文件名的源文件（清单中的路径）或 EXISTING，未被占用时返回 None"""
+        return self.owners.get(filename)
+
+    def _available(self, filename, key):
+        return self.owners.get(filename) in (None, key)
+
+    def claim(self, key, filename, previous=None):
+        """为源文件 key 分配输出文件名，previous 为它上一次使用的文件名"""
+        stem, ext = os.path.splitext(filename)
+        suffixed = re.compile(rf'{re.escape(stem)}_\d+{re.escape(ext)}')
+        if previous and suffixed.fullmatch(previous) and self._available(previous, key):
+            # 上次已经因为冲突加过后缀，继续沿用，避免输出文件名来回变化
+            name = previous
+        elif self._available(filename, key):
+            name = filename
+        else:
+            n = self.next_suffix.get(filename, 2)
+            while not self._available(f"{stem}_{n}{ext}", key):
+                n += 1
+            self.next_suffix[filename] = n + 1
+            name = f"{stem}_{n}{ext}"
+
+        if previous and previous != name and self.owners.get(previous) == key:
+            del self.owners[previous]
+        self.owners[name] = key
+        return name
+
+    def release(self, key, filename):
+        """写入失败时释放刚分配的文件名"""
+        if self.owners.get(filename) == key:
+            del self.owners[filename]
+
+def check_unchanged(input_path, entry, output_dir):
+    """判断源文件自上次转换后是否未变化
+
+    大小和修改时间都一致时直接认定未变化，不读取文件；
+    只有时间戳变了才计算内容哈希，哈希一致时同样视为未变化。
+
+    Returns:
+        tuple: (是否未变化, 当前大小, 当前修改时间, 内容哈希或None)
+    """
+    stat = os.stat(input_path)
+    if not entry or not os.path.exists(os.path.join(output_dir, entry['output'])):
+        return False, stat.st_size, stat.st_mtime_ns, None
+    if entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return True, stat.st_size, stat.st_mtime_ns, entry['sha256']
+    if entry['size'] != stat.st_size:
+        return False, stat.st_size, stat.st_mtime_ns, None
+    sha256 = file_sha256(input_path)
+    return sha256 == entry['sha256'], stat.st_size, stat.st_mtime_ns, sha256
+
+def convert_word_to_markdown(input_dir, output_dir, jobs=1, force=False, engine='python-docx',
+                             executor=None):
+    """批量转换Word文档为Markdown
+
+    输出目录中维护一份转换清单（源文件大小、修改时间、内容哈希 → 输出文件名），
+    未变化的文档直接跳过，不会被重新打开解析。
+
+    Args:
+        input_dir (str): Word文档所在目录
+        output_dir (str): Markdown输出目录
+        jobs (int): 并行进程数，1 为串行，0 表示使用全部CPU核心
+        force (bool): 忽略转换清单，全部重新转换
+        engine (str): 解析引擎，'python-docx'（默认）或 'stream'
+        executor: 可选的进程池，传入时复用而不是每次新建
+    """
+
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    docx_files = list_docx_files(input_dir)
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    manifest = load_manifest(output_dir)
+    entries = manifest['files']
+    names = OutputNameIndex(entries, os.listdir(output_dir))
+
+    # 找出需要重新转换的文档
+    pending = []
+    fingerprints = {}
+    skipped_count = 0
+    for docx_file in docx_files:
+        key = manifest_key(input_dir, docx_file, output_dir)
+        input_path = os.path.join(input_dir, docx_file)
+        unchanged, size, mtime_ns, sha256 = check_unchanged(input_path, entries.get(key), output_dir)
+        if unchanged and not force:
+            # 只是时间戳变化时顺便刷新，下次可以不再计算哈希
+            entries[key].update(size=size, mtime_ns=mtime_ns)
+            skipped_count += 1
+            continue
+        fingerprints[docx_file] = (size, mtime_ns, sha256)
+        pending.append(docx_file)
+
+    print(f"找到 {len(docx_files)} 个Word文档")
+    if skipped_count:
+        print(f"未变化跳过: {skipped_count} 个")
+    if jobs > 1:
+        print(f"并行进程数: {jobs}")
+    print("-" * 50)
+
+    converted_count = 0
+    stale_outputs = []
+    renamed = []
+
+    assets_dir = os.path.join(output_dir, ASSETS_DIRNAME)
+    for result in iter_prepared(input_dir, pending, jobs, engine, executor, assets_dir):
+        docx_file = result['source']
+        if result['error']:
+            print(result['error'])
+            continue
+        if not result['content']:
+            continue
+
+        # 分配不冲突的输出文件名
+        key = manifest_key(input_dir, docx_file, output_dir)
+        previous = entries.get(key)
+        new_filename = names.claim(key, result['filename'],
+                                   previous['output'] if previous else None)
+        output_path = os.path.join(output_dir, new_filename)
 
         # 写入Markdown文件
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+                f.write(result['content'])
             print(f"✅ 转换成功: {docx_file}")
             print(f"   → {new_filename}")
+            if new_filename != result['filename']:
+                owner = names.owner(result['filename'])
+                if owner is OutputNameIndex.EXISTING:
+                    print(f"   ⚠️  输出目录中已有 {result['filename']}，自动加后缀")
+                else:
+                    print(f"   ⚠️  {result['filename']} 已被 {os.path.basename(owner)} 占用，自动加后缀")
+                renamed.append((docx_file, new_filename))
             converted_count += 1
+
+            size, mtime_ns, sha256 = fingerprints[docx_file]
+            if previous and previous['output'] != new_filename:
+                stale_outputs.append((previous['output'], docx_file))
+            entries[key] = {
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'sha256': sha256 or file_sha256(os.path.join(input_dir, docx_file)),
+                'output': new_filename,
+            }
         except Exception as e:
+            names.release(key, new_filename)
             print(f"❌ 写入失败: {docx_file}")
             print(f"   错误: {e}")
 
         print()
 
+    # 源文件已不存在的条目，其输出视为过期；输出被手动删除后条目随之移除
+    for key in sorted(entries):
+        if not os.path.exists(os.path.join(output_dir, key)):
+            output = entries[key]['output']
+            if os.path.exists(os.path.join(output_dir, output)):
+                stale_outputs.append((output, os.path.basename(key)))
+            else:
+                del entries[key]
+
+    save_manifest(output_dir, manifest)
+
     print("-" * 50)
-    print(f"转换完成！共转换 {converted_count}/{len(docx_files)} 个文档")
+    if renamed:
+        print(f"🔀 {len(renamed)} 个文档因重名改用带后缀的文件名:")
+        for source, output in renamed:
+            print(f"   {source}  → {output}")
+    if stale_outputs:
+        print(f"⚠️  发现 {len(stale_outputs)} 个过期输出（未自动删除）:")
+        for output, source in stale_outputs:
+            print(f"   {output}  ← {source}")
+    print(f"转换完成！共转换 {converted_count}/{len(docx_files)} 个文档"
+          + (f"，跳过未变化 {skipped_count} 个" if skipped_count else ""))
 
-if __name__ == "__main__":
-    input_dir = "待处理"
-    output_dir = "06-待整理文档"
+def benchmark_engines(input_dir, repeat=3):
+    """对比各解析引擎的耗时，并校验生成的Markdown完全一致"""
+    docx_files = list_docx_files(input_dir)
+    print(f"基准测试：{len(docx_files)} 个Word文档，每个引擎重复 {repeat} 次")
+    print("-" * 50)
+
+    outputs = {}
+    for engine in ENGINES:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = [prepare_markdown(input_dir, f, engine) for f in docx_files]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        outputs[engine] = results
+        print(f"{engine:<12} 最佳耗时 {best * 1000:.1f} ms")
+
+    reference = outputs[ENGINES[0]]
+    for engine in ENGINES[1:]:
+        mismatched = [a['source'] for a, b in zip(reference, outputs[engine]) if a != b]
+        if mismatched:
+            print(f"❌ {engine} 与 {ENGINES[0]} 输出不一致: {', '.join(mismatched)}")
+        else:
+            print(f"✅ {engine} 与 {ENGINES[0]} 输出逐字节一致")
+
+def _is_docx_event(path):
+    """只关心真正的Word文档，忽略锁文件和临时文件"""
+    name = os.path.basename(path)
+    return name.endswith('.docx') and not name.startswith('~$')
+
+def _start_watchdog(input_dir, events):
+    """使用 watchdog（Linux 下基于 inotify）监听目录，未安装时返回 None"""
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+
+    class InboxHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            for path in (event.src_path, getattr(event, 'dest_path', '')):
+                if path and _is_docx_event(path):
+                    events.put(os.path.basename(path))
 
-    convert_word_to_markdown(input_dir, output_dir)
\ No newline at end of file
+    observer = Observer()
+    observer.schedule(InboxHandler(), input_dir, recursive=False)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+def _start_polling(input_dir, events, interval, stop):
+    """轮询目录快照（大小、修改时间），作为没有 watchdog 时的兜底方案"""
+    def snapshot():
+        result = {}
+        try:
+            entries = list(os.scandir(input_dir))
+        except OSError:
+            return result
+        for entry in entries:
+            if _is_docx_event(entry.name):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                result[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return result
+
+    def poll():
+        previous = snapshot()
+        while not stop.wait(interval):
+            current = snapshot()
+            for name in current.keys() | previous.keys():
+                if current.get(name) != previous.get(name):
+                    events.put(name)
+            previous = current
+
+    thread = threading.Thread(target=poll, daemon=True)
+    thread.start()
+    return thread
+
+def watch_inbox(input_dir, output_dir, jobs=1, engine='python-docx', debounce=2.0,
+                poll_interval=1.0, use_polling=False):
+    """监听收件箱目录，新增或修改的Word文档自动转换为Markdown
+
+    文件事件先去抖：一批事件之后安静 debounce 秒才触发转换，避免文件还没写完就被读取。
+    每次转换依赖转换清单，只处理真正变化的文档；进程池在整个监听期间常驻复用。
+
+    Args:
+        input_dir (str): 监听的Word文档目录
+        output_dir (str): Markdown输出目录
+        jobs (int): 并行进程数，0 表示使用全部CPU核心
+        engine (str): 解析引擎
+        debounce (float): 去抖等待时间（秒）
+        poll_interval (float): 轮询模式下的扫描间隔（秒）
+        use_polling (bool): 强制使用轮询，不使用 inotify
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    events = queue.Queue()
+    stop = threading.Event()
+    observer = None if use_polling else _start_watchdog(input_dir, events)
+    if observer is None:
+        _start_polling(input_dir, events, poll_interval, stop)
+        print(f"👀 监听目录（轮询，每 {poll_interval} 秒）: {input_dir}")
+    else:
+        print(f"👀 监听目录（inotify）: {input_dir}")
+    print("按 Ctrl+C 退出")
+    print()
+
+    executor = None
+    if jobs > 1:
+        # Ctrl+C 只由主进程处理，子进程随进程池一起正常关闭
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=signal.signal,
+                                       initargs=(signal.SIGINT, signal.SIG_IGN))
+    try:
+        # 启动时先补齐离线期间的变化
+        convert_word_to_markdown(input_dir, output_dir, jobs=jobs, engine=engine,
+                                 executor=executor)
+        while True:
+            changed = {events.get()}
+            # 去抖：持续收集，直到 debounce 秒内没有新事件
+            while True:
+                try:
+                    changed.add(events.get(timeout=debounce))
+                except queue.Empty:
+                    break
+            print()
+            print(f"🔔 检测到 {len(changed)} 个文档变化: {', '.join(sorted(changed))}")
+            convert_word_to_markdown(input_dir, output_dir, jobs=jobs, engine=engine,
+                                     executor=executor)
+    except KeyboardInterrupt:
+        print()
+        print("已停止监听")
+    finally:
+        stop.set()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        if executor is not None:
+            executor.shutdown()
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="批量转换Word文档为Markdown")
+    parser.add_argument('input_dir', nargs='?', default="待处理",
+                        help="Word文档所在目录（默认：待处理）")
+    parser.add_argument('output_dir', nargs='?', default="06-待整理文档",
+                        help="Markdown输出目录（默认：06-待整理文档）")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="并行进程数，0 表示使用全部CPU核心（默认：1，串行）")
+    parser.add_argument('-f', '--force', action='store_true',
+                        help="忽略转换清单，重新转换全部文档")
+    parser.add_argument('--engine', choices=ENGINES, default='python-docx',
+                        help="解析引擎：python-docx（默认）或 stream（流式解析，更快更省内存）")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="对比各解析引擎的耗时和输出一致性，不写任何文件")
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help="持续监听输入目录，有新增或修改的文档时自动转换")
+    parser.add_argument('--debounce', type=float, default=2.0,
+                        help="监听模式的去抖等待时间，单位秒（默认：2）")
+    parser.add_argument('--poll', action='store_true',
+                        help="监听模式强制使用轮询（默认优先使用 watchdog/inotify）")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_engines(args.input_dir)
+        return
+
+    if args.watch:
+        watch_inbox(args.input_dir, args.output_dir, jobs=args.jobs, engine=args.engine,
+                    debounce=args.debounce, use_polling=args.poll)
+        return
+
+    convert_word_to_markdown(args.input_dir, args.output_dir,
+                             jobs=args.jobs, force=args.force, engine=args.engine)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import convert_research_to_pdf
+import convert_to_pdf
+from pdf_renderer import get_local_renderer, render_pdf, with_local_fonts
+
+# 可选的PDF主题：主题名 → 对应的转换模块（提供 build_html_document 和 PDF_STYLESHEET）
+STYLES = {
+    'research': convert_research_to_pdf,
+    'livehouse': convert_to_pdf,
+}
+
+def collect_markdown_files(inputs, recursive=False):
+    """把目录、通配符和文件路径展开为去重后的Markdown文件列表"""
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            pattern = os.path.join(item, '**', '*.md') if recursive else os.path.join(item, '*.md')
+            files.extend(sorted(glob.glob(pattern, recursive=recursive)))
+        elif glob.has_magic(item):
+            files.extend(sorted(glob.glob(item, recursive=True)))
+        elif os.path.isfile(item):
+            files.append(item)
+        else:
+            print(f"⚠️  找不到：{item}")
+    seen = set()
+    return [f for f in files if not (f in seen or seen.add(f))]
+
+def _output_path(md_file, output_dir):
+    """PDF输出路径：默认与Markdown同目录同名"""
+    stem = os.path.splitext(os.path.basename(md_file))[0]
+    return os.path.join(output_dir or os.path.dirname(md_file), f"{stem}.pdf")
+
+def _warm_worker(style):
+    """子进程初始化：创建一次渲染器并解析一次样式表，之后的文件全部复用
+
+    预热只是提前做这些工作。失败时（例如 WeasyPrint 找不到 libpango，或样式表、字体解析出错）
+    不能抛出，否则整个进程池失效；同样的错误会在 convert_one 中再次出现，按文件报告。
+    """
+    try:
+        renderer = get_local_renderer()
+        renderer.stylesheet(with_local_fonts(STYLES[style].PDF_STYLESHEET))
+    except Exception:
+        pass
+
+def convert_one(md_file, pdf_file, style, use_server=True):
+    """转换单个文件，返回 (Markdown解析耗时, 渲染耗时, 错误信息)"""
+    module = STYLES[style]
+    try:
+        start = time.perf_counter()
+        with open(md_file, 'r', encoding='utf-8') as f:
+            markdown_content = f.read()
+        title = os.path.splitext(os.path.basename(md_file))[0]
+        html_document = module.build_html_document(markdown_content, title)
+        parsed = time.perf_counter()
+
+        # base_url 指向Markdown所在目录，文中的相对图片路径可以正常解析
+        render_pdf(html_document, module.PDF_STYLESHEET, pdf_file,
+                   base_url=os.path.dirname(os.path.abspath(md_file)), use_server=use_server)
+        return parsed - start, time.perf_counter() - parsed, None
+    except Exception as e:
+        return 0.0, 0.0, str(e)
+
+def batch_convert(inputs, output_dir=None, style='research', jobs=1, recursive=False):
+    """批量把Markdown转换为PDF，输出每个文件的耗时报告
+
+    单进程时所有文件共用一个 FontConfiguration 和一份解析好的样式表；
+    多进程时每个子进程各自初始化一次后复用。
+
+    Args:
+        inputs (list): 目录、通配符或文件路径
+        output_dir (str): PDF输出目录，默认与各Markdown文件同目录
+        style (str): PDF主题，见 STYLES
+        jobs (int): 并行进程数，0 表示使用全部CPU核心
+        recursive (bool): 目录是否递归查找
+    """
+    md_files = collect_markdown_files(inputs, recursive)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    print(f"找到 {len(md_files)} 个Markdown文件，主题：{style}")
+    if jobs > 1:
+        print(f"并行进程数: {jobs}")
+    print("-" * 50)
+
+    pdf_files = [_output_path(md_file, output_dir) for md_file in md_files]
+    count = len(md_files)
+    start = time.perf_counter()
+
+    if jobs > 1:
+        # 多进程时各自本地渲染，常驻渲染服务是串行的，不在这里使用
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker, initargs=(style,))
+        results = executor.map(convert_one, md_files, pdf_files, [style] * count, [False] * count)
+    else:
+        executor = None
+        results = map(convert_one, md_files, pdf_files, [style] * count)
+
+    converted_count = 0
+    try:
+        for md_file, pdf_file, (parse_time, render_time, error) in zip(md_files, pdf_files, results):
+            if error:
+                print(f"❌ 转换失败: {md_file}")
+                print(f"   错误: {error}")
+                continue
+            converted_count += 1
+            print(f"✅ {os.path.basename(pdf_file)}  "
+                  f"解析 {parse_time:.2f}s  渲染 {render_time:.2f}s  合计 {parse_time + render_time:.2f}s")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print("-" * 50)
+    print(f"转换完成！共转换 {converted_count}/{count} 个文件，总耗时 {time.perf_counter() - start:.2f} 秒")
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="批量将Markdown转换为PDF")
+    parser.add_argument('inputs', nargs='+', help="Markdown文件、目录或通配符（如 '待处理/*.md'）")
+    parser.add_argument('-o', '--output-dir', help="PDF输出目录（默认与Markdown文件同目录）")
+    parser.add_argument('-s', '--style', choices=sorted(STYLES), default='research',
+                        help="PDF主题（默认：research）")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="并行进程数，0 表示使用全部CPU核心（默认：1）")
+    parser.add_argument('-r', '--recursive', action='store_true', help="递归查找目录中的Markdown文件")
+    args = parser.parse_args()
+
+    batch_convert(args.inputs, args.output_dir, args.style, args.jobs, args.recursive)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Markdown引擎在实际文档上的一致性报告和速度对比
+
+覆盖各扩展的一致性样例在 tests/test_markdown_engines.py 中，随测试一起运行。
+这里在仓库的全部文档上比较每个已安装的引擎与参考实现 markdown2：
+
+- 标题：章节的 id、级别和标题文字（页内目录、搜索和 #锚点 链接依赖它们）
+- 结构：段落、列表、表格、代码块、链接等元素的顺序（忽略代码高亮的 <span> 和外层 <div>）
+- 文字：页面上的全部文字（空白合并后）
+
+最后测量每个引擎转换这些文档的耗时。
+
+使用方法：
+    python benchmark_markdown.py                  # 仓库中的全部Markdown
+    python benchmark_markdown.py 方案.md -n 10    # 指定文档，每个引擎重复 10 次取最快
+    python benchmark_markdown.py --check-only -v  # 只做一致性比较，列出不一致的文档
+"""
+
+import argparse
+import difflib
+import os
+import time
+from html.parser import HTMLParser
+from urllib.parse import unquote
+
+from build_site import REPO_ROOT, discover_markdown
+from interactive_page import MARKDOWN_EXTRAS
+from markdown_engines import ENGINES, REFERENCE_ENGINE, engine_version, render_markdown
+from search_index import extract_sections
+
+# 参与结构比较的元素；del/strike 与 s 视为相同
+STRUCTURE_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'li', 'table', 'tr', 'th', 'td',
+                  'pre', 'code', 'blockquote', 'strong', 'em', 's', 'a', 'img', 'input', 'br', 'hr', 'sup'}
+TAG_ALIASES = {'del': 's', 'strike': 's', 'b': 'strong', 'i': 'em'}
+
+class _StructureParser(HTMLParser):
+    """提取元素序列、id 和文字"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.structure = []
+        self.ids = []
+        self.text = []
+        self.after_footnotes = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('id'):
+            self.ids.append(attrs['id'])
+        if 'footnotes' in (attrs.get('class') or '').split():
+            self.after_footnotes = True  # markdown2 在脚注列表前加一条分隔线
+            return
+        tag = TAG_ALIASES.get(tag, tag)
+        if tag not in STRUCTURE_TAGS or (tag == 'hr' and self.after_footnotes):
+            return
+        self.after_footnotes = False
+        detail = ''
+        if tag == 'input':
+            detail = 'checked' if 'checked' in attrs else ''
+        elif tag in ('th', 'td'):
+            detail = (attrs.get('style') or '').replace(' ', '').rstrip(';')
+        elif tag == 'a' and not (attrs.get('href') or '').startswith('#'):
+            detail = unquote(attrs.get('href') or '')  # cmark 把链接中的中文写成 %XX
+        elif tag == 'img':
+            detail = unquote(attrs.get('src') or '')
+        self.structure.append(f'{tag} {detail}'.strip())
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+def compare_html(reference_html, candidate_html):
+    """比较两个引擎的输出，返回不一致的方面 {'标题'|'结构'|'文字'|'id': 第一处差异}"""
+    def summarize(html_content):
+        parser = _StructureParser()
+        parser.feed(html_content)
+        parser.close()
+        sections = [f"{s['level']} #{s['id']} {s['title']}" for s in extract_sections(html_content)]
+        text = ' '.join(''.join(parser.text).split())
+        return {'标题': sections, '结构': parser.structure, 'id': sorted(parser.ids), '文字': [text]}
+
+    reference, candidate = summarize(reference_html), summarize(candidate_html)
+    differences = {}
+    for aspect in reference:
+        if reference[aspect] != candidate[aspect]:
+            differences[aspect] = _first_difference(reference[aspect], candidate[aspect])
+    return differences
+
+def _first_difference(reference, candidate):
+    if len(reference) == len(candidate) == 1:
+        reference, candidate = reference[0], candidate[0]
+        start = next((i for i, (a, b) in enumerate(zip(reference, candidate)) if a != b),
+                     min(len(reference), len(candidate)))
+        return f"…{reference[max(0, start - 15):start + 25]!r} ≠ …{candidate[max(0, start - 15):start + 25]!r}"
+    matcher = difflib.SequenceMatcher(None, reference, candidate, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op != 'equal':
+            return f"{reference[i1:i2][:3]} ≠ {candidate[j1:j2][:3]}"
+    return ''
+
+def check_documents(documents, engines, verbose=False):
+    """在实际文档上比较各引擎与参考实现，按方面统计一致的文档数"""
+    for engine in engines:
+        consistent = {'标题': 0, '结构': 0, 'id': 0, '文字': 0}
+        for path, markdown_content in documents:
+            differences = compare_html(render_markdown(markdown_content, MARKDOWN_EXTRAS, REFERENCE_ENGINE),
+                                       render_markdown(markdown_content, MARKDOWN_EXTRAS, engine))
+            for aspect in consistent:
+                if aspect not in differences:
+                    consistent[aspect] += 1
+            if differences and verbose:
+                print(f"   ⚠️ {os.path.relpath(path, REPO_ROOT)}")
+                for aspect, detail in differences.items():
+                    print(f"      {aspect}：{detail}")
+        print(f"📄 {engine} 与 {REFERENCE_ENGINE} 一致的文档（共 {len(documents)} 篇）：" +
+              '，'.join(f"{aspect} {count}" for aspect, count in consistent.items()))
+
+def benchmark(documents, engines, repeat=3):
+    """每个引擎转换全部文档 repeat 次，返回 {引擎: 最快一次的耗时（秒）}"""
+    timings = {}
+    for engine in engines:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _, markdown_content in documents:
+                render_markdown(markdown_content, MARKDOWN_EXTRAS, engine)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[engine] = best
+    return timings
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="检查Markdown引擎与 markdown2 的一致性并比较速度")
+    parser.add_argument('files', nargs='*', help="参与比较的Markdown文件（默认：仓库中的全部Markdown）")
+    parser.add_argument('-n', '--repeat', type=int, default=3, help="每个引擎重复转换的次数，取最快一次（默认：3）")
+    parser.add_argument('--check-only', action='store_true', help="只做一致性比较，不测速")
+    parser.add_argument('-v', '--verbose', action='store_true', help="列出与参考实现不一致的文档")
+    args = parser.parse_args()
+
+    installed = [engine for engine in ENGINES if engine_version(engine)]
+    for engine in ENGINES:
+        if engine not in installed:
+            print(f"💡 未安装 {engine}（pip install {engine}），跳过")
+    candidates = [engine for engine in installed if engine != REFERENCE_ENGINE]
+
+    files = args.files or [os.path.join(REPO_ROOT, rel) for rel in discover_markdown(REPO_ROOT)]
+    documents = []
+    for path in files:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            documents.append((path, f.read()))
+
+    if candidates:
+        print("-" * 60)
+        check_documents(documents, candidates, args.verbose)
+
+    if not args.check_only:
+        size = sum(len(content.encode('utf-8')) for _, content in documents)
+        print("-" * 60)
+        print(f"⏱️ 转换 {len(documents)} 篇文档（{size / 1024:.0f} KB），每个引擎 {args.repeat} 次取最快：")
+        timings = benchmark(documents, installed, args.repeat)
+        for engine, elapsed in timings.items():
+            speedup = timings[REFERENCE_ENGINE] / elapsed if elapsed else float('inf')
+            print(f"   {engine:<10}{engine_version(engine):<14}{elapsed * 1000:>9.1f} ms  ×{speedup:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""交互式页面的滚动性能基准
+
+生成一个包含 N 个章节（每章一个二级标题、一个三级标题、段落、列表，每 10 章一个表格）的合成文档，
+用通用HTML模板渲染，并注入基准脚本：页面加载后逐帧滚动到底部，记录每一帧从 scroll 事件开始
+到渲染完成（包括 IntersectionObserver 回调）所花的主线程时间。
+
+    scroll_benchmark.html?engine=observer   当前的 IntersectionObserver + requestAnimationFrame 实现
+    scroll_benchmark.html?engine=legacy     原来每次 scroll 都读取全部标题位置的实现，作为对照
+
+安装了 Playwright（pip install playwright && playwright install chromium）时自动在无头浏览器中
+运行两种实现并输出对比；否则只生成页面，用浏览器打开后结果显示在页面右下角。
+
+使用方法：
+    python benchmark_scroll.py                    # 500 个章节
+    python benchmark_scroll.py -n 1000 --steps 800
+    python benchmark_scroll.py --lazy             # 延迟渲染模式（见 lazy_sections.py）
+"""
+
+import argparse
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+from interactive_page import build_interactive_html
+
+ENGINES = ('observer', 'legacy')
+
+# 注入页面的基准脚本：legacyScrollListener 是原 initScrollListener 的实现（阈值取自 PAGE_CONFIG）
+BENCHMARK_SCRIPT = """
+    <pre id="benchmarkResult" style="position:fixed;right:10px;bottom:10px;z-index:20000;
+        background:#111;color:#0f0;padding:10px;font-size:12px;margin:0;">基准运行中...</pre>
+    <script>
+        function legacyScrollListener() {
+            const navbar = document.getElementById('navbar');
+            const backToTop = document.getElementById('backToTop');
+            const progressBar = document.getElementById('progressBar');
+            const headings = document.querySelectorAll('h2, h3');
+            const tocLinks = document.querySelectorAll('.toc-link');
+
+            window.addEventListener('scroll', function() {
+                const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+                const scrollHeight = document.documentElement.scrollHeight - document.documentElement.clientHeight;
+                progressBar.style.width = (scrollTop / scrollHeight) * 100 + '%';
+
+                if (scrollTop > PAGE_CONFIG.navbarThreshold) {
+                    navbar.classList.add('scrolled');
+                } else {
+                    navbar.classList.remove('scrolled');
+                }
+
+                if (scrollTop > PAGE_CONFIG.backToTopThreshold) {
+                    backToTop.classList.add('visible');
+                } else {
+                    backToTop.classList.remove('visible');
+                }
+
+                let currentSection = '';
+                headings.forEach(heading => {
+                    if (heading.getBoundingClientRect().top <= PAGE_CONFIG.activeOffset) {
+                        currentSection = heading.id;
+                    }
+                });
+
+                tocLinks.forEach(link => {
+                    link.classList.remove('active');
+                    if (link.getAttribute('href') === `#${currentSection}`) {
+                        link.classList.add('active');
+                    }
+                });
+            });
+        }
+
+        (function() {
+            const params = new URLSearchParams(location.search);
+            const engine = params.get('engine') || 'observer';
+            let steps = Number(params.get('steps') || __STEPS__);
+            if (engine === 'legacy') {
+                initScrollListener = legacyScrollListener;
+            }
+
+            const costs = [];
+            const channel = new MessageChannel();
+            let frameStart = 0;
+            let hops = 0;
+            let step = 0;
+            let stride = 0;
+
+            // 捕获阶段的监听最先执行，记录这一帧开始处理 scroll 的时间
+            window.addEventListener('scroll', function() {
+                frameStart = performance.now();
+                requestAnimationFrame(() => channel.port2.postMessage(0));
+            }, { capture: true, passive: true });
+
+            // 渲染完成后的第一个任务再转一次，把 IntersectionObserver 回调也算进来
+            channel.port1.onmessage = function() {
+                if (++hops < 2) {
+                    channel.port2.postMessage(0);
+                    return;
+                }
+                hops = 0;
+                costs.push(performance.now() - frameStart);
+                nextStep();
+            };
+
+            function nextStep() {
+                if (step >= steps) {
+                    finish();
+                    return;
+                }
+                step += 1;
+                window.scrollTo(0, Math.round(step * stride));
+            }
+
+            function finish() {
+                const sorted = costs.slice().sort((a, b) => a - b);
+                const pick = q => sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+                const result = {
+                    engine: engine,
+                    headings: document.querySelectorAll('h2, h3').length,
+                    frames: costs.length,
+                    mean: costs.reduce((a, b) => a + b, 0) / costs.length,
+                    median: pick(0.5),
+                    p95: pick(0.95),
+                    max: sorted[sorted.length - 1]
+                };
+                window.benchmarkResult = result;
+                document.getElementById('benchmarkResult').textContent =
+                    `${engine}: ${result.headings} 个标题，${result.frames} 帧\\n` +
+                    `平均 ${result.mean.toFixed(2)}ms  中位 ${result.median.toFixed(2)}ms  ` +
+                    `P95 ${result.p95.toFixed(2)}ms  最大 ${result.max.toFixed(2)}ms`;
+            }
+
+            window.addEventListener('load', function() {
+                setTimeout(() => {
+                    const maxScroll = document.documentElement.scrollHeight - document.documentElement.clientHeight;
+                    // 每帧至少滚动 1px，保证每一步都会触发 scroll 事件
+                    steps = Math.max(1, Math.min(steps, Math.floor(maxScroll)));
+                    stride = maxScroll / steps;
+                    window.scrollTo(0, 0);
+                    nextStep();
+                }, 300);
+            });
+        })();
+    </script>
+"""
+
+def synthetic_markdown(sections=500):
+    """生成包含 sections 个章节的合成文档"""
+    parts = ["# 滚动性能基准文档\n\n"]
+    for i in range(1, sections + 1):
+        parts.append(f"## 第{i}章 合成章节\n\n")
+        parts.append(f"这是第{i}章的正文，用于测量长文档在滚动时的每帧开销。" * 6 + "\n\n")
+        parts.append(f"### {i}.1 小节\n\n")
+        parts.append("".join(f"- 列表项 {j}：**要点** 与说明文字\n" for j in range(1, 5)) + "\n")
+        if i % 10 == 0:
+            parts.append("| 项目 | 数值 | 备注 |\n|------|------|------|\n")
+            parts.append("".join(f"| 条目{j} | {i * j} | 说明 |\n" for j in range(1, 6)) + "\n")
+    return ''.join(parts)
+
+def build_benchmark_page(html_file, sections=500, steps=600, lazy=False):
+    """生成基准页面"""
+    theme_config = importlib.import_module('通用HTML生成器').THEMES['cyan']
+    html_document = build_interactive_html(synthetic_markdown(sections), 'universal-cyan.html', lazy=lazy,
+                                           title=f"滚动性能基准 - {sections} 个章节", **theme_config)
+    script = BENCHMARK_SCRIPT.replace('__STEPS__', str(int(steps)))
+    html_document = html_document.replace('</body>', script + '</body>', 1)
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(html_document)
+
+def run_headless(html_file, timeout=120):
+    """用 Playwright 的无头 Chromium 运行两种实现，返回结果列表；未安装时返回 None"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return None
+
+    results = []
+    url = Path(html_file).resolve().as_uri()
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for engine in ENGINES:
+            page = browser.new_page(viewport={'width': 1280, 'height': 800})
+            page.goto(f"{url}?engine={engine}")
+            page.wait_for_function("window.benchmarkResult", timeout=timeout * 1000)
+            results.append(page.evaluate("window.benchmarkResult"))
+            page.close()
+        browser.close()
+    return results
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="测量交互式页面滚动时的每帧开销")
+    parser.add_argument('-n', '--sections', type=int, default=500, help="合成文档的章节数（默认：500）")
+    parser.add_argument('--steps', type=int, default=600, help="从顶部滚到底部的帧数（默认：600）")
+    parser.add_argument('-o', '--output', default=os.path.join(tempfile.gettempdir(), 'scroll_benchmark.html'),
+                        help="基准页面输出路径")
+    parser.add_argument('--lazy', action='store_true', help="用延迟渲染模式生成页面")
+    args = parser.parse_args()
+
+    build_benchmark_page(args.output, args.sections, args.steps, args.lazy)
+    print(f"✅ 基准页面已生成：{args.output}（{args.sections} 个章节）")
+
+    results = run_headless(args.output)
+    if results is None:
+        print("💡 未安装 Playwright，请用浏览器分别打开：")
+        for engine in ENGINES:
+            print(f"   {Path(args.output).resolve().as_uri()}?engine={engine}")
+        return
+
+    print("-" * 60)
+    print(f"{'实现':<10}{'帧数':>6}{'平均':>10}{'中位':>10}{'P95':>10}{'最大':>10}")
+    for result in results:
+        print(f"{result['engine']:<10}{result['frames']:>6}{result['mean']:>9.2f}ms"
+              f"{result['median']:>8.2f}ms{result['p95']:>8.2f}ms{result['max']:>8.2f}ms")
+
+if __name__ == "__main__":
+    main()
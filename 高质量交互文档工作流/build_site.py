@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""多文档静态站点构建
+
+把仓库中的全部Markdown（01-研究分析、06-待整理文档、写作素材库……）一次生成为交互式文档站点，
+代替手工维护的 INDEX.md：
+- 每篇文档通过 create_universal_interactive_html 以站点模式生成，多进程并行，共用 assets/ 中的样式和脚本
+- 每个页面侧边栏顶部有跨文档导航：站点首页、所在目录、同目录的上一篇和下一篇
+- 站点首页 index.html 按目录列出全部文档，页面搜索使用合并后的全站索引，结果直接跳到对应文档的章节
+- 增量构建：输出目录中的构建清单记录每个页面的构建键（源文件内容、模板和生成脚本、导航、主题），
+  没有变化的页面直接跳过；源文件删除后对应的页面一并删除
+
+使用方法：
+    python build_site.py                           # 构建整个仓库，输出到 仓库/_site
+    python build_site.py ../01-研究分析 -o /tmp/site -j 8
+    python build_site.py --theme moon --force       # 换主题，全部重新生成
+    python build_site.py --minify --compress        # 压缩页面和共用资源，并写出 .gz/.br 预压缩文件
+    python build_site.py --lazy                     # 长文档延迟渲染开头以外的章节
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from urllib.parse import quote
+
+from interactive_page import MARKDOWN_EXTRAS, build_interactive_page
+from markdown_engines import engine_label
+from offline_assets import ASSET_DIR_NAME, OFFLINE_MODES
+from output_stage import COMPRESSED_SUFFIXES, compress_file, size_report, write_output
+from search_index import merge_search_indexes
+from site_assets import write_shared_assets
+from template_engine import TEMPLATE_DIR
+from 通用HTML生成器 import THEMES, create_universal_interactive_html
+
+# 工作流目录（本脚本所在目录）和仓库根目录（上一级）
+WORKFLOW_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(WORKFLOW_DIR)
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, '_site')
+
+HOME_PAGE = 'index.html'
+SITE_TITLE = '文档站点'
+
+# 构建清单，以及每个页面的搜索索引缓存（合并全站索引时，跳过的页面不需要重新解析）
+MANIFEST_NAME = '.site_manifest.json'
+INDEX_CACHE_DIR = '.site_index'
+
+# 构建逻辑变化时递增，使旧的构建键全部失效
+BUILD_VERSION = 1
+
+SKIP_DIRS = {'__pycache__', 'node_modules'}
+
+# site_assets.write_asset 生成的文件名（及其预压缩文件），清理 assets/ 时只删除这类文件
+HASHED_ASSET_RE = re.compile(r'^([\w-]+\.[0-9a-f]{10}\.(?:css|js))(?:\.gz|\.br)?$')
+
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+
+# 文档之间的相对链接（例如 INDEX.md 中的 [标题](01-研究分析/xx.md)），站点中改为指向对应页面
+MD_LINK_RE = re.compile(r'href="([^"#:?]+)\.md(#[^"]*)?"', re.I)
+
+def discover_markdown(source_dir, exclude=()):
+    """递归查找Markdown文件，返回相对 source_dir 的路径（'/' 分隔），按目录顺序排列
+
+    跳过隐藏目录、__pycache__ 等，以及 exclude 中的目录（例如位于源目录内的输出目录）。
+    """
+    exclude = {os.path.abspath(path) for path in exclude}
+    found = []
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = sorted(name for name in dirnames
+                             if not name.startswith('.') and name not in SKIP_DIRS
+                             and os.path.abspath(os.path.join(dirpath, name)) not in exclude)
+        rel_dir = os.path.relpath(dirpath, source_dir)
+        for filename in sorted(filenames):
+            if filename.lower().endswith('.md'):
+                rel = filename if rel_dir == '.' else os.path.join(rel_dir, filename)
+                found.append(rel.replace(os.sep, '/'))
+    return found
+
+def output_name(rel_md):
+    """页面的相对路径：同目录同名 .html；与首页 index.html 重名（不区分大小写）时加后缀"""
+    rel_html = posixpath.splitext(rel_md)[0] + '.html'
+    if rel_html.lower() == HOME_PAGE:
+        rel_html = posixpath.splitext(rel_md)[0] + '_page.html'
+    return rel_html
+
+def document_title(markdown_content, rel_md):
+    """文档标题：代码块以外的第一个一级标题，没有时使用文件名"""
+    in_fence = False
+    for line in markdown_content.splitlines():
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith('# '):
+            title = line[2:].strip().strip('#').strip()
+            if title:
+                return title
+    return posixpath.splitext(posixpath.basename(rel_md))[0]
+
+def code_digest(exclude=()):
+    """工作流目录中全部脚本的内容哈希，生成逻辑（转换、目录、搜索索引、Markdown引擎等）改动都会让页面重新生成
+
+    Args:
+        exclude: 不计入的脚本文件名
+    """
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(WORKFLOW_DIR)):
+        if name.endswith('.py') and name not in exclude:
+            digest.update(name.encode('utf-8') + b'\0')
+            with open(os.path.join(WORKFLOW_DIR, name), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def template_digest(template_dir=TEMPLATE_DIR):
+    """模板目录的内容哈希，任何模板改动都会让全部页面重新生成"""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(template_dir)):
+        path = os.path.join(template_dir, name)
+        if os.path.isfile(path):
+            digest.update(name.encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def page_url(from_page, to_page):
+    """从一个页面到另一个页面的相对链接（均为站点内 '/' 分隔的相对路径）"""
+    rel = posixpath.relpath(to_page, posixpath.dirname(from_page) or '.')
+    return quote(rel, safe='/#')
+
+def site_nav_html(doc, prev_doc, next_doc):
+    """页面侧边栏顶部的跨文档导航"""
+    lines = ['        <div class="site-nav">',
+             f'            <a class="site-nav-link site-nav-home" href="{page_url(doc["output"], HOME_PAGE)}">'
+             f'<i class="fas fa-home"></i> {SITE_TITLE}</a>']
+    folder = posixpath.dirname(doc['source'])
+    if folder:
+        lines.append(f'            <div class="site-nav-path">{escape(folder.replace("/", " / "))}</div>')
+    for other, label in ((prev_doc, '上一篇'), (next_doc, '下一篇')):
+        if other:
+            title = escape(other['title'])
+            lines.append(f'            <a class="site-nav-link" href="{page_url(doc["output"], other["output"])}" '
+                         f'title="{title}">{label}：{title}</a>')
+    lines.append('        </div>\n')
+    return '\n'.join(lines)
+
+def _markdown_text(text):
+    """把文件名、标题作为Markdown普通文本输出，转义其中的标记字符"""
+    text = re.sub(r'([\\`*_{}\[\]()#+!])', r'\\\1', text)
+    return text.replace('<', '&lt;').replace('~', '&#126;')
+
+def home_markdown(docs):
+    """站点首页：按目录列出全部文档，顶层目录为二级标题、子目录为三级标题"""
+    lines = [f"# 📚 {SITE_TITLE}", "", f"共 {len(docs)} 篇文档，使用右上角搜索可以检索全部文档的内容。", ""]
+    current_top = current_sub = None
+    for doc in docs:
+        folder = posixpath.dirname(doc['source'])
+        top, _, sub = folder.partition('/')
+        if top != current_top:
+            lines += ["", f"## {_markdown_text(top or '根目录')}", ""]
+            current_top, current_sub = top, ''
+        if sub != current_sub:
+            lines += ["", f"### {_markdown_text(sub)}", ""]
+            current_sub = sub
+        lines.append(f"- [{_markdown_text(doc['title'])}]({page_url(HOME_PAGE, doc['output'])})")
+    return '\n'.join(lines) + '\n'
+
+def load_manifest(output_dir):
+    """读取构建清单，不存在或损坏时返回空清单"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'version': BUILD_VERSION, 'pages': {}}
+    manifest.setdefault('pages', {})
+    return manifest
+
+def save_manifest(output_dir, manifest):
+    """原子地写回构建清单"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _index_cache_path(output_dir, rel_md):
+    name = hashlib.sha256(rel_md.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(output_dir, INDEX_CACHE_DIR, f"{name}.json")
+
+def rewrite_markdown_links(html_file):
+    """把页面中指向其他 .md 文件的相对链接改为 .html"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html_document = f.read()
+    rewritten = MD_LINK_RE.sub(
+        lambda m: f'href="{output_name(m.group(1) + ".md")}{m.group(2) or ""}"', html_document)
+    if rewritten != html_document:
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(rewritten)
+
+def build_page(md_file, html_file, index_file, theme, asset_dir, site_nav, title, offline=None,
+               minify=False, compress=False, lazy=False):
+    """生成一个页面并缓存它的搜索索引，返回 (耗时, 输出大小报告, 错误信息)；在子进程中运行"""
+    try:
+        start = time.perf_counter()
+        os.makedirs(os.path.dirname(html_file), exist_ok=True)
+        search_index, sizes = create_universal_interactive_html(md_file, html_file, theme, offline, site=True,
+                                                                asset_dir=asset_dir, site_nav=site_nav,
+                                                                title=escape(title), quiet=True, minify=minify,
+                                                                lazy=lazy)
+        # 链接改写之后再预压缩，.gz/.br 与最终的页面一致
+        rewrite_markdown_links(html_file)
+        sizes['output'] = os.path.getsize(html_file)
+        sizes.update(compress_file(html_file, compress))
+        os.makedirs(os.path.dirname(index_file), exist_ok=True)
+        with open(index_file, 'w', encoding='utf-8') as f:
+            json.dump(search_index, f, ensure_ascii=False, separators=(',', ':'))
+        return time.perf_counter() - start, sizes, None
+    except Exception as e:
+        return 0.0, None, str(e)
+
+def build_home_page(docs, output_dir, theme, offline=None, minify=False, compress=False):
+    """生成站点首页，搜索索引为所有页面索引的合并，返回 (全站索引的章节数, 输出大小报告)"""
+    documents = []
+    for doc in docs:
+        try:
+            with open(_index_cache_path(output_dir, doc['source']), 'r', encoding='utf-8') as f:
+                documents.append((page_url(HOME_PAGE, doc['output']), doc['title'], json.load(f)))
+        except (OSError, ValueError):
+            continue  # 生成失败的页面不进入全站索引
+    search_index = merge_search_indexes(documents)
+
+    theme_config = THEMES[theme]
+    html_document, _ = build_interactive_page(
+        home_markdown(docs), f'universal-{theme}.html', offline, site=True,
+        asset_dir=os.path.join(output_dir, ASSET_DIR_NAME), asset_url=ASSET_DIR_NAME,
+        search_index=search_index, minify=minify, compress=compress, site_nav='', title=SITE_TITLE,
+        **theme_config)
+    sizes = write_output(os.path.join(output_dir, HOME_PAGE), html_document, minify, compress)
+    return len(search_index['sections']), sizes
+
+def remove_stale_outputs(output_dir, manifest, current):
+    """删除源文件已不存在的页面及其索引缓存"""
+    removed = 0
+    for rel_md in sorted(set(manifest['pages']) - set(current)):
+        entry = manifest['pages'].pop(rel_md)
+        html_file = os.path.join(output_dir, entry['output'])
+        for path in (html_file, *(html_file + suffix for suffix in COMPRESSED_SUFFIXES),
+                     _index_cache_path(output_dir, rel_md)):
+            if os.path.exists(path):
+                os.remove(path)
+        removed += 1
+    return removed
+
+def prune_assets(asset_dir, keep):
+    """删除 assets/ 中不再被引用的旧版本样式表和脚本及其预压缩文件（字体等其他文件不动）"""
+    if not os.path.isdir(asset_dir):
+        return
+    for filename in os.listdir(asset_dir):
+        match = HASHED_ASSET_RE.match(filename)
+        if match and match.group(1) not in keep:
+            os.remove(os.path.join(asset_dir, filename))
+
+def build_site(source_dir=REPO_ROOT, output_dir=DEFAULT_OUTPUT_DIR, theme='cyan', jobs=0,
+               force=False, offline=None, minify=False, compress=False, lazy=False):
+    """构建文档站点
+
+    Args:
+        source_dir (str): 查找Markdown的根目录
+        output_dir (str): 站点输出目录
+        theme (str): 页面主题，见 通用HTML生成器.THEMES
+        jobs (int): 并行进程数，0 表示使用全部CPU核心
+        force (bool): 忽略构建清单，全部重新生成
+        offline (str): 离线打包字体和图标（见 offline_assets.py），站点中建议使用 'files'
+        minify (bool): 压缩页面和共用的样式、脚本（见 output_stage.py）
+        compress (bool): 为页面和共用的样式、脚本写出 .gz/.br 预压缩文件
+        lazy (bool): 页面开头两屏以外的章节滚动到附近时才渲染（见 lazy_sections.py）
+    """
+    source_dir = os.path.abspath(source_dir)
+    output_dir = os.path.abspath(output_dir)
+    asset_dir = os.path.join(output_dir, ASSET_DIR_NAME)
+    if theme not in THEMES:
+        theme = 'cyan'
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    docs = []
+    for rel_md in discover_markdown(source_dir, exclude=[output_dir]):
+        with open(os.path.join(source_dir, rel_md), 'rb') as f:
+            data = f.read()
+        docs.append({'source': rel_md, 'output': output_name(rel_md),
+                     'title': document_title(data.decode('utf-8', errors='replace'), rel_md),
+                     'sha256': hashlib.sha256(data).hexdigest()})
+
+    print(f"找到 {len(docs)} 个Markdown文件，主题：{THEMES[theme]['theme_name']}")
+    if jobs > 1:
+        print(f"并行进程数: {jobs}")
+    print("-" * 50)
+
+    # 共用的样式和脚本先写一次，文件名同时用于清理旧版本
+    keep = {posixpath.basename(href) for href in
+            write_shared_assets(f'universal-{theme}.html', asset_dir, ASSET_DIR_NAME, minify, compress,
+                                **THEMES[theme]).values()}
+
+    manifest = {'version': BUILD_VERSION, 'pages': {}} if force else load_manifest(output_dir)
+    if manifest.get('version') != BUILD_VERSION:
+        manifest = {'version': BUILD_VERSION, 'pages': {}}
+    templates = template_digest()
+    code = code_digest()
+    engine = engine_label(extras=MARKDOWN_EXTRAS)
+
+    # 上一篇/下一篇只在同一目录内
+    by_folder = {}
+    for doc in docs:
+        by_folder.setdefault(posixpath.dirname(doc['source']), []).append(doc)
+    tasks = []
+    for siblings in by_folder.values():
+        for i, doc in enumerate(siblings):
+            site_nav = site_nav_html(doc, siblings[i - 1] if i > 0 else None,
+                                     siblings[i + 1] if i + 1 < len(siblings) else None)
+            doc['key'] = hashlib.sha256(json.dumps(
+                [BUILD_VERSION, doc['sha256'], templates, code, engine, theme, offline, minify, compress, lazy,
+                 site_nav, doc['title']],
+                ensure_ascii=False).encode('utf-8')).hexdigest()
+            entry = manifest['pages'].get(doc['source'])
+            if (entry and entry['key'] == doc['key']
+                    and os.path.exists(os.path.join(output_dir, doc['output']))
+                    and os.path.exists(_index_cache_path(output_dir, doc['source']))):
+                continue
+            tasks.append((doc, site_nav))
+
+    removed = remove_stale_outputs(output_dir, manifest, [doc['source'] for doc in docs])
+    args = [(os.path.join(source_dir, doc['source']), os.path.join(output_dir, doc['output']),
+             _index_cache_path(output_dir, doc['source']), theme, asset_dir, site_nav, doc['title'], offline,
+             minify, compress, lazy)
+            for doc, site_nav in tasks]
+
+    built = failed = 0
+    total = {}
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(args) > 1 else None
+    try:
+        results = executor.map(build_page, *zip(*args)) if executor else (build_page(*a) for a in args)
+        for (doc, _), (elapsed, sizes, error) in zip(tasks, results):
+            if error:
+                failed += 1
+                manifest['pages'].pop(doc['source'], None)
+                print(f"❌ 生成失败: {doc['source']}")
+                print(f"   错误: {error}")
+                continue
+            built += 1
+            manifest['pages'][doc['source']] = {'output': doc['output'], 'key': doc['key']}
+            if minify or compress:
+                for name, size in sizes.items():
+                    total[name] = total.get(name, 0) + size
+                print(f"✅ {doc['output']}  {elapsed:.2f}s  {size_report(sizes)}")
+            else:
+                print(f"✅ {doc['output']}  {elapsed:.2f}s")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        save_manifest(output_dir, manifest)
+
+    sections, home_sizes = build_home_page(docs, output_dir, theme, offline, minify, compress)
+    prune_assets(asset_dir, keep)
+
+    print("-" * 50)
+    print(f"构建完成！生成 {built} 个页面，跳过未变化的 {len(docs) - built - failed} 个，"
+          f"失败 {failed} 个，删除 {removed} 个，总耗时 {time.perf_counter() - start:.2f} 秒")
+    print(f"🏠 站点首页：{os.path.join(output_dir, HOME_PAGE)}（全站索引 {sections} 个章节）")
+    if minify or compress:
+        print(f"   📉 首页大小：{size_report(home_sizes)}")
+        if total:
+            print(f"   📉 本次生成的页面合计：{size_report(total)}")
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="把仓库中的全部Markdown构建为交互式文档站点")
+    parser.add_argument('source', nargs='?', default=REPO_ROOT, help="查找Markdown的根目录（默认：仓库根目录）")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help="站点输出目录（默认：仓库/_site）")
+    parser.add_argument('--theme', default='cyan', choices=sorted(THEMES), help="页面主题（默认：cyan）")
+    parser.add_argument('-j', '--jobs', type=int, default=0, help="并行进程数，0 表示使用全部CPU核心（默认）")
+    parser.add_argument('--force', action='store_true', help="忽略构建清单，全部重新生成")
+    parser.add_argument('--offline', nargs='?', const='files', choices=OFFLINE_MODES,
+                        help="打包离线字体和图标，站点中默认写入 assets/ 共用")
+    parser.add_argument('--minify', action='store_true', help="压缩页面和共用的样式、脚本（<pre> 和代码块原样保留）")
+    parser.add_argument('--compress', action='store_true', help="同时写出 .gz/.br 预压缩文件，供静态服务器直接发送")
+    parser.add_argument('--lazy', action='store_true', help="延迟渲染：页面开头两屏以外的章节滚动到附近时才插入")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"错误：目录 {args.source} 不存在")
+        return
+
+    build_site(args.source, args.output, args.theme, args.jobs, args.force, args.offline,
+               args.minify, args.compress, args.lazy)
+
+if __name__ == "__main__":
+    main()
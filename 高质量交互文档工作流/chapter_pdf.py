@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""按章节增量渲染PDF
+
+长篇报告只改了一节，整篇重新排版也要几十秒。这里把Markdown在二级标题处切成章节，
+每章单独渲染为PDF片段并按内容哈希缓存，最后按顺序合并：
+- 缓存键 = 章节内容 + 完整样式表（含本地字体）+ 标题 + 转换脚本本身，任何一项变化都会重新渲染
+- 合并时保留各片段的书签，书签指向合并后的页
+
+合并依赖 pypdf（pip install pypdf），未安装时退回整篇渲染。
+注意：每章从新的一页开始；跨章节的文内锚点链接在合并后不可跳转。
+"""
+
+import hashlib
+import os
+import re
+
+from pdf_renderer import render_pdf, with_local_fonts
+
+# 章节片段缓存目录，可通过环境变量 ALLIN_PDF_CACHE 覆盖
+CHAPTER_CACHE_DIR = os.environ.get('ALLIN_PDF_CACHE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.pdf_cache')
+
+FENCE_RE = re.compile(r'^(`{3,}|~{3,})')
+
+def _has_body(lines):
+    """已收集的行里是否有标题以外的正文"""
+    return any(line.strip() and not line.lstrip().startswith('#') for line in lines)
+
+def split_chapters(markdown_content):
+    """在二级标题处把Markdown切成章节，代码块内的 ## 不算标题
+
+    只有标题没有正文的部分（例如文档开头的 # 标题 + ## 副标题）与后面的内容放在同一章，
+    保证 h1 + h2 这类相邻选择器的样式不被拆开。
+    """
+    chapters = []
+    current = []
+    fence = None
+    for line in markdown_content.splitlines(keepends=True):
+        stripped = line.lstrip()
+        match = FENCE_RE.match(stripped)
+        if fence:
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence):
+                fence = None
+        elif match:
+            fence = match.group(1)
+        elif line.startswith('## ') and _has_body(current):
+            chapters.append(''.join(current))
+            current = []
+        current.append(line)
+    if current:
+        chapters.append(''.join(current))
+    return chapters
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def chapter_key(chapter, css_text, title, base_url, code_digest):
+    """章节片段的缓存键"""
+    digest = hashlib.sha256()
+    for part in (chapter, css_text, title, base_url or '', code_digest):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:24]
+
+def render_chapters(markdown_content, pdf_file, build_html_document, css_text, title,
+                    base_url=None, cache_dir=CHAPTER_CACHE_DIR, use_server=True):
+    """按章节增量渲染并合并为一个PDF
+
+    Args:
+        build_html_document: 转换模块的 build_html_document(markdown_content, title)
+        css_text (str): 转换模块的 PDF_STYLESHEET
+
+    Returns:
+        tuple: (重新渲染的章节数, 命中缓存的章节数)；未安装 pypdf 时整篇渲染，返回 (1, 0)
+    """
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        print("💡 未安装 pypdf，无法按章节合并，整篇渲染（pip install pypdf）")
+        render_pdf(build_html_document(markdown_content, title), css_text, pdf_file,
+                   base_url=base_url, use_server=use_server)
+        return 1, 0
+
+    css_text = with_local_fonts(css_text)
+    pdf_file = os.path.abspath(pdf_file)
+    if base_url is not None:
+        base_url = os.path.abspath(base_url)
+    # 转换脚本改动（例如Markdown扩展或占位符处理）也要让缓存失效
+    code_digest = _file_digest(build_html_document.__code__.co_filename)
+
+    # 每个输出文件一个缓存子目录，合并后清理不再使用的旧片段
+    doc_dir = os.path.join(cache_dir, hashlib.sha256(pdf_file.encode('utf-8')).hexdigest()[:16])
+    os.makedirs(doc_dir, exist_ok=True)
+
+    rendered = cached = 0
+    fragments = []
+    for chapter in split_chapters(markdown_content):
+        fragment = os.path.join(doc_dir, chapter_key(chapter, css_text, title, base_url, code_digest) + '.pdf')
+        if os.path.exists(fragment):
+            cached += 1
+        else:
+            tmp_fragment = fragment + '.tmp'
+            render_pdf(build_html_document(chapter, title), css_text, tmp_fragment,
+                       base_url=base_url, use_server=use_server, local_fonts=False)
+            os.replace(tmp_fragment, fragment)
+            rendered += 1
+        fragments.append(fragment)
+
+    writer = PdfWriter()
+    for fragment in fragments:
+        # import_outline 保留片段内的书签，页码引用自动平移到合并后的位置
+        writer.append(fragment, import_outline=True)
+    writer.add_metadata({'/Title': title})
+    tmp_file = pdf_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        writer.write(f)
+    os.replace(tmp_file, pdf_file)
+
+    used = {os.path.basename(fragment) for fragment in fragments}
+    for name in os.listdir(doc_dir):
+        if name not in used:
+            os.remove(os.path.join(doc_dir, name))
+
+    return rendered, cached
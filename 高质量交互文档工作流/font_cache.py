@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""本地字体缓存
+
+PDF模板原先用 @import 从 Google Fonts 加载 Noto Sans SC，每次渲染都要联网，
+离线环境下会卡住或超时。这里把字体文件下载一次（或从本地拷贝）存到 fonts/ 目录，
+渲染时改用指向本地文件的 @font-face，渲染过程不再有任何网络请求。
+
+交互式HTML的离线打包（offline_assets.py）另外需要 Inter 字体和 Font Awesome 图标，
+存放在 fonts/web/ 目录，与PDF使用的字体分开，不会加进PDF的 @font-face。
+
+使用方法：
+    python font_cache.py fetch                 # 联网下载一次 Noto Sans SC（300/400/500/700）
+    python font_cache.py fetch --web           # 同时下载 Inter 和 Font Awesome（HTML --offline 模式使用）
+    python font_cache.py add 字体文件...        # 从本地文件导入，例如 NotoSansSC-Bold.otf
+    python font_cache.py list                  # 查看已缓存的字体
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import urllib.request
+from pathlib import Path
+
+# 字体缓存目录，可通过环境变量 ALLIN_FONT_DIR 覆盖
+FONT_CACHE_DIR = os.environ.get('ALLIN_FONT_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'fonts')
+
+FONT_FAMILY = 'Noto Sans SC'
+FONT_WEIGHTS = (300, 400, 500, 700)
+
+# 交互式HTML页面使用的网页字体（Noto Sans SC 与PDF共用上面的缓存）和图标
+WEB_FONT_DIR = os.path.join(FONT_CACHE_DIR, 'web')
+WEB_FONT_WEIGHTS = {'Inter': (300, 400, 500, 600, 700)}
+FONT_AWESOME_VERSION = '6.4.0'
+FONT_AWESOME_URL = f'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/{FONT_AWESOME_VERSION}/'
+FONT_AWESOME_CSS = f'fontawesome-{FONT_AWESOME_VERSION}.min.css'
+FONT_AWESOME_FONTS = ('fa-solid-900', 'fa-regular-400', 'fa-brands-400')
+
+# 缓存清单，记录每个字体文件的字族和字重
+INDEX_NAME = 'fonts.json'
+
+# 从文件名推断字重
+WEIGHT_NAMES = {
+    'thin': 100, 'extralight': 200, 'light': 300, 'regular': 400, 'normal': 400,
+    'medium': 500, 'semibold': 600, 'bold': 700, 'extrabold': 800, 'black': 900,
+}
+
+FONT_FORMATS = {'.ttf': 'truetype', '.otf': 'opentype', '.woff': 'woff', '.woff2': 'woff2'}
+
+def load_index(font_dir=FONT_CACHE_DIR):
+    """读取缓存清单，返回 [{'family', 'weight', 'file'}]"""
+    try:
+        with open(os.path.join(font_dir, INDEX_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def save_index(fonts, font_dir=FONT_CACHE_DIR):
+    """写回缓存清单"""
+    os.makedirs(font_dir, exist_ok=True)
+    fonts = sorted(fonts, key=lambda font: (font['family'], font['weight']))
+    with open(os.path.join(font_dir, INDEX_NAME), 'w', encoding='utf-8') as f:
+        json.dump(fonts, f, ensure_ascii=False, indent=2)
+
+def _register(fonts, family, weight, filename):
+    """登记一个字体文件，同字族同字重的旧记录被替换"""
+    fonts[:] = [font for font in fonts
+                if (font['family'], font['weight']) != (family, weight)]
+    fonts.append({'family': family, 'weight': weight, 'file': filename})
+
+def _download(url, path, timeout=60):
+    """下载到临时文件后再改名，中断时不会留下不完整的文件"""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response, f)
+        os.replace(tmp_path, path)
+
+def fetch_fonts(font_dir=FONT_CACHE_DIR, timeout=60, family=FONT_FAMILY, weights=FONT_WEIGHTS):
+    """从 Google Fonts 下载一次指定字族的各字重，已存在的文件不会重复下载
+
+    不带浏览器 User-Agent 请求 CSS 时，Google Fonts 返回每个字重一个完整的 TrueType 文件。
+    """
+    css_url = (f"https://fonts.googleapis.com/css2?family={family.replace(' ', '+')}:wght@"
+               + ';'.join(str(w) for w in weights))
+    with urllib.request.urlopen(css_url, timeout=timeout) as response:
+        css = response.read().decode('utf-8')
+
+    fonts = load_index(font_dir)
+    os.makedirs(font_dir, exist_ok=True)
+    for block in re.findall(r'@font-face\s*\{(.*?)\}', css, flags=re.S):
+        weight = re.search(r'font-weight:\s*(\d+)', block)
+        url = re.search(r'url\((https://[^)]+)\)', block)
+        if not weight or not url:
+            continue
+        weight = int(weight.group(1))
+        ext = os.path.splitext(url.group(1))[1] or '.ttf'
+        filename = f"{family.replace(' ', '')}-{weight}{ext}"
+        path = os.path.join(font_dir, filename)
+        if not os.path.exists(path):
+            print(f"⬇️  下载 {family} {weight} ...")
+            _download(url.group(1), path, timeout)
+        _register(fonts, family, weight, filename)
+
+    save_index(fonts, font_dir)
+    return fonts
+
+def fetch_icons(font_dir=WEB_FONT_DIR, timeout=60):
+    """从 cdnjs 下载一次 Font Awesome 的样式表和 TrueType 字体，已存在的文件不会重复下载"""
+    os.makedirs(font_dir, exist_ok=True)
+    downloads = [(FONT_AWESOME_URL + 'css/all.min.css', FONT_AWESOME_CSS)]
+    downloads += [(f"{FONT_AWESOME_URL}webfonts/{name}.ttf", f"{name}.ttf") for name in FONT_AWESOME_FONTS]
+    for url, filename in downloads:
+        path = os.path.join(font_dir, filename)
+        if not os.path.exists(path):
+            print(f"⬇️  下载 Font Awesome {FONT_AWESOME_VERSION}：{filename} ...")
+            _download(url, path, timeout)
+    return [filename for _, filename in downloads]
+
+def guess_weight(filename):
+    """从文件名推断字重，例如 NotoSansSC-Medium.otf → 500"""
+    stem = os.path.splitext(os.path.basename(filename))[0].lower().replace('-', '').replace('_', '')
+    for name, weight in sorted(WEIGHT_NAMES.items(), key=lambda item: -len(item[0])):
+        if stem.endswith(name):
+            return weight
+    match = re.search(r'(\d{3})$', stem)
+    return int(match.group(1)) if match else 400
+
+def add_fonts(paths, family=FONT_FAMILY, font_dir=FONT_CACHE_DIR):
+    """把本地字体文件导入缓存（用于离线机器，或直接使用已有的字体文件）"""
+    fonts = load_index(font_dir)
+    os.makedirs(font_dir, exist_ok=True)
+    for path in paths:
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in FONT_FORMATS:
+            print(f"跳过不支持的字体格式：{path}")
+            continue
+        weight = guess_weight(path)
+        filename = os.path.basename(path)
+        shutil.copyfile(path, os.path.join(font_dir, filename))
+        _register(fonts, family, weight, filename)
+        print(f"✅ 已导入 {family} {weight}：{filename}")
+    save_index(fonts, font_dir)
+    return fonts
+
+def font_face_css(font_dir=FONT_CACHE_DIR):
+    """生成指向本地字体文件的 @font-face 规则，没有缓存时返回空字符串
+
+    使用 file:// 绝对路径，不依赖样式表的 base_url。
+    """
+    rules = []
+    for font in load_index(font_dir):
+        path = Path(font_dir, font['file']).resolve()
+        if not path.exists():
+            continue
+        fmt = FONT_FORMATS.get(path.suffix.lower(), 'truetype')
+        rules.append(
+            "@font-face {\n"
+            f"    font-family: '{font['family']}';\n"
+            f"    font-weight: {font['weight']};\n"
+            "    font-style: normal;\n"
+            f"    src: url('{path.as_uri()}') format('{fmt}');\n"
+            "}\n"
+        )
+    return ''.join(rules)
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="管理PDF渲染使用的本地字体缓存")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    fetch_parser = subparsers.add_parser('fetch', help="联网下载一次 Noto Sans SC")
+    fetch_parser.add_argument('--web', action='store_true',
+                              help="同时下载交互式HTML离线模式使用的 Inter 字体和 Font Awesome 图标")
+    add_parser = subparsers.add_parser('add', help="从本地字体文件导入")
+    add_parser.add_argument('files', nargs='+', help="字体文件（.ttf/.otf/.woff/.woff2）")
+    add_parser.add_argument('--family', default=FONT_FAMILY, help=f"字族名（默认：{FONT_FAMILY}）")
+    add_parser.add_argument('--web', action='store_true', help="导入为交互式HTML使用的网页字体，例如 --family Inter")
+    subparsers.add_parser('list', help="查看已缓存的字体")
+    args = parser.parse_args()
+
+    if args.command == 'fetch':
+        try:
+            fonts = fetch_fonts()
+            if args.web:
+                for family, weights in WEB_FONT_WEIGHTS.items():
+                    fonts += fetch_fonts(WEB_FONT_DIR, family=family, weights=weights)
+                icons = fetch_icons()
+        except OSError as e:
+            print(f"❌ 下载失败：{e}")
+            print("   离线环境可以在其他机器下载后，用 add 命令导入字体文件")
+            sys.exit(1)
+        print(f"✅ 字体缓存完成：{FONT_CACHE_DIR}（{len(fonts)} 个字体文件）")
+        if args.web:
+            print(f"✅ 图标缓存完成：{WEB_FONT_DIR}（{len(icons)} 个文件）")
+    elif args.command == 'add':
+        add_fonts(args.files, args.family, WEB_FONT_DIR if args.web else FONT_CACHE_DIR)
+    else:
+        fonts = load_index()
+        if not fonts:
+            print("字体缓存为空，运行 python font_cache.py fetch 下载")
+        for font in fonts + load_index(WEB_FONT_DIR):
+            print(f"{font['family']}  {font['weight']}  {font['file']}")
+        if os.path.exists(os.path.join(WEB_FONT_DIR, FONT_AWESOME_CSS)):
+            print(f"Font Awesome  {FONT_AWESOME_VERSION}  {FONT_AWESOME_CSS}")
+
+if __name__ == "__main__":
+    main()
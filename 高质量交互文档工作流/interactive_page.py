@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""交互式HTML生成器的公共流程
+
+convert_to_interactive_html.py、convert_livehouse_to_html.py 和 通用HTML生成器.py
+共用同一条路径：Markdown → HTML片段 → 套用 templates/ 下编译好的模板 → 写入文件
+（可选压缩和预压缩，见 output_stage.py）。
+"""
+
+import os
+
+from lazy_sections import lazy_sections_html
+from markdown_cache import parse_markdown
+from offline_assets import ASSET_DIR_NAME, bundle_web_assets
+from output_stage import write_output
+from page_toc import add_heading_ids, build_toc_html
+from search_index import build_search_index, extract_sections, search_index_json
+from site_assets import render_site_page, write_shared_assets
+from template_engine import render_template
+
+# 交互式HTML使用的Markdown扩展
+MARKDOWN_EXTRAS = [
+    'tables',
+    'fenced-code-blocks',
+    'header-ids',
+    'strike',
+    'task_list',
+    'break-on-newline',
+    'footnotes'
+]
+
+def build_interactive_page(markdown_content, template, offline=None, site=False, asset_dir=None,
+                           asset_url=ASSET_DIR_NAME, search_index=None, minify=False, compress=False,
+                           lazy=False, **context):
+    """Markdown内容套用模板，返回 (完整的交互式HTML文档, 页面搜索索引)
+
+    侧边栏目录（见 page_toc.py）和页面搜索使用的倒排索引（见 search_index.py）
+    都在这里生成，作为静态内容写入页面。
+
+    Args:
+        template (str): templates/ 下的文档模板，例如 'research.html'
+        offline (str): None 使用CDN字体和图标；'inline' 或 'files' 打包离线资源（见 offline_assets.py）
+        site (bool): 站点模式，共用的样式和脚本写入 asset_dir 并从页面引用（见 site_assets.py）
+        asset_dir (str): offline='files' 和站点模式下资源文件的输出目录
+        asset_url (str): 页面引用 asset_dir 使用的相对路径
+        search_index (dict): 用给定的索引代替本页内容建立的索引（站点首页传入全站索引）
+        minify, compress (bool): 站点模式下共用样式和脚本的压缩和预压缩；页面本身在写入时处理
+        lazy (bool): 开头两屏以外的章节放进 <template>，滚动到附近时才插入（见 lazy_sections.py）
+        **context: 模板变量，至少包括 title；站点模式下可以传入 site_nav（跨文档导航HTML）
+    """
+    # 同一份Markdown生成过的页面（包括另一种模板）直接取缓存的HTML片段和章节列表
+    html_content, sections = parse_markdown(markdown_content, MARKDOWN_EXTRAS)
+    if any(not section['id'] and section['level'] in ('H2', 'H3') for section in sections):
+        # 没有 id 的标题补上 heading-N，目录和搜索结果才能跳转过去
+        html_content = add_heading_ids(html_content)
+        sections = extract_sections(html_content)
+    if search_index is None:
+        search_index = build_search_index(html_content, sections)
+    context.update(content=lazy_sections_html(html_content) if lazy else html_content,
+                   toc=build_toc_html(sections),
+                   search_index=search_index_json(search_index))
+    html_document = render_template(template, web_assets=render_template('cdn_assets.html'), **context)
+    if offline:
+        # 字体子集需要页面的全部文字（包括脚本里的提示文字和图标类名），所以先生成一次完整的内联页面
+        context['web_assets'] = bundle_web_assets(html_document, offline, asset_dir, asset_url)
+        html_document = render_template(template, **context)
+    if site:
+        context.setdefault('web_assets', render_template('cdn_assets.html'))
+        context.setdefault('site_nav', '')
+        context.update(write_shared_assets(template, asset_dir, asset_url, minify, compress, **context))
+        html_document = render_site_page(template, **context)
+    return html_document, search_index
+
+def build_interactive_html(markdown_content, template, **kwargs):
+    """Markdown内容套用模板，返回完整的交互式HTML文档，参数见 build_interactive_page"""
+    return build_interactive_page(markdown_content, template, **kwargs)[0]
+
+def write_interactive_html(md_file, html_file, template, offline=None, site=False, asset_dir=None,
+                           minify=False, compress=False, **context):
+    """读取Markdown文件，生成交互式HTML并写入 html_file，返回 (页面的搜索索引, 输出大小报告)
+
+    资源文件（offline='files' 的字体、站点模式的样式和脚本）默认写到 html_file 同目录的 assets/ 下，
+    多个页面可以通过 asset_dir 指定同一个目录共用。
+    minify 压缩HTML和内嵌的CSS/JS，compress 同时写出 .gz/.br；大小报告见 output_stage.write_output。
+    其余关键字参数（lazy、模板变量）传给 build_interactive_page。
+    """
+    with open(md_file, 'r', encoding='utf-8') as f:
+        markdown_content = f.read()
+
+    html_dir = os.path.dirname(os.path.abspath(html_file))
+    asset_dir = os.path.abspath(asset_dir or os.path.join(html_dir, ASSET_DIR_NAME))
+    asset_url = os.path.relpath(asset_dir, html_dir).replace(os.sep, '/')
+    html_document, search_index = build_interactive_page(markdown_content, template, offline, site,
+                                                         asset_dir, asset_url, minify=minify, compress=compress,
+                                                         **context)
+    sizes = write_output(html_file, html_document, minify, compress)
+    return search_index, sizes
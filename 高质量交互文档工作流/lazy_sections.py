@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""长文档的章节延迟渲染
+
+几百个章节的方案文档整篇写在 #mainContent 里，浏览器要先排版完所有表格和列表页面才能操作。
+延迟渲染模式把 markdown2 的输出在顶层标题处切成若干块：开头大约两屏的内容照常输出，
+其余每块放进一个惰性的 <template>，页面滚动到附近时才由 interactive.js 插入：
+
+    <div class="lazy-section" data-anchors="标题id 脚注id ..."
+         style="content-visibility:auto;contain-intrinsic-size:auto 1800px">
+        <template>……这一块的HTML……</template>
+    </div>
+
+- 占位高度按文字量估算，滚动条和阅读进度大致准确；插入后 content-visibility:auto 让屏幕外的块跳过渲染
+- data-anchors 列出块内的全部 id，目录、搜索结果和 #锚点 跳转前先插入目标所在的块
+  （连同它前面的块，已插入的部分始终是文档开头连续的一段）
+- 目录和搜索索引仍由完整的HTML生成，不受影响；打印前插入全部内容
+"""
+
+import math
+import re
+
+# 开头直接输出的内容的估算高度（像素），大约两屏
+EAGER_HEIGHT = 1600
+
+# 每个延迟块的HTML大小下限：太小的章节合并，减少 <template> 数量
+CHUNK_CHARS = 12000
+
+# 可以在其前切分的顶层标题
+SPLIT_TAGS = ('h1', 'h2', 'h3')
+
+TAG_RE = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*?(/?)>')
+ID_RE = re.compile(r'\sid="([^"]+)"')
+VOID_TAGS = {'area', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+# 估算高度：正文宽度约容纳 45 个汉字（英文按半个字宽计），行高约 30px
+LINE_WIDTH = 45
+LINE_HEIGHT = 30
+BLOCK_SPLIT_RE = re.compile(r'<(?:/?(?:p|li|h[1-6]|tr|div|blockquote|table|ul|ol)\b[^>]*|br\s*/?)>')
+BLOCK_EXTRA = {'<h1': 50, '<h2': 45, '<h3': 30, '<table': 30, '<pre': 40, '<p>': 16, '<li': 4, '<hr': 40}
+CJK_RE = re.compile(r'[^\x00-\x7f]')
+STRIP_TAGS_RE = re.compile(r'<[^>]+>')
+
+def estimate_height(fragment):
+    """粗略估算一段HTML的显示高度（像素），只用于占位，插入后由浏览器记住实际高度"""
+    height = sum(fragment.count(tag) * extra for tag, extra in BLOCK_EXTRA.items())
+    for pre in re.findall(r'<pre\b.*?</pre>', fragment, re.S):
+        height += pre.count('\n') * 22
+    fragment = re.sub(r'<pre\b.*?</pre>', '', fragment, flags=re.S)
+    for block in BLOCK_SPLIT_RE.split(fragment):
+        text = STRIP_TAGS_RE.sub('', block).strip()
+        if text:
+            width = len(text) + len(CJK_RE.findall(text))
+            height += math.ceil(width / 2 / LINE_WIDTH) * LINE_HEIGHT
+    return height
+
+def split_points(html_content):
+    """顶层 h1-h3 标题开始的位置（紧跟在另一个标题后面的除外，避免拆开 h1 + h2 这样的相邻样式）
+
+    标签不配对（Markdown 中手写了不完整的HTML）时返回空列表，整篇照常输出。
+    """
+    points = []
+    depth = 0
+    last_closed = None
+    for match in TAG_RE.finditer(html_content):
+        closing, name, self_closing = match.group(1), match.group(2).lower(), match.group(3)
+        if name in VOID_TAGS or self_closing:
+            if depth == 0:
+                last_closed = name
+            continue
+        if closing:
+            depth -= 1
+            if depth < 0:
+                return []
+            if depth == 0:
+                last_closed = name
+        else:
+            if depth == 0 and name in SPLIT_TAGS and last_closed not in HEADING_TAGS and match.start() > 0:
+                points.append(match.start())
+            depth += 1
+    return points if depth == 0 else []
+
+def lazy_sections_html(html_content, eager_height=EAGER_HEIGHT, chunk_chars=CHUNK_CHARS):
+    """把 markdown2 的HTML片段改为延迟渲染的形式；内容不够长、无需延迟时原样返回"""
+    points = split_points(html_content)
+    if not points:
+        return html_content
+    bounds = [0] + points + [len(html_content)]
+    pieces = [html_content[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    # 开头的内容直接输出，至少一个章节
+    eager = 0
+    height = 0
+    while eager < len(pieces) and (eager == 0 or height < eager_height):
+        height += estimate_height(pieces[eager])
+        eager += 1
+    if eager == len(pieces):
+        return html_content
+
+    chunks = []
+    current = ''
+    for piece in pieces[eager:]:
+        current += piece
+        if len(current) >= chunk_chars:
+            chunks.append(current)
+            current = ''
+    if current:
+        chunks.append(current)
+
+    parts = [''.join(pieces[:eager])]
+    for chunk in chunks:
+        anchors = ' '.join(ID_RE.findall(chunk))
+        parts.append(f'<div class="lazy-section" data-anchors="{anchors}" '
+                     f'style="content-visibility:auto;contain-intrinsic-size:auto {estimate_height(chunk)}px">'
+                     f'<template>\n{chunk}</template></div>\n')
+    return ''.join(parts)
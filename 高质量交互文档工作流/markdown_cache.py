@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Markdown解析结果的磁盘缓存
+
+同一份 .md 通常要依次生成PDF、交互式HTML和通用HTML，每个转换脚本都从头解析一次Markdown。
+长文档解析（尤其是代码高亮）要零点几秒到几秒，是生成HTML最慢的一步。
+
+五个转换脚本都通过这里转换：缓存键是 Markdown 内容 + 扩展集合 + 引擎及版本（见 markdown_engines.py）的哈希，
+缓存值是HTML片段和章节列表（见 search_index.extract_sections，目录和搜索索引都由它生成）。
+命中时既不解析Markdown，也不再解析一遍HTML提取标题。
+
+缓存在进程内和磁盘（.markdown_cache/）各有一份；内容、扩展、引擎或其版本任一变化都自然得到新的键，
+旧条目不会被读到，可以随时清理：
+
+    python markdown_cache.py stats                # 查看缓存条目数和大小
+    python markdown_cache.py clear --days 30      # 删除 30 天没有用到的条目（不加 --days 全部删除）
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from markdown_engines import DEFAULT_ENGINE, engine_label, render_markdown
+from search_index import extract_sections
+
+# 磁盘缓存目录，可通过环境变量 ALLIN_MARKDOWN_CACHE 覆盖
+MARKDOWN_CACHE_DIR = os.environ.get('ALLIN_MARKDOWN_CACHE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.markdown_cache')
+
+# 缓存格式版本，章节提取等逻辑变化时递增，使旧的磁盘缓存失效
+CACHE_VERSION = 1
+
+def cache_key(markdown_content, extras, engine=None):
+    """缓存键：内容、扩展集合（与顺序无关）和实际使用的引擎及版本的哈希"""
+    options = json.dumps([CACHE_VERSION, engine_label(engine, extras),
+                          extras if isinstance(extras, dict) else sorted(extras)],
+                         ensure_ascii=False, sort_keys=True)
+    digest = hashlib.sha256(options.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(markdown_content.encode('utf-8'))
+    return digest.hexdigest()
+
+def _cache_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], f"{key[2:32]}.json")
+
+def _load_disk_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != CACHE_VERSION:
+        return None
+    try:
+        os.utime(path)  # 记录最近一次使用，clear --days 按它判断
+    except OSError:
+        pass
+    return entry
+
+def _save_disk_cache(path, entry):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # 缓存写不进去（例如只读目录）不影响转换
+
+# 进程内缓存：缓存键 → (HTML片段, 章节列表)
+_parsed = {}
+
+def parse_markdown(markdown_content, extras, cache_dir=MARKDOWN_CACHE_DIR, engine=None):
+    """Markdown转为HTML片段，返回 (HTML片段, 章节列表)
+
+    依次查找进程内缓存、磁盘缓存，都没有时才调用Markdown引擎（engine 为 None 时使用
+    markdown_engines.DEFAULT_ENGINE）。cache_dir 为 None 时只用进程内缓存。
+    返回的章节列表是副本，调用方可以修改。
+    """
+    key = cache_key(markdown_content, extras, engine)
+    cached = _parsed.get(key)
+    if cached is None:
+        path = _cache_path(key, cache_dir) if cache_dir else None
+        entry = _load_disk_cache(path) if path else None
+        if entry is None:
+            html_content = render_markdown(markdown_content, extras, engine)
+            entry = {'version': CACHE_VERSION, 'html': html_content,
+                     'sections': extract_sections(html_content)}
+            if path:
+                _save_disk_cache(path, entry)
+        cached = _parsed[key] = (entry['html'], entry['sections'])
+    html_content, sections = cached
+    return html_content, [dict(section) for section in sections]
+
+def markdown_to_html(markdown_content, extras, cache_dir=MARKDOWN_CACHE_DIR, engine=None):
+    """Markdown转为HTML片段（带缓存），参数见 parse_markdown"""
+    return parse_markdown(markdown_content, extras, cache_dir, engine)[0]
+
+def _cache_files(cache_dir):
+    for dirpath, _, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            if filename.endswith('.json'):
+                yield os.path.join(dirpath, filename)
+
+def clear_cache(cache_dir=MARKDOWN_CACHE_DIR, days=None):
+    """删除磁盘缓存条目，days 指定时只删除这么多天没有用到的，返回删除的条目数"""
+    cutoff = time.time() - days * 86400 if days is not None else None
+    removed = 0
+    for path in list(_cache_files(cache_dir)):
+        try:
+            if cutoff is None or os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            continue
+    _parsed.clear()
+    return removed
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="管理Markdown解析结果的磁盘缓存")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--cache-dir', default=MARKDOWN_CACHE_DIR, help="缓存目录")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats', parents=[common], help="查看缓存条目数和大小")
+    clear_parser = subparsers.add_parser('clear', parents=[common], help="删除缓存条目")
+    clear_parser.add_argument('--days', type=float, help="只删除这么多天没有用到的条目")
+    args = parser.parse_args()
+
+    if args.command == 'stats':
+        files = list(_cache_files(args.cache_dir))
+        size = sum(os.path.getsize(path) for path in files)
+        print(f"📦 {args.cache_dir}：{len(files)} 个条目，{size / 1024 / 1024:.2f} MB")
+        print(f"   当前引擎 {engine_label(DEFAULT_ENGINE)}，缓存格式版本 {CACHE_VERSION}")
+    elif args.command == 'clear':
+        removed = clear_cache(args.cache_dir, args.days)
+        print(f"✅ 已删除 {removed} 个缓存条目")
+
+if __name__ == "__main__":
+    main()
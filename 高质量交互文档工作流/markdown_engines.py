@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""可替换的Markdown引擎
+
+所有生成脚本都经由 markdown_cache.py 调用这里的 render_markdown()。可选的引擎：
+
+- markdown2：参考实现（纯Python），默认使用，页面效果以它为准
+- cmarkgfm：cmark-gfm 的C实现（pip install cmarkgfm），长文档快一个数量级以上
+
+用环境变量 ALLIN_MARKDOWN_ENGINE 选择：markdown2（默认）、cmarkgfm，或 auto（已安装的最快引擎）。
+选中的引擎没有安装或不支持所需的扩展时退回 markdown2。
+
+cmarkgfm 的输出经过整理，与 markdown2 保持一致的地方：
+- 标题 id 用 markdown2 的算法从标题的Markdown原文生成（重名加 -2、-3），页内目录、搜索和 #锚点 链接不变
+- 任务列表的复选框带 task-list-item-checkbox 类，表格对齐写成 style，删除线只认 ~~
+两者在CommonMark细节上仍有差别（例如列表前不空行的写法），仓库中约四成文档的显示因此不同。
+各扩展的一致性样例见 tests/test_markdown_engines.py；benchmark_markdown.py 在全部文档上比较两者并对比速度。
+"""
+
+import os
+import re
+
+import markdown2
+
+# 参考实现
+REFERENCE_ENGINE = 'markdown2'
+
+# auto 模式按这个顺序选择已安装的引擎
+ENGINE_PREFERENCE = ('cmarkgfm', 'markdown2')
+
+# 默认引擎，可通过环境变量 ALLIN_MARKDOWN_ENGINE 覆盖
+DEFAULT_ENGINE = os.environ.get('ALLIN_MARKDOWN_ENGINE') or REFERENCE_ENGINE
+
+# 各生成脚本用到的扩展 → cmark-gfm 的对应功能（None 表示 cmark 本身支持或由整理步骤实现）
+CMARK_EXTENSIONS = {
+    'tables': 'table',
+    'strike': 'strikethrough',
+    'task_list': 'tasklist',
+    'fenced-code-blocks': None,
+    'header-ids': None,
+    'break-on-newline': None,
+    'footnotes': None,
+}
+
+HEADING_RE = re.compile(r'<h([1-6]) data-sourcepos="(\d+):(\d+)-(\d+):\d+">')
+SOURCEPOS_RE = re.compile(r' data-sourcepos="[\d:-]+"')
+ATX_HEADING_RE = re.compile(r'^ {0,3}#{1,6}(?:[ \t]+|$)(.*?)(?:[ \t]+(?<!\\)#+)?[ \t]*$')
+LINE_SPLIT_RE = re.compile(r'\r\n|\r|\n')
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+ATX_NO_SPACE_RE = re.compile(r'^(#{1,6})(?:\u00a0|(?=[^#\s]))')
+TASK_CHECKBOX_RE = re.compile(r'<input type="checkbox"( checked="")? disabled="" />')
+
+def _markdown2_render(markdown_content, extras):
+    return markdown2.markdown(markdown_content, extras=extras)
+
+def _markdown2_version():
+    return markdown2.__version__
+
+def _atx_heading_spaces(markdown_content):
+    """markdown2 把 "#标题"（# 后没有空格或是不换行空格）也当作标题，CommonMark 不认，先补上空格"""
+    lines = LINE_SPLIT_RE.split(markdown_content)
+    fence = None
+    for i, line in enumerate(lines):
+        match = FENCE_RE.match(line)
+        if match:
+            marker = match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and not line[match.end():].strip():
+                fence = None
+        elif fence is None:
+            lines[i] = ATX_NO_SPACE_RE.sub(r'\1 ', line)
+    return '\n'.join(lines)
+
+def _heading_source(lines, first, column, last):
+    """标题的Markdown原文：ATX标题去掉 # 标记，Setext标题取下划线之前的行
+
+    column 是标题在首行的起始字节位置（1开始），跳过引用、列表等容器的前缀。
+    """
+    first_line = lines[first - 1].encode('utf-8')[column - 1:].decode('utf-8', 'ignore')
+    if first == last:
+        match = ATX_HEADING_RE.match(first_line)
+        if match:
+            return match.group(1)
+    rest = [re.sub(r'^[ \t>]*', '', line) for line in lines[first:last - 1]]
+    return ' '.join(line.strip() for line in [first_line] + rest)
+
+def _heading_id(text, counts):
+    """与 markdown2 header-ids 相同的 id：同样的 slug，重名依次加 -2、-3"""
+    header_id = markdown2._slugify(text)
+    counts[header_id] = counts.get(header_id, 0) + 1
+    if not header_id or counts[header_id] > 1:
+        header_id += f'-{counts[header_id]}'
+    return header_id
+
+def _cmarkgfm_render(markdown_content, extras):
+    import cmarkgfm
+    from cmarkgfm.cmark import Options
+
+    options = (Options.CMARK_OPT_UNSAFE | Options.CMARK_OPT_TABLE_PREFER_STYLE_ATTRIBUTES
+               | Options.CMARK_OPT_STRIKETHROUGH_DOUBLE_TILDE)
+    if 'break-on-newline' in extras:
+        options |= Options.CMARK_OPT_HARDBREAKS
+    if 'footnotes' in extras:
+        options |= Options.CMARK_OPT_FOOTNOTES
+    if 'header-ids' in extras:
+        options |= Options.CMARK_OPT_SOURCEPOS
+    extensions = [CMARK_EXTENSIONS[extra] for extra in extras if CMARK_EXTENSIONS[extra]]
+    markdown_content = _atx_heading_spaces(markdown_content)
+    html_content = cmarkgfm.markdown_to_html_with_extensions(markdown_content, options, extensions)
+
+    if 'header-ids' in extras:
+        # data-sourcepos 定位标题在源文件中的行，按 markdown2 的方式从原文生成 id
+        lines = markdown_content.split('\n')
+        counts = {}
+
+        def add_heading_id(match):
+            source = _heading_source(lines, *(int(group) for group in match.group(2, 3, 4)))
+            return f'<h{match.group(1)} id="{_heading_id(source, counts)}">'
+
+        html_content = SOURCEPOS_RE.sub('', HEADING_RE.sub(add_heading_id, html_content))
+    if 'task_list' in extras:
+        html_content = TASK_CHECKBOX_RE.sub(
+            lambda match: f'<input type="checkbox" class="task-list-item-checkbox"'
+                          f'{" checked" if match.group(1) else ""} disabled>',
+            html_content)
+    return html_content
+
+def _cmarkgfm_version():
+    try:
+        import cmarkgfm
+    except ImportError:
+        return None
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('cmarkgfm')
+    except PackageNotFoundError:
+        return getattr(cmarkgfm, '__version__', 'unknown')
+
+# 引擎名 → (转换函数, 版本函数, 支持的扩展；None 表示全部)
+ENGINES = {
+    'markdown2': (_markdown2_render, _markdown2_version, None),
+    'cmarkgfm': (_cmarkgfm_render, _cmarkgfm_version, frozenset(CMARK_EXTENSIONS)),
+}
+
+_versions = {}
+_warned = set()
+
+def engine_version(engine):
+    """引擎的版本号，未安装时返回 None"""
+    if engine not in _versions:
+        _versions[engine] = ENGINES[engine][1]()
+    return _versions[engine]
+
+def available_engines():
+    """已安装的引擎"""
+    return [engine for engine in ENGINES if engine_version(engine)]
+
+def supports_extras(engine, extras):
+    supported = ENGINES[engine][2]
+    return supported is None or set(extras) <= supported
+
+def resolve_engine(engine=None, extras=()):
+    """实际使用的引擎：auto 选已安装的最快引擎，未安装或不支持 extras 时退回参考实现"""
+    engine = engine or DEFAULT_ENGINE
+    if engine == 'auto':
+        for candidate in ENGINE_PREFERENCE:
+            if engine_version(candidate) and supports_extras(candidate, extras):
+                return candidate
+        return REFERENCE_ENGINE
+    if engine not in ENGINES:
+        raise ValueError(f"未知的Markdown引擎: {engine}（可选 {', '.join(ENGINES)}、auto）")
+    if not engine_version(engine):
+        if engine not in _warned:
+            _warned.add(engine)
+            print(f"💡 未安装 {engine}（pip install {engine}），使用 {REFERENCE_ENGINE}")
+        return REFERENCE_ENGINE
+    if not supports_extras(engine, extras):
+        return REFERENCE_ENGINE
+    return engine
+
+def engine_label(engine=None, extras=()):
+    """实际使用的引擎及其版本，例如 'cmarkgfm 2025.10.22'，用于缓存键和构建清单"""
+    engine = resolve_engine(engine, extras)
+    return f"{engine} {engine_version(engine)}"
+
+def render_markdown(markdown_content, extras, engine=None):
+    """Markdown转为HTML片段，engine 为 None 时使用 DEFAULT_ENGINE"""
+    return ENGINES[resolve_engine(engine, extras)][0](markdown_content, extras)
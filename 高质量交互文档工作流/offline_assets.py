@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""交互式HTML的离线打包
+
+页面默认从 cdnjs 加载 Font Awesome，从 Google Fonts 加载 Inter 和 Noto Sans SC。
+离线的评审机器上图标和字体都加载不出来，每个页面还要各自重新下载一遍。
+--offline 模式改用 font_cache.py 缓存的字体文件，用 fontTools 只保留页面中实际出现的字符
+和用到的图标，以 @font-face 写进页面：
+
+    inline   字体以 data: URI 内嵌，单个HTML文件即可离线打开
+    files    字体写到HTML旁边的 assets/ 目录，文件名带内容哈希，多个页面用到同一份时只存一份
+
+先运行 python font_cache.py fetch --web 下载字体和图标。
+"""
+
+import base64
+import hashlib
+import io
+import os
+import re
+
+from font_cache import FONT_AWESOME_CSS, FONT_CACHE_DIR, WEB_FONT_DIR, load_index
+from site_assets import write_asset
+
+OFFLINE_MODES = ('inline', 'files')
+
+# files 模式下字体文件所在的目录（相对HTML文件）
+ASSET_DIR_NAME = 'assets'
+
+# 页面样式表 font-family 中用到的字族
+PAGE_FONT_FAMILIES = ('Inter', 'Noto Sans SC')
+
+# 图标样式类 → (选择器, 字族, 字重, 字体文件名)
+ICON_STYLES = {
+    'fas': ('.fas,.fa-solid', 'Font Awesome 6 Free', 900, 'fa-solid-900'),
+    'far': ('.far,.fa-regular', 'Font Awesome 6 Free', 400, 'fa-regular-400'),
+    'fab': ('.fab,.fa-brands', 'Font Awesome 6 Brands', 400, 'fa-brands-400'),
+}
+ICON_STYLE_ALIASES = {'fa-solid': 'fas', 'fa-regular': 'far', 'fa-brands': 'fab'}
+
+# 页面里的图标类名，包括脚本中切换的类名（例如 'fa-sun'）
+ICON_CLASS_RE = re.compile(r'(?<![\w-])(fa[srb]|fa-[a-z0-9]+(?:-[a-z0-9]+)*)(?![\w-])')
+
+# Font Awesome 样式表中的图标规则：.fa-search:before{content:"\f002"}
+ICON_RULE_RE = re.compile(r'([^{}]+)\{content:\s*"\\([0-9a-fA-F]+)"')
+ICON_SELECTOR_RE = re.compile(r'^\.(fa-[a-z0-9-]+)::?before$')
+
+# 搜索框里可能输入的字符：可打印 ASCII 和常用中文标点
+EXTRA_CHARS = ''.join(chr(c) for c in range(0x20, 0x7f)) + '，。、；：？！“”‘’（）《》—…·'
+
+_subset_cache = {}
+
+def _font_flavor():
+    """有 brotli 时输出 woff2，否则输出 woff"""
+    try:
+        import brotli  # noqa: F401
+        return 'woff2'
+    except ImportError:
+        return 'woff'
+
+def subset_font(path, codepoints, flavor='woff2'):
+    """只保留 codepoints 中字体含有的字符，返回字体数据；一个都没有时返回 None
+
+    同一个进程里相同的字体和字符集只计算一次（批量生成时常见）。
+    """
+    from fontTools import subset
+
+    stat = os.stat(path)
+    digest = hashlib.sha256(','.join(map(str, sorted(codepoints))).encode('ascii')).hexdigest()
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, digest, flavor)
+    if key in _subset_cache:
+        return _subset_cache[key]
+
+    options = subset.Options()
+    options.flavor = flavor
+    options.layout_features = ['*']
+    font = subset.load_font(path, options)
+    used = set(codepoints) & set(font.getBestCmap())
+    data = None
+    if used:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=used)
+        subsetter.subset(font)
+        buffer = io.BytesIO()
+        subset.save_font(font, buffer, options)
+        data = buffer.getvalue()
+    font.close()
+    _subset_cache[key] = data
+    return data
+
+def load_icon_map(font_dir=WEB_FONT_DIR):
+    """解析缓存的 Font Awesome 样式表，返回 {图标类名: 码位}；没有缓存时返回 None"""
+    try:
+        with open(os.path.join(font_dir, FONT_AWESOME_CSS), 'r', encoding='utf-8') as f:
+            css = f.read()
+    except OSError:
+        return None
+    icons = {}
+    for selectors, code in ICON_RULE_RE.findall(css):
+        for selector in selectors.split(','):
+            match = ICON_SELECTOR_RE.match(selector.strip())
+            if match:
+                icons[match.group(1)] = int(code, 16)
+    return icons
+
+def page_fonts(families=PAGE_FONT_FAMILIES):
+    """字体缓存中页面用到的字体，返回 [(字族, 字重, 文件路径)]，fonts/web/ 中的优先"""
+    fonts = {}
+    for font_dir in (FONT_CACHE_DIR, WEB_FONT_DIR):
+        for font in load_index(font_dir):
+            path = os.path.join(font_dir, font['file'])
+            if font['family'] in families and os.path.exists(path):
+                fonts[(font['family'], font['weight'])] = path
+    return [(family, weight, path) for (family, weight), path in sorted(fonts.items())]
+
+class _AssetWriter:
+    """把字体数据变成 url()：inline 模式用 data: URI，files 模式写入带内容哈希的文件"""
+
+    def __init__(self, mode, flavor, asset_dir=None, asset_url=ASSET_DIR_NAME):
+        self.mode = mode
+        self.flavor = flavor
+        self.asset_dir = asset_dir
+        self.asset_url = asset_url
+        self.total = 0
+
+    def url(self, stem, data):
+        self.total += len(data)
+        if self.mode == 'inline':
+            return f"data:font/{self.flavor};base64,{base64.b64encode(data).decode('ascii')}"
+        return f"{self.asset_url}/{write_asset(self.asset_dir, stem, self.flavor, data)}"
+
+def _font_face(family, weight, url, flavor, display='swap'):
+    return (f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};"
+            f"font-display:{display};src:url({url}) format('{flavor}')}}")
+
+def bundle_web_assets(html_document, mode='inline', asset_dir=None, asset_url=ASSET_DIR_NAME):
+    """为已生成的页面打包离线字体和图标，返回替换CDN链接的 <style> 标签
+
+    页面中出现的所有字符（包括脚本里的提示文字和搜索索引）都保留在字体子集里。
+
+    Args:
+        html_document (str): 用CDN资源生成的完整页面
+        mode (str): 'inline' 或 'files'
+        asset_dir (str): files 模式下字体文件的输出目录
+        asset_url (str): files 模式下页面引用字体文件使用的相对路径
+    """
+    if mode not in OFFLINE_MODES:
+        raise ValueError(f"未知的离线模式：{mode}（可选：{', '.join(OFFLINE_MODES)}）")
+    if mode == 'files' and not asset_dir:
+        raise ValueError("files 模式需要指定 asset_dir")
+    try:
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("💡 未安装 fonttools，离线页面不含字体和图标：pip install fonttools brotli")
+        return ''
+
+    flavor = _font_flavor()
+    writer = _AssetWriter(mode, flavor, asset_dir, asset_url)
+    rules = []
+
+    codepoints = {ord(ch) for ch in set(html_document + EXTRA_CHARS)}
+    fonts = page_fonts()
+    if not fonts:
+        print("💡 未找到网页字体缓存，离线页面使用系统字体；运行 python font_cache.py fetch --web 下载")
+    for family, weight, path in fonts:
+        data = subset_font(path, codepoints, flavor)
+        if data:
+            stem = f"{family.replace(' ', '')}-{weight}"
+            rules.append(_font_face(family, weight, writer.url(stem, data), flavor))
+
+    used = set(ICON_CLASS_RE.findall(html_document))
+    styles = {ICON_STYLE_ALIASES.get(name, name) for name in used} & set(ICON_STYLES)
+    icon_map = load_icon_map() if styles else None
+    if styles and icon_map is None:
+        print("⚠️  未找到 Font Awesome 缓存，离线页面不显示图标；运行 python font_cache.py fetch --web 下载")
+    elif styles:
+        icons = {name: icon_map[name] for name in sorted(used) if name in icon_map}
+        for style in sorted(styles):
+            selector, family, weight, stem = ICON_STYLES[style]
+            path = os.path.join(WEB_FONT_DIR, stem + '.ttf')
+            data = subset_font(path, set(icons.values()), flavor) if os.path.exists(path) else None
+            if not data:
+                continue
+            rules.append(_font_face(family, weight, writer.url(stem, data), flavor, display='block'))
+            rules.append(f"{selector}{{font-family:'{family}';"
+                         f"font-weight:{weight};font-style:normal;font-variant:normal;display:inline-block;"
+                         "line-height:1;text-rendering:auto;-webkit-font-smoothing:antialiased}")
+        rules.extend(f'.{name}:before{{content:"\\{code:x}"}}' for name, code in icons.items())
+
+    if not rules:
+        return ''
+    size = writer.total / 1024
+    return (f"    <!-- 离线字体和图标（{len(codepoints)} 个字符，{len(rules)} 条规则，{size:.1f} KB） -->\n"
+            "    <style>\n" + ''.join(f"        {rule}\n" for rule in rules) + "    </style>\n")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""在生成时输出交互式HTML的目录
+
+页面原先在 DOMContentLoaded 时用 querySelectorAll('h2, h3') 逐个创建目录节点，
+页面要等这一步完成才可用。现在直接从 markdown2 header-ids 生成的标题 id 构建目录，
+作为静态HTML写进侧边栏，结构与原来脚本生成的完全相同：
+
+    <ul class="toc-list">
+        <li class="toc-item"><a class="toc-link" href="#id">二级标题</a>
+            <ul class="toc-list">（该章下的三级标题）</ul>
+        </li>
+    </ul>
+
+没有 id 的二级、三级标题（例如Markdown中直接写的 <h2>）与原来一样补上 heading-N，
+N 是它在全部二级、三级标题中的序号。
+"""
+
+import itertools
+import re
+from html import escape
+
+HEADING_TAG_RE = re.compile(r'<(h[23])(\s[^>]*)?>', re.I)
+ID_ATTR_RE = re.compile(r'\sid\s*=', re.I)
+
+def add_heading_ids(html_content):
+    """给没有 id 的二级、三级标题补上 heading-N，返回新的HTML片段"""
+    counter = itertools.count()
+
+    def add_id(match):
+        index = next(counter)
+        attrs = match.group(2) or ''
+        if ID_ATTR_RE.search(attrs):
+            return match.group(0)
+        return f'<{match.group(1)} id="heading-{index}"{attrs}>'
+
+    return HEADING_TAG_RE.sub(add_id, html_content)
+
+def build_toc_html(sections):
+    """从章节列表（见 search_index.extract_sections）生成目录HTML
+
+    只收录有 id 的二级、三级标题（先用 add_heading_ids 补齐）；出现在第一个二级标题之前的三级标题不收录。
+    """
+    lines = ['<ul class="toc-list">']
+    in_h2 = False
+    for section in sections:
+        if not section['id'] or section['level'] not in ('H2', 'H3'):
+            continue
+        link = (f'<a class="toc-link" href="#{escape(section["id"])}">'
+                f'{escape(section["title"], quote=False)}</a>')
+        if section['level'] == 'H2':
+            if in_h2:
+                lines.append('</ul></li>')
+            lines.append(f'<li class="toc-item">{link}<ul class="toc-list">')
+            in_h2 = True
+        elif in_h2:
+            lines.append(f'<li class="toc-item">{link}</li>')
+    if in_h2:
+        lines.append('</ul></li>')
+    lines.append('</ul>')
+    return '\n'.join(lines)
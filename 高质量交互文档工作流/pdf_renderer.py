@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""PDF渲染公共模块
+
+convert_to_pdf.py 和 convert_research_to_pdf.py 共用的渲染层：
+- 本地渲染：进程内只创建一次 FontConfiguration，同一份样式表只解析一次
+- 常驻渲染服务：在 Unix socket 上保持 WeasyPrint、字体和样式表常驻，
+  转换脚本作为轻量客户端只负责 Markdown → HTML，省去每次导入 WeasyPrint 和发现字体的开销
+
+使用方法：
+    python pdf_renderer.py serve      # 启动渲染服务（前台运行，Ctrl+C 退出）
+    python pdf_renderer.py status     # 查看渲染服务是否在运行
+    python pdf_renderer.py stop       # 停止渲染服务
+
+服务未启动时，转换脚本自动退回本地渲染，结果相同。
+字体使用 font_cache.py 管理的本地缓存，渲染过程不联网。
+socket 放在只有当前用户能访问的目录中，服务只接受同一用户的请求（它会按请求写入任意路径的PDF）。
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from font_cache import font_face_css
+
+# 默认 socket 所在的目录：临时目录下按用户区分，权限 0700（由 serve 创建）
+SOCKET_DIR = os.path.join(tempfile.gettempdir(), f"all-in-pdf-{os.getuid() if hasattr(os, 'getuid') else 'user'}")
+
+# 渲染服务的 socket 路径，可通过环境变量 ALLIN_PDF_SOCKET 覆盖
+DEFAULT_SOCKET = os.environ.get('ALLIN_PDF_SOCKET') or os.path.join(SOCKET_DIR, 'render.sock')
+
+# 进程内最多缓存的解析后样式表数量，超出时丢弃最久未用的
+STYLESHEET_CACHE_SIZE = 8
+
+# 客户端等待渲染结果的最长时间（秒）
+CLIENT_TIMEOUT = 600
+
+def wrap_html_document(html_content, title):
+    """把Markdown转换出的HTML片段包装为完整文档，样式单独传给渲染器"""
+    return f"""
+    <!DOCTYPE html>
+    <html lang="zh-CN">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title}</title>
+    </head>
+    <body>
+        {html_content}
+    </body>
+    </html>
+    """
+
+class PdfRenderer:
+    """进程内复用的 WeasyPrint 渲染器
+
+    FontConfiguration 只创建一次；样式表按内容哈希缓存解析后的 CSS 对象，
+    最多保留 STYLESHEET_CACHE_SIZE 份（常驻服务会收到各种样式表，不能无限增长）。
+    """
+
+    def __init__(self):
+        # WeasyPrint 导入较慢，只在真正需要本地渲染时才导入
+        from weasyprint import HTML, CSS
+        from weasyprint.text.fonts import FontConfiguration
+
+        self._html_class = HTML
+        self._css_class = CSS
+        self.font_config = FontConfiguration()
+        self._stylesheets = OrderedDict()
+
+    def stylesheet(self, css_text):
+        """返回解析好的 CSS 对象，最近用过的样式表不重复解析"""
+        key = hashlib.sha256(css_text.encode('utf-8')).hexdigest()
+        if key in self._stylesheets:
+            self._stylesheets.move_to_end(key)
+        else:
+            self._stylesheets[key] = self._css_class(string=css_text, font_config=self.font_config)
+            while len(self._stylesheets) > STYLESHEET_CACHE_SIZE:
+                self._stylesheets.popitem(last=False)
+        return self._stylesheets[key]
+
+    def render(self, html_document, css_text, pdf_file, base_url=None):
+        """渲染HTML文档为PDF文件"""
+        html = self._html_class(string=html_document, base_url=base_url)
+        html.write_pdf(
+            pdf_file,
+            stylesheets=[self.stylesheet(css_text)],
+            font_config=self.font_config
+        )
+
+_local_renderer = None
+
+def get_local_renderer():
+    """返回当前进程共享的本地渲染器"""
+    global _local_renderer
+    if _local_renderer is None:
+        _local_renderer = PdfRenderer()
+    return _local_renderer
+
+def _send_request(request, socket_path=DEFAULT_SOCKET, timeout=CLIENT_TIMEOUT):
+    """向渲染服务发送一个 JSON 请求并返回 JSON 响应"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+        client.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+def _owned_socket(socket_path):
+    """socket 文件存在且属于当前用户；别的用户抢先创建的 socket 不使用"""
+    if not hasattr(socket, 'AF_UNIX'):
+        return False
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+def server_available(socket_path=DEFAULT_SOCKET):
+    """渲染服务是否在运行"""
+    if not _owned_socket(socket_path):
+        return False
+    try:
+        return _send_request({'action': 'ping'}, socket_path, timeout=2).get('ok', False)
+    except (OSError, ValueError):
+        return False
+
+_font_hint_shown = False
+
+def with_local_fonts(css_text):
+    """在样式表前加上本地字体缓存的 @font-face 规则
+
+    没有字体缓存时只提示一次，渲染退回样式表中列出的系统字体，同样不联网。
+    """
+    global _font_hint_shown
+    font_css = font_face_css()
+    if not font_css and not _font_hint_shown:
+        print("💡 未找到本地字体缓存，使用系统字体；运行 python font_cache.py fetch 下载 Noto Sans SC")
+        _font_hint_shown = True
+    return font_css + css_text
+
+def render_pdf(html_document, css_text, pdf_file, base_url=None, use_server=True,
+               socket_path=DEFAULT_SOCKET, local_fonts=True):
+    """渲染PDF：渲染服务在运行时交给服务，否则在本进程内渲染
+
+    Args:
+        local_fonts (bool): 是否在样式表前加入本地字体缓存的 @font-face
+
+    Returns:
+        str: 实际使用的渲染方式，'server' 或 'local'
+    """
+    if local_fonts:
+        css_text = with_local_fonts(css_text)
+    pdf_file = os.path.abspath(pdf_file)
+    if base_url is not None:
+        base_url = os.path.abspath(base_url)
+
+    if use_server and _owned_socket(socket_path):
+        try:
+            response = _send_request({
+                'action': 'render',
+                'html': html_document,
+                'css': css_text,
+                'pdf_file': pdf_file,
+                'base_url': base_url,
+            }, socket_path)
+        except (OSError, ValueError):
+            # 服务没有响应（例如残留的 socket 文件），退回本地渲染
+            response = None
+        if response is not None:
+            if not response.get('ok'):
+                raise RuntimeError(f"渲染服务出错: {response.get('error')}")
+            return 'server'
+
+    get_local_renderer().render(html_document, css_text, pdf_file, base_url)
+    return 'local'
+
+class _RenderHandler(socketserver.StreamRequestHandler):
+    """处理一个渲染请求：读取一行 JSON，返回一行 JSON"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            action = request.get('action')
+            if action == 'ping':
+                response = {'ok': True, 'pid': os.getpid(),
+                            'rendered': self.server.rendered_count}
+            elif action == 'stop':
+                response = {'ok': True}
+                self.server.stop_requested = True
+            elif action == 'render':
+                start = time.perf_counter()
+                self.server.renderer.render(request['html'], request['css'],
+                                            request['pdf_file'], request.get('base_url'))
+                elapsed = time.perf_counter() - start
+                self.server.rendered_count += 1
+                print(f"📄 {request['pdf_file']}（{elapsed:.2f} 秒）", flush=True)
+                response = {'ok': True, 'elapsed': elapsed}
+            else:
+                response = {'ok': False, 'error': f"未知请求: {action}"}
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+class _RenderServer(socketserver.UnixStreamServer):
+    """只接受与服务同一用户的连接（Linux 上检查对端的 SO_PEERCRED）"""
+
+    def server_bind(self):
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+    def verify_request(self, request, client_address):
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return True  # 其他系统依靠 socket 文件和目录的权限
+        _, uid, _ = struct.unpack('3i', request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                                           struct.calcsize('3i')))
+        if uid != os.getuid():
+            print(f"⚠️ 拒绝了用户 {uid} 的连接", flush=True)
+            return False
+        return True
+
+def _prepare_socket_dir(socket_path, socket_dir=SOCKET_DIR):
+    """socket 在 SOCKET_DIR 中时，目录不存在则以 0700 创建，已存在则必须属于当前用户且其他人无权访问
+
+    自行指定的其他路径由使用者负责目录权限，服务仍会检查连接方。
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if directory != os.path.abspath(socket_dir):
+        return
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"socket 目录 {directory} 不属于当前用户或其他用户可以访问，请删除后重试")
+
+def serve(socket_path=DEFAULT_SOCKET):
+    """启动常驻渲染服务，请求逐个串行处理"""
+    if server_available(socket_path):
+        print(f"渲染服务已在运行：{socket_path}")
+        return
+    try:
+        _prepare_socket_dir(socket_path)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if os.path.lexists(socket_path):
+        os.remove(socket_path)  # 上次异常退出留下的 socket 文件
+
+    start = time.perf_counter()
+    renderer = PdfRenderer()
+    # 预热：渲染一个空白文档，让字体发现和布局引擎的初始化提前完成
+    renderer.render(wrap_html_document('<p>预热</p>', 'warmup'), 'body { font-family: sans-serif; }',
+                    os.devnull)
+    print(f"✅ 渲染服务已启动：{socket_path}（预热 {time.perf_counter() - start:.2f} 秒）", flush=True)
+
+    with _RenderServer(socket_path, _RenderHandler) as server:
+        server.renderer = renderer
+        server.rendered_count = 0
+        server.stop_requested = False
+        try:
+            while not server.stop_requested:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+    print("渲染服务已停止")
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(description="PDF常驻渲染服务")
+    parser.add_argument('command', choices=['serve', 'status', 'stop'],
+                        help="serve 启动服务，status 查看状态，stop 停止服务")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help=f"Unix socket 路径（默认：{DEFAULT_SOCKET}）")
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("当前系统不支持 Unix socket，无法使用渲染服务")
+        sys.exit(1)
+
+    if args.command == 'serve':
+        serve(args.socket)
+    elif args.command == 'status':
+        if server_available(args.socket):
+            info = _send_request({'action': 'ping'}, args.socket)
+            print(f"渲染服务运行中：pid {info['pid']}，已渲染 {info['rendered']} 个文件")
+        else:
+            print("渲染服务未运行")
+    elif server_available(args.socket):
+        _send_request({'action': 'stop'}, args.socket)
+        print("已通知渲染服务停止")
+    else:
+        print("渲染服务未运行")
+
+if __name__ == "__main__":
+    main()
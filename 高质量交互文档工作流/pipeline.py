@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""all-in build：Word → Markdown → PDF / 交互式HTML 的统一构建
+
+原来的流程是依次运行 convert_word_to_md.py、convert_research_to_pdf.py、convert_to_interactive_html.py
+和 通用HTML生成器.py，输入输出路径写死在各脚本里。这里把这些步骤建模为一张目标图（DAG）：
+
+    待处理/*.docx ─[docx]─→ 06-待整理文档/主题_日期.md ─┬─[pdf]───────→ 主题_日期.pdf
+                                         其他 .md ─┼─[html]──────→ 主题_日期_互动版.html
+                                                   └─[universal]─→ 主题_日期_通用版.html
+
+- 每个目标声明自己的输入和输出文件，一个输出只能由一个目标生成；输入由另一个目标生成时两者之间有依赖
+- 依赖都完成的目标放进进程池并行执行；某个目标失败时只跳过依赖它的目标
+- 目标的输入内容（SHA-256）、参数和生成脚本都没变，输出也还在时跳过；构建状态记录在仓库根目录的
+  .all-in-state.json，大小和修改时间不变的文件不重新计算哈希
+- docx 目标生成的Markdown文件名取决于文档内容，执行后（或从上次的记录中）才知道，届时再添加下游目标
+
+使用方法（仓库根目录的 all-in 是本脚本的入口）：
+    ./all-in build                                 # 待处理/ 中的Word文档 → 06-待整理文档/ → PDF和两种HTML
+    ./all-in build 方案.md 报告/ -f pdf,html -j 4   # 另外指定Markdown文件、目录或通配符，只生成PDF和互动版
+    ./all-in build --no-docx 报告/ -o 输出 --minify  # 不转换Word文档，输出写到 输出/
+    ./all-in build --dry-run                       # 只列出需要执行的目标
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from batch_convert_to_pdf import STYLES, collect_markdown_files, convert_one
+from build_site import REPO_ROOT, code_digest, document_title, template_digest
+from interactive_page import MARKDOWN_EXTRAS, write_interactive_html
+from markdown_engines import engine_label
+from offline_assets import OFFLINE_MODES
+from 通用HTML生成器 import THEMES, create_universal_interactive_html
+
+# 默认的Word收件箱和Markdown输出目录（与 convert_word_to_md.py 的默认值相同，但相对仓库根目录）
+DEFAULT_DOCX_DIR = os.path.join(REPO_ROOT, '待处理')
+DEFAULT_MD_DIR = os.path.join(REPO_ROOT, '06-待整理文档')
+
+STATE_FILE = os.path.join(REPO_ROOT, '.all-in-state.json')
+
+# 状态格式或目标定义变化时递增，使上次的记录全部失效
+PIPELINE_VERSION = 1
+
+# Markdown的输出格式 → 输出文件名后缀
+FORMATS = {
+    'pdf': '.pdf',
+    'html': '_互动版.html',
+    'universal': '_通用版.html',
+}
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _rel(path):
+    """状态文件中的路径：相对仓库根目录，与运行时的工作目录无关"""
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(os.sep, '/')
+
+# ---------------------------------------------------------------- 目标的执行
+
+def _run_docx(inputs, outputs, params):
+    """Word收件箱 → Markdown，返回实际生成的Markdown文件（文件名由文档内容决定）"""
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    from convert_word_to_md import convert_word_to_markdown, list_docx_files, load_manifest, manifest_key
+
+    docx_dir, md_dir = os.path.join(REPO_ROOT, params['docx_dir']), os.path.join(REPO_ROOT, params['md_dir'])
+    convert_word_to_markdown(docx_dir, md_dir, jobs=params['jobs'], engine=params['engine'])
+    entries = load_manifest(md_dir)['files']
+    produced = []
+    for docx_file in list_docx_files(docx_dir):
+        entry = entries.get(manifest_key(docx_dir, docx_file, md_dir))
+        if entry and os.path.exists(os.path.join(md_dir, entry['output'])):
+            produced.append(os.path.join(md_dir, entry['output']))
+    return produced
+
+def _run_pdf(inputs, outputs, params):
+    _, _, error = convert_one(inputs[0], outputs[0], params['style'], use_server=params['use_server'])
+    if error:
+        raise RuntimeError(error)
+    return outputs
+
+def _read_title(md_file):
+    with open(md_file, 'r', encoding='utf-8') as f:
+        return document_title(f.read(), os.path.basename(md_file))
+
+def _run_html(inputs, outputs, params):
+    write_interactive_html(inputs[0], outputs[0], 'research.html', offline=params['offline'],
+                           minify=params['minify'], compress=params['compress'], lazy=params['lazy'],
+                           title=f"{_read_title(inputs[0])} - 交互版")
+    return outputs
+
+def _run_universal(inputs, outputs, params):
+    create_universal_interactive_html(inputs[0], outputs[0], params['theme'], offline=params['offline'],
+                                      title=_read_title(inputs[0]), quiet=True, minify=params['minify'],
+                                      compress=params['compress'], lazy=params['lazy'])
+    return outputs
+
+# 目标类型 → 执行函数，返回实际生成的输出文件
+ACTIONS = {
+    'docx': _run_docx,
+    'pdf': _run_pdf,
+    'html': _run_html,
+    'universal': _run_universal,
+}
+
+def run_target(kind, inputs, outputs, params):
+    """执行一个目标（在子进程中），返回 (实际输出, 耗时, 输出的日志, 错误信息)"""
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            for path in outputs:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            produced = ACTIONS[kind](inputs, outputs, params)
+        return produced, time.perf_counter() - start, log.getvalue(), None
+    except Exception as e:
+        return [], time.perf_counter() - start, log.getvalue(), f"{type(e).__name__}: {e}"
+
+# ---------------------------------------------------------------- 目标图
+
+def make_target(kind, inputs, outputs, params, after=(), name=None):
+    """目标：名称（默认为 类型:第一个输出，没有预先声明的输出时用第一个输入）、输入、输出和参数
+
+    after 是只约束顺序的依赖（目标名），用于输入可能被一个输出未知的目标（docx）改写的情况。
+    输入和输出都可能为空的目标（docx）需要指定 name。
+    """
+    return {'name': name or f"{kind}:{_rel((outputs or inputs)[0])}", 'kind': kind,
+            'inputs': list(inputs), 'outputs': list(outputs), 'params': params, 'after': list(after)}
+
+def markdown_targets(md_file, formats, output_dir=None, pdf_style='research', theme='cyan',
+                     offline=None, minify=False, compress=False, lazy=False, use_server=False, after=()):
+    """一个Markdown文件的各格式输出目标，输出默认与Markdown同目录"""
+    stem = os.path.splitext(os.path.basename(md_file))[0]
+    directory = output_dir or os.path.dirname(os.path.abspath(md_file))
+    html_params = {'offline': offline, 'minify': minify, 'compress': compress, 'lazy': lazy}
+    params = {
+        'pdf': {'style': pdf_style, 'use_server': use_server},
+        'html': html_params,
+        'universal': dict(html_params, theme=theme),
+    }
+    return [make_target(kind, [md_file], [os.path.join(directory, stem + FORMATS[kind])], params[kind], after)
+            for kind in formats]
+
+def _add_targets(graph, producers, targets):
+    """加入目标，检查输出冲突"""
+    for target in targets:
+        existing = graph.get(target['name'])
+        if existing:
+            # 同一个目标（例如Word转换出的Markdown又在命令行中指定）只保留一个
+            if list(map(os.path.abspath, existing['inputs'])) == list(map(os.path.abspath, target['inputs'])):
+                continue
+            raise ValueError(f"输出冲突：{', '.join(target['outputs'])} 同时由 "
+                             f"{', '.join(existing['inputs'])} 和 {', '.join(target['inputs'])} 生成")
+        for path in target['outputs']:
+            owner = producers.get(os.path.abspath(path))
+            if owner:
+                raise ValueError(f"输出冲突：{path} 同时由 {owner} 和 {target['name']} 生成")
+        graph[target['name']] = target
+        for path in target['outputs']:
+            producers[os.path.abspath(path)] = target['name']
+
+def _dependencies(target, producers):
+    return ({producers[path] for path in map(os.path.abspath, target['inputs']) if path in producers}
+            | set(target['after']))
+
+def check_acyclic(graph, producers):
+    """拓扑排序检查目标图没有环，返回一个可行的执行顺序"""
+    dependencies = {name: _dependencies(target, producers) - {name} for name, target in graph.items()}
+    if any(name in _dependencies(target, producers) for name, target in graph.items()):
+        raise ValueError("目标图有环：某个目标的输出也是它自己的输入")
+    order = []
+    ready = sorted(name for name, deps in dependencies.items() if not deps)
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for other, deps in dependencies.items():
+            if name in deps:
+                deps.discard(name)
+                if not deps and other not in order and other not in ready:
+                    ready.append(other)
+    if len(order) != len(graph):
+        raise ValueError(f"目标图有环：{', '.join(sorted(set(graph) - set(order)))}")
+    return order
+
+# ---------------------------------------------------------------- 构建状态
+
+def load_state(state_file=STATE_FILE):
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    if state.get('version') != PIPELINE_VERSION:
+        state = {'version': PIPELINE_VERSION, 'targets': {}, 'files': {}}
+    return state
+
+def save_state(state, state_file=STATE_FILE):
+    """原子地写回构建状态"""
+    tmp_path = state_file + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, state_file)
+
+def file_digest(path, state):
+    """文件内容的SHA-256；大小和修改时间与上次相同时直接用记录的哈希"""
+    stat = os.stat(path)
+    key = _rel(path)
+    cached = state['files'].get(key)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    sha256 = _file_sha256(path)
+    state['files'][key] = [stat.st_size, stat.st_mtime_ns, sha256]
+    return sha256
+
+_toolchains = {}
+
+def toolchain_digest(kind):
+    """生成这类目标的脚本和模板的哈希，脚本或模板改动后相应目标全部重新执行"""
+    if kind not in _toolchains:
+        if kind == 'docx':
+            _toolchains[kind] = _file_sha256(os.path.join(REPO_ROOT, 'convert_word_to_md.py'))
+        else:
+            # 本脚本自身的改动由 PIPELINE_VERSION 控制
+            _toolchains[kind] = hashlib.sha256((code_digest(exclude={os.path.basename(__file__)})
+                                                + template_digest() + engine_label(extras=MARKDOWN_EXTRAS))
+                                               .encode('utf-8')).hexdigest()
+    return _toolchains[kind]
+
+# 不影响输出内容的参数，不计入目标的键
+RUNTIME_PARAMS = {'jobs', 'use_server'}
+
+def target_key(target, state):
+    """目标的键：类型、参数、脚本、全部输入的内容哈希和声明的输出，任一变化都要重新执行"""
+    params = {name: value for name, value in target['params'].items() if name not in RUNTIME_PARAMS}
+    inputs = [(_rel(path), file_digest(path, state)) for path in target['inputs']]
+    return hashlib.sha256(json.dumps(
+        [PIPELINE_VERSION, target['kind'], params, toolchain_digest(target['kind']), inputs,
+         [_rel(path) for path in target['outputs']]],
+        ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+def up_to_date(target, key, state):
+    """上次以同样的键执行成功，且记录的输出都还在"""
+    entry = state['targets'].get(target['name'])
+    return bool(entry and entry['key'] == key
+                and all(os.path.exists(os.path.join(REPO_ROOT, path)) for path in entry['outputs']))
+
+# ---------------------------------------------------------------- 调度
+
+def build(targets, expand=None, jobs=0, force=False, dry_run=False, verbose=False, state_file=STATE_FILE):
+    """执行目标图
+
+    Args:
+        targets (list): make_target 创建的目标
+        expand: expand(目标, 实际输出) → 新的目标列表；输出执行后才知道的目标（docx）用它添加下游目标
+        jobs (int): 并行进程数，0 表示使用全部CPU核心，1 在当前进程中依次执行
+        force (bool): 忽略构建状态，全部重新执行
+        dry_run (bool): 只列出需要执行的目标
+    Returns:
+        dict: 各结果的目标数 {'built', 'skipped', 'failed', 'blocked'}
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    state = load_state(state_file)
+    graph, producers = {}, {}
+    _add_targets(graph, producers, targets)
+    check_acyclic(graph, producers)
+
+    finished, failed = set(), set()
+    counts = {'built': 0, 'skipped': 0, 'failed': 0, 'blocked': 0}
+    running = {}
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and not dry_run else None
+
+    def complete(target, produced):
+        finished.add(target['name'])
+        if expand:
+            _add_targets(graph, producers, expand(target, produced))
+
+    try:
+        while True:
+            # 依赖都已完成的目标：最新的直接跳过，其余提交执行
+            progressed = False
+            for name, target in list(graph.items()):
+                if name in finished or name in failed or name in running.values():
+                    continue
+                dependencies = _dependencies(target, producers)
+                if dependencies & failed:
+                    failed.add(name)
+                    counts['blocked'] += 1
+                    print(f"⏭️  {name}（依赖的目标失败，未执行）")
+                    progressed = True
+                    continue
+                if not dependencies <= finished:
+                    continue
+                progressed = True
+                missing = [path for path in target['inputs'] if not os.path.exists(path)]
+                if missing:
+                    failed.add(name)
+                    counts['failed'] += 1
+                    print(f"❌ {name}：缺少输入 {', '.join(missing)}")
+                    continue
+                key = target_key(target, state)
+                entry = state['targets'].get(name)
+                if not force and up_to_date(target, key, state):
+                    counts['skipped'] += 1
+                    if verbose:
+                        print(f"✔️  {name}（未变化）")
+                    complete(target, [os.path.join(REPO_ROOT, path) for path in entry['outputs']])
+                    continue
+                target['key'] = key
+                if dry_run:
+                    counts['built'] += 1
+                    print(f"⏳ {name}" + ("（输出执行后才知道，下游目标未列出）" if not entry and not target['outputs'] else ""))
+                    # 假定输出与上次相同，以便列出下游目标
+                    complete(target, [os.path.join(REPO_ROOT, path) for path in entry['outputs']]
+                             if entry else target['outputs'])
+                    continue
+                call = (target['kind'], target['inputs'], target['outputs'], target['params'])
+                if executor:
+                    running[executor.submit(run_target, *call)] = name
+                else:
+                    _record(target, run_target(*call), state, counts, failed, complete, verbose)
+            if executor and running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = graph[running.pop(future)]
+                    _record(target, future.result(), state, counts, failed, complete, verbose)
+                continue
+            if not progressed:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if not dry_run:
+            save_state(state, state_file)
+    return counts
+
+def _record(target, result, state, counts, failed, complete, verbose):
+    """记录一个目标的执行结果"""
+    produced, elapsed, log, error = result
+    if error:
+        failed.add(target['name'])
+        counts['failed'] += 1
+        state['targets'].pop(target['name'], None)
+        print(f"❌ {target['name']}  {elapsed:.2f}s")
+        print(f"   错误: {error}")
+        if log.strip():
+            print('   ' + log.rstrip().replace('\n', '\n   '))
+        return
+    counts['built'] += 1
+    state['targets'][target['name']] = {'key': target['key'], 'outputs': [_rel(path) for path in produced]}
+    print(f"✅ {target['name']}  {elapsed:.2f}s")
+    if verbose and log.strip():
+        print('   ' + log.rstrip().replace('\n', '\n   '))
+    complete(target, produced)
+
+# ---------------------------------------------------------------- 命令行
+
+def build_command(args):
+    """all-in build"""
+    formats = [name.strip() for name in args.formats.split(',') if name.strip()]
+    unknown = [name for name in formats if name not in FORMATS]
+    if unknown:
+        print(f"错误：未知的输出格式 {', '.join(unknown)}（可选 {', '.join(FORMATS)}）")
+        return 1
+    jobs = args.jobs or os.cpu_count() or 1
+    output_dir = os.path.abspath(args.output_dir) if args.output_dir else None
+
+    md_dir = os.path.abspath(args.md_dir)
+    docx_target = None
+
+    def targets_for(md_file):
+        # Word转换出的Markdown可能被 docx 目标改写，等它完成后再构建
+        after = [docx_target['name']] if docx_target and os.path.dirname(os.path.abspath(md_file)) == md_dir else []
+        return markdown_targets(md_file, formats, output_dir, args.pdf_style, args.theme, args.offline,
+                                args.minify, args.compress, args.lazy, use_server=jobs == 1, after=after)
+
+    targets = []
+    if not args.no_docx:
+        if os.path.isdir(args.docx_dir):
+            # 收件箱中的Word文档是输入；目录中文档的增删也会改变目标的键
+            if REPO_ROOT not in sys.path:
+                sys.path.insert(0, REPO_ROOT)
+            from convert_word_to_md import list_docx_files
+            docx_files = [os.path.join(args.docx_dir, name) for name in list_docx_files(args.docx_dir)]
+            # 收件箱为空时也保留这个目标，清空收件箱同样会改变它的键
+            docx_target = make_target('docx', docx_files, [], {
+                'docx_dir': _rel(args.docx_dir), 'md_dir': _rel(args.md_dir),
+                'engine': args.docx_engine, 'jobs': jobs}, name=f"docx:{_rel(args.docx_dir)}")
+            targets.append(docx_target)
+        else:
+            print(f"💡 Word收件箱 {args.docx_dir} 不存在，跳过Word转换")
+    for md_file in collect_markdown_files(args.inputs, recursive=True):
+        targets.extend(targets_for(md_file))
+
+    def expand(target, produced):
+        if target['kind'] != 'docx':
+            return []
+        return [new for md_file in produced for new in targets_for(md_file)]
+
+    if not targets:
+        print("没有需要构建的目标：指定Markdown文件或目录，或在Word收件箱中放入文档")
+        return 0
+
+    print(f"输出格式：{', '.join(formats)}，并行进程数：{jobs}" + ("（只列出需要执行的目标）" if args.dry_run else ""))
+    print("-" * 50)
+    start = time.perf_counter()
+    try:
+        counts = build(targets, expand, jobs, args.force, args.dry_run, args.verbose, args.state)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    print("-" * 50)
+    if args.dry_run:
+        print(f"需要执行 {counts['built']} 个目标，未变化 {counts['skipped']} 个")
+    else:
+        print(f"构建完成！执行 {counts['built']} 个目标，跳过未变化的 {counts['skipped']} 个，"
+              f"失败 {counts['failed']} 个，未执行 {counts['blocked']} 个，总耗时 {time.perf_counter() - start:.2f} 秒")
+    return 1 if counts['failed'] else 0
+
+def main():
+    """主函数，支持命令行参数"""
+    parser = argparse.ArgumentParser(prog='all-in', description="Word → Markdown → PDF / 交互式HTML 的统一构建")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help="构建全部目标，跳过输入未变化的目标")
+    build_parser.add_argument('inputs', nargs='*', help="另外要构建的Markdown文件、目录或通配符")
+    build_parser.add_argument('-f', '--formats', default=','.join(FORMATS),
+                              help=f"输出格式，逗号分隔（默认：{','.join(FORMATS)}）")
+    build_parser.add_argument('-o', '--output-dir', help="输出目录（默认与各Markdown文件同目录）")
+    build_parser.add_argument('--docx-dir', default=DEFAULT_DOCX_DIR, help="Word收件箱（默认：仓库/待处理）")
+    build_parser.add_argument('--md-dir', default=DEFAULT_MD_DIR, help="Word转换出的Markdown目录（默认：仓库/06-待整理文档）")
+    build_parser.add_argument('--no-docx', action='store_true', help="不转换Word文档，只构建指定的Markdown")
+    build_parser.add_argument('--docx-engine', choices=('python-docx', 'stream'), default='python-docx',
+                              help="Word解析引擎（见 convert_word_to_md.py）")
+    build_parser.add_argument('--pdf-style', choices=sorted(STYLES), default='research', help="PDF主题（默认：research）")
+    build_parser.add_argument('--theme', choices=sorted(THEMES), default='cyan', help="通用版HTML的主题（默认：cyan）")
+    build_parser.add_argument('--offline', nargs='?', const='inline', choices=OFFLINE_MODES,
+                              help="HTML离线打包字体和图标")
+    build_parser.add_argument('--minify', action='store_true', help="压缩HTML和内嵌的CSS/JS")
+    build_parser.add_argument('--compress', action='store_true', help="同时写出 .gz/.br 预压缩文件")
+    build_parser.add_argument('--lazy', action='store_true', help="HTML延迟渲染开头两屏以外的章节")
+    build_parser.add_argument('-j', '--jobs', type=int, default=0, help="并行进程数，0 表示使用全部CPU核心（默认）")
+    build_parser.add_argument('--force', action='store_true', help="忽略构建状态，全部重新执行")
+    build_parser.add_argument('-n', '--dry-run', action='store_true', help="只列出需要执行的目标，不执行")
+    build_parser.add_argument('-v', '--verbose', action='store_true', help="同时列出未变化的目标和各目标的输出")
+    build_parser.add_argument('--state', default=STATE_FILE, help="构建状态文件（默认：仓库/.all-in-state.json）")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        sys.exit(build_command(args))
+
+if __name__ == "__main__":
+    main()
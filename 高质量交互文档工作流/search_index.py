@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""生成交互式HTML时预先建立的全文倒排索引
+
+页面原先在每次按键时用 new RegExp(query, 'gi') 扫描整篇正文，而且只返回标题命中的结果。
+现在由 Python 在生成时把正文按标题切成章节并建立倒排索引，以 JSON 嵌入页面，
+页面搜索只需查表、打分，再从章节文本中截取摘要。
+
+分词规则（templates/interactive.js 中的 tokenize 与这里保持一致）：
+- 中文：连续汉字切成相邻两字的二元组；只有一个字时保留单字
+- 英文和数字：按 [a-z0-9]+ 切词，只把 ASCII 大写字母转为小写，不改变文本长度
+
+索引结构：
+    {
+      "sections": [{"id": 标题id, "title": 标题, "level": "H2", "text": 章节纯文本}, ...],
+      "index": {词: [章节序号, 出现次数, 首次出现位置, 章节序号, ...]}
+    }
+位置按 UTF-16 码元计算，与浏览器中字符串下标一致。
+"""
+
+import json
+import re
+from html.parser import HTMLParser
+
+# 切分章节的标题级别
+SECTION_TAGS = ('h1', 'h2', 'h3', 'h4')
+
+# 这些标签前后补空格，避免相邻单元格、列表项的文字粘连
+BLOCK_TAGS = {
+    'p', 'div', 'br', 'li', 'ul', 'ol', 'tr', 'td', 'th', 'table', 'thead', 'tbody',
+    'pre', 'blockquote', 'hr', 'dt', 'dd', 'section', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+}
+
+# 内容不参与索引的标签
+SKIP_TAGS = {'script', 'style', 'template'}
+
+CJK_CHARS = '\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+TOKEN_RE = re.compile(f'[{CJK_CHARS}]+|[a-z0-9]+')
+ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+class _SectionParser(HTMLParser):
+    """按标题把HTML片段切成章节，提取每章的纯文本"""
+
+    def __init__(self):
+        super().__init__()
+        self.sections = [{'id': '', 'title': '', 'level': '', 'parts': []}]
+        self.heading = None
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in SECTION_TAGS:
+            self.sections.append({'id': dict(attrs).get('id') or '', 'title': '',
+                                  'level': tag.upper(), 'parts': []})
+            self.heading = tag
+        if tag in BLOCK_TAGS:
+            self.sections[-1]['parts'].append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag == self.heading:
+            self.heading = None
+        if tag in BLOCK_TAGS:
+            self.sections[-1]['parts'].append(' ')
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        section = self.sections[-1]
+        section['parts'].append(data)
+        if self.heading:
+            section['title'] += data
+
+def extract_sections(html_content):
+    """把HTML片段切成章节，返回 [{'id', 'title', 'level', 'text'}]，跳过没有文字的章节"""
+    parser = _SectionParser()
+    parser.feed(html_content)
+    parser.close()
+    sections = []
+    for section in parser.sections:
+        text = ' '.join(''.join(section.pop('parts')).split())
+        if text:
+            section['title'] = ' '.join(section['title'].split())
+            section['text'] = text
+            sections.append(section)
+    return sections
+
+def tokenize(text):
+    """分词，返回 [(词, 在 text 中的字符位置)]，text 应已做过 ASCII 小写转换"""
+    tokens = []
+    for match in TOKEN_RE.finditer(text):
+        word, start = match.group(0), match.start()
+        if word[0].isascii() or len(word) == 1:
+            tokens.append((word, start))
+        else:
+            tokens.extend((word[i:i + 2], start + i) for i in range(len(word) - 1))
+    return tokens
+
+def _utf16_offsets(text):
+    """字符位置 → UTF-16 位置的对照表（emoji 等补充平面字符在浏览器中占两个码元）"""
+    offsets = [0]
+    for ch in text:
+        offsets.append(offsets[-1] + (2 if ord(ch) > 0xFFFF else 1))
+    return offsets
+
+def build_search_index(html_content, sections=None):
+    """从HTML片段建立章节级倒排索引
+
+    Args:
+        sections (list): 已经提取好的章节（extract_sections 的结果），避免重复解析HTML
+    """
+    if sections is None:
+        sections = extract_sections(html_content)
+    index = {}
+    for number, section in enumerate(sections):
+        text = section['text'].translate(ASCII_LOWER)
+        utf16 = _utf16_offsets(text) if not text.isascii() else None
+        postings = {}
+        for token, start in tokenize(text):
+            if token in postings:
+                postings[token][1] += 1
+            else:
+                postings[token] = [number, 1, utf16[start] if utf16 else start]
+        for token, posting in postings.items():
+            index.setdefault(token, []).extend(posting)
+    return {'sections': sections, 'index': index}
+
+def search_index_json(index):
+    """序列化为可直接放进 <script type="application/json"> 的 JSON"""
+    data = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    # 转义 <，避免正文中的 </script> 或 <!-- 干扰脚本标签的解析
+    return data.replace('<', '\\u003c')
+
+def merge_search_indexes(documents):
+    """把多篇文档的索引合并为全站索引（站点首页使用）
+
+    章节序号按文档顺序重新编号，每个章节加上所属文档的标题（doc）和页面地址（url）。
+
+    Args:
+        documents (list): [(页面地址, 文档标题, build_search_index 的结果)]
+    """
+    sections = []
+    index = {}
+    for url, title, doc_index in documents:
+        base = len(sections)
+        for section in doc_index['sections']:
+            sections.append(dict(section, doc=title,
+                                 url=f"{url}#{section['id']}" if section['id'] else url))
+        for token, postings in doc_index['index'].items():
+            merged = index.setdefault(token, [])
+            for i in range(0, len(postings), 3):
+                merged.extend((postings[i] + base, postings[i + 1], postings[i + 2]))
+    return {'sections': sections, 'index': index}
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""站点模式：多个交互式页面共用外部样式表和脚本
+
+每个页面原先都内嵌同样的几百行CSS和JS，一百篇文档就有一百份副本，浏览器也无法缓存。
+站点模式把模板的样式（styles 块）和脚本（script 块）各写成一个文件，放在 assets/ 目录，
+文件名带内容哈希，例如 universal-cyan.3f9a1c2b7d.css；页面通过 templates/site.html
+改为 <link>/<script src> 引用，只内联文档自己的内容、目录和搜索索引。
+
+内容变化时文件名随之变化，所以静态服务器可以对 assets/ 设置长期缓存：
+    Cache-Control: public, max-age=31536000, immutable
+"""
+
+import hashlib
+import os
+
+from output_stage import COMPRESSED_SUFFIXES, MINIFIERS, compress_file
+from template_engine import get_template
+
+# 站点模式的覆盖模板
+SITE_OVERLAY = 'site.html'
+
+# 共用资源：(模板块, 文件扩展名, site.html 中引用它的变量, 文件名前缀)
+# 样式表按模板命名；各主题的脚本通常完全相同，统一命名后靠内容哈希自然合并为一份
+SHARED_BLOCKS = (
+    ('styles', 'css', 'style_href', None),
+    ('script', 'js', 'script_href', 'interactive'),
+)
+
+def write_asset(asset_dir, stem, ext, data, compress=False):
+    """把内容（文本或字节）写成 <stem>.<内容哈希>.<ext>，同名文件已存在时不再写入，返回文件名
+
+    compress 为 True 时同时写出 .gz/.br（见 output_stage.py），已有的不再重复压缩。
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    filename = f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+    path = os.path.join(asset_dir, filename)
+    if not os.path.exists(path):
+        os.makedirs(asset_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    if compress and not all(os.path.exists(path + suffix) for suffix in COMPRESSED_SUFFIXES):
+        compress_file(path)
+    return filename
+
+def write_shared_assets(template, asset_dir, asset_url, minify=False, compress=False, **context):
+    """写出模板共用的样式表和脚本，返回 site.html 需要的变量 style_href、script_href
+
+    Args:
+        template (str): 文档模板，例如 'universal-cyan.html'；同一模板和主题的页面共用同一组文件
+        asset_dir (str): 资源文件目录
+        asset_url (str): 页面引用资源目录使用的相对路径
+        minify (bool): 压缩样式表和脚本中的注释和空白
+        compress (bool): 同时写出 .gz/.br 预压缩文件
+        **context: 模板变量（样式表中的主题色等）
+    """
+    hrefs = {}
+    for block, ext, variable, stem in SHARED_BLOCKS:
+        text = get_template(template, block=block).render(**context)
+        if minify:
+            text = MINIFIERS[f'.{ext}'](text)
+        stem = stem or os.path.splitext(template)[0]
+        hrefs[variable] = f"{asset_url}/{write_asset(asset_dir, stem, ext, text, compress)}"
+    return hrefs
+
+def render_site_page(template, **context):
+    """用站点模式渲染页面，context 中需要有 write_shared_assets 返回的两个变量"""
+    return get_template(template, overlay=SITE_OVERLAY).render(**context)
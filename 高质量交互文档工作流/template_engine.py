@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""交互式HTML的模板引擎
+
+三个交互式HTML生成器原先各自内嵌一个上千行、花括号全部翻倍的 f-string，每次调用都要重新求值。
+现在基础布局、样式、脚本和各文档的差异部分拆成 templates/ 下的独立模板：
+- 模板只编译一次：继承、块覆盖、引用全部在编译时展开，结果是"文本片段 + 变量名"的扁平列表
+- 编译结果缓存在进程内，同时写入磁盘（.template_cache/），模板文件没改动时下次启动直接读取
+- 渲染只是把变量值拼接进片段，不再解析模板
+
+模板语法：
+    {{ name }}                      变量，原样插入（不转义，调用方负责）
+    {% extends "base.html" %}       继承，子模板中块以外的内容被忽略
+    {% block name %}...{% endblock %}  可被子模板覆盖的块，块内可以嵌套块
+    {% include "file.css" %}        引用另一个模板文件，其中的块同样可以被覆盖
+    {# 注释 #}
+
+除了整页渲染，还可以只编译某个块（block=，例如单独取出样式表），或者用覆盖模板（overlay=）
+替换任意层级的块，例如站点模式用 site.html 把内联样式和脚本换成外部文件引用。
+"""
+
+import hashlib
+import json
+import os
+import re
+
+# 模板目录
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# 编译结果的磁盘缓存目录，可通过环境变量 ALLIN_TEMPLATE_CACHE 覆盖
+TEMPLATE_CACHE_DIR = os.environ.get('ALLIN_TEMPLATE_CACHE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.template_cache')
+
+# 缓存格式版本，编译逻辑变化时递增，使旧的磁盘缓存失效
+CACHE_VERSION = 1
+
+TAG_RE = re.compile(
+    r'\{\{\s*(?P<var>\w+)\s*\}\}'
+    r'|\{%\s*(?P<tag>\w+)(?:\s+(?P<arg>"[^"]*"|\w+))?\s*%\}'
+    r'|\{#.*?#\}',
+    re.S
+)
+
+class TemplateError(Exception):
+    """模板语法错误或渲染时缺少变量"""
+
+class CompiledTemplate:
+    """编译好的模板：literals 比 names 多一个，渲染时交替拼接"""
+
+    def __init__(self, name, literals, names):
+        self.name = name
+        self.literals = literals
+        self.names = names
+
+    @property
+    def variables(self):
+        """模板用到的变量名"""
+        return set(self.names)
+
+    def render(self, **context):
+        """把变量值代入模板，返回完整文本"""
+        parts = [self.literals[0]]
+        try:
+            for name, literal in zip(self.names, self.literals[1:]):
+                parts.append(str(context[name]))
+                parts.append(literal)
+        except KeyError as e:
+            raise TemplateError(f"模板 {self.name} 缺少变量: {e.args[0]}") from None
+        return ''.join(parts)
+
+def _parse(source, name):
+    """把模板源码解析为节点列表：str / ('var', 名) / ('block', 名, 子节点) / ('include'|'extends', 文件名)"""
+    root = []
+    stack = [(None, root)]
+    pos = 0
+    for match in TAG_RE.finditer(source):
+        if match.start() > pos:
+            stack[-1][1].append(source[pos:match.start()])
+        pos = match.end()
+
+        nodes = stack[-1][1]
+        if match.group('var'):
+            nodes.append(('var', match.group('var')))
+            continue
+        tag, arg = match.group('tag'), match.group('arg')
+        if tag is None:
+            continue  # 注释
+        if tag == 'block' and arg:
+            children = []
+            nodes.append(('block', arg, children))
+            stack.append((arg, children))
+        elif tag == 'endblock':
+            if len(stack) == 1:
+                raise TemplateError(f"{name}: 多余的 endblock")
+            stack.pop()
+        elif tag in ('include', 'extends') and arg and arg.startswith('"'):
+            nodes.append((tag, arg.strip('"')))
+        else:
+            raise TemplateError(f"{name}: 无法识别的标签 {match.group(0)}")
+    if len(stack) > 1:
+        raise TemplateError(f"{name}: 块 {stack[-1][0]} 没有 endblock")
+    if pos < len(source):
+        root.append(source[pos:])
+    return root
+
+def _collect_blocks(nodes, blocks):
+    """收集子模板定义的所有块（包括嵌套块）"""
+    for node in nodes:
+        if isinstance(node, tuple) and node[0] == 'block':
+            blocks.setdefault(node[1], node[2])
+            _collect_blocks(node[2], blocks)
+
+class _Compiler:
+    """展开继承、块和引用，同时记录用到的模板文件，用于判断缓存是否过期"""
+
+    def __init__(self, template_dir):
+        self.template_dir = template_dir
+        self.files = {}
+        self.capture = None
+        self.captured = None
+
+    def load(self, name):
+        path = os.path.join(self.template_dir, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except OSError as e:
+            raise TemplateError(f"找不到模板: {name}") from e
+        self.files[name] = _file_signature(path)
+        return _parse(source, name)
+
+    def compile(self, name, block=None, overlay=None):
+        # 覆盖模板中的块优先级最高，相当于在继承链最下层再加一层
+        blocks = {}
+        if overlay:
+            _collect_blocks(self.load(overlay), blocks)
+        out = []
+        self.capture = block
+        self._flatten_template(name, blocks, out, ())
+        if block is not None:
+            if self.captured is None:
+                raise TemplateError(f"模板 {name} 中没有块: {block}")
+            out = self.captured
+        literals, names = [''], []
+        for item in out:
+            if isinstance(item, str):
+                literals[-1] += item
+            else:
+                names.append(item[1])
+                literals.append('')
+        return literals, names
+
+    def _flatten_template(self, name, blocks, out, chain):
+        if name in chain:
+            raise TemplateError(f"模板循环引用: {' → '.join(chain + (name,))}")
+        chain = chain + (name,)
+        nodes = self.load(name)
+        parent = next((node[1] for node in nodes
+                       if isinstance(node, tuple) and node[0] == 'extends'), None)
+        if parent:
+            # 更下层（更具体）的模板定义的块优先
+            merged = {}
+            _collect_blocks(nodes, merged)
+            merged.update(blocks)
+            self._flatten_template(parent, merged, out, chain)
+        else:
+            self._flatten(nodes, blocks, out, chain)
+
+    def _flatten(self, nodes, blocks, out, chain):
+        for node in nodes:
+            if isinstance(node, str):
+                out.append(node)
+            elif node[0] == 'var':
+                out.append(node)
+            elif node[0] == 'block' and node[1] == self.capture:
+                captured = []
+                self._flatten(blocks.get(node[1], node[2]), blocks, captured, chain)
+                self.captured = captured
+                out.extend(captured)
+            elif node[0] == 'block':
+                self._flatten(blocks.get(node[1], node[2]), blocks, out, chain)
+            elif node[0] == 'include':
+                if node[1] in chain:
+                    raise TemplateError(f"模板循环引用: {' → '.join(chain + (node[1],))}")
+                self._flatten(self.load(node[1]), blocks, out, chain + (node[1],))
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _is_fresh(files, template_dir):
+    """编译时用到的模板文件是否都没有改动"""
+    for name, signature in files.items():
+        try:
+            if _file_signature(os.path.join(template_dir, name)) != signature:
+                return False
+        except OSError:
+            return False
+    return True
+
+def _variant_name(name, block=None, overlay=None):
+    """模板变体的名字，例如 research.html#styles、research.html+site.html"""
+    return name + (f"#{block}" if block else '') + (f"+{overlay}" if overlay else '')
+
+def _cache_path(name, template_dir, cache_dir):
+    key = hashlib.sha256(f"{os.path.abspath(template_dir)}\0{name}".encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{key}.json")
+
+def _load_disk_cache(path, template_dir):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != CACHE_VERSION or not _is_fresh(entry['files'], template_dir):
+        return None
+    return entry
+
+def _save_disk_cache(path, entry):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # 缓存写不进去（例如只读目录）不影响渲染
+
+# 进程内缓存：(模板目录, 模板变体名) → (编译时的文件签名, CompiledTemplate)
+_templates = {}
+
+def get_template(name, template_dir=TEMPLATE_DIR, cache_dir=TEMPLATE_CACHE_DIR, block=None, overlay=None):
+    """返回编译好的模板
+
+    依次查找进程内缓存、磁盘缓存，都没有或模板文件有改动时才重新编译。
+
+    Args:
+        block (str): 只编译这个块的内容（继承和覆盖展开之后的结果）
+        overlay (str): 覆盖模板，其中定义的块替换继承链中的同名块，块以外的内容被忽略
+    """
+    variant = _variant_name(name, block, overlay)
+    key = (os.path.abspath(template_dir), variant)
+    cached = _templates.get(key)
+    if cached and _is_fresh(cached[0], template_dir):
+        return cached[1]
+
+    path = _cache_path(variant, template_dir, cache_dir)
+    entry = _load_disk_cache(path, template_dir)
+    if entry is None:
+        compiler = _Compiler(template_dir)
+        literals, names = compiler.compile(name, block, overlay)
+        entry = {'version': CACHE_VERSION, 'files': compiler.files,
+                 'literals': literals, 'names': names}
+        _save_disk_cache(path, entry)
+
+    template = CompiledTemplate(variant, entry['literals'], entry['names'])
+    _templates[key] = (entry['files'], template)
+    return template
+
+def render_template(name, **context):
+    """渲染 templates/ 下的模板"""
+    return get_template(name).render(**context)
@@ -0,0 +1,613 @@
+        // 页面配置，各文档模板通过 page_config 块覆盖
+        const PAGE_CONFIG = {% block page_config %}{
+            themeStorageKey: 'theme',      // 主题偏好在 localStorage 中的键名
+            scrollOffset: 100,             // 跳转到标题时预留的顶部距离
+            activeOffset: 120,             // 标题滚动到该位置以内时高亮对应目录项
+            navbarThreshold: 20,           // 滚动超过该距离时收起导航栏
+            backToTopThreshold: 400,       // 滚动超过该距离时显示返回顶部按钮
+            downloadMessage: ''            // 点击下载按钮时的提示
+        }{% endblock %};
+
+        // 初始化（目录已在生成时写入页面）
+        document.addEventListener('DOMContentLoaded', function() {
+            // 隐藏加载动画
+            document.getElementById('loader').classList.add('hidden');
+
+            // 初始化主题
+            initTheme();
+
+            // 初始化事件监听
+            initEventListeners();
+
+            // 初始化延迟渲染的章节
+            initLazySections();
+
+            // 初始化滚动监听
+            initScrollListener();
+
+            // 初始化代码复制功能
+            initCodeCopy(document);
+
+            // 地址中的锚点在延迟渲染的章节里时，插入后再跳转
+            revealHash('auto');
+{% block page_init %}{% endblock %}        });
+
+        // 平滑滚动
+        function smoothScroll(targetId, behavior = 'smooth') {
+            const target = revealAnchor(targetId);
+            if (target) {
+                const targetPosition = target.offsetTop - PAGE_CONFIG.scrollOffset;
+                window.scrollTo({
+                    top: targetPosition,
+                    behavior: behavior
+                });
+            }
+        }
+
+        // 延迟渲染的章节（见 lazy_sections.py）：<template> 中的内容滚动到附近时才插入页面
+        const lazySections = [];
+        const lazyAnchors = new Map();
+        let hydratedCount = 0;
+        let lazyObserver = null;
+
+        function initLazySections() {
+            document.querySelectorAll('.lazy-section').forEach((placeholder, index) => {
+                lazySections.push(placeholder);
+                placeholder.dataset.anchors.split(' ').forEach(id => {
+                    if (id) {
+                        lazyAnchors.set(id, index);
+                    }
+                });
+            });
+            if (lazySections.length === 0) {
+                return;
+            }
+
+            // 打印前插入全部内容
+            window.addEventListener('beforeprint', () => hydrateSections(lazySections.length - 1));
+
+            // 页面内的 #锚点 链接（例如脚注）指向还没有插入的章节时，浏览器找不到目标，插入后再跳转
+            window.addEventListener('hashchange', () => revealHash('smooth'));
+
+            if (!('IntersectionObserver' in window)) {
+                hydrateSections(lazySections.length - 1);
+                return;
+            }
+            // 提前两屏插入，滚动到时内容已经排好
+            lazyObserver = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        hydrateSections(lazySections.indexOf(entry.target));
+                    }
+                });
+            }, { rootMargin: '0px 0px 200% 0px' });
+            lazySections.forEach(placeholder => lazyObserver.observe(placeholder));
+        }
+
+        // 按顺序插入到第 last 块为止，已插入的部分始终是文档开头连续的一段，
+        // 章节跟踪和滚动位置都不会因为中间缺了一块而出错
+        function hydrateSections(last) {
+            while (hydratedCount <= last && hydratedCount < lazySections.length) {
+                const placeholder = lazySections[hydratedCount++];
+                const template = placeholder.querySelector('template');
+                if (lazyObserver) {
+                    lazyObserver.unobserve(placeholder);
+                }
+                if (template) {
+                    template.replaceWith(template.content);
+                    initCodeCopy(placeholder);
+                    observeHeadings(placeholder);
+                }
+            }
+        }
+
+        // 返回 id 对应的元素，在延迟渲染的章节里时先插入
+        function revealAnchor(id) {
+            if (lazyAnchors.has(id) && !document.getElementById(id)) {
+                hydrateSections(lazyAnchors.get(id));
+            }
+            return document.getElementById(id);
+        }
+
+        function revealHash(behavior) {
+            const id = decodeURIComponent(window.location.hash.slice(1));
+            if (id && lazyAnchors.has(id) && !document.getElementById(id)) {
+                smoothScroll(id, behavior);
+            }
+        }
+
+        // 初始化主题
+        function initTheme() {
+            const savedTheme = localStorage.getItem(PAGE_CONFIG.themeStorageKey) || 'light';
+            document.documentElement.setAttribute('data-theme', savedTheme);
+            updateThemeIcon(savedTheme);
+        }
+
+        // 更新主题图标
+        function updateThemeIcon(theme) {
+            const themeBtn = document.getElementById('themeBtn');
+            const icon = themeBtn.querySelector('i');
+            if (theme === 'dark') {
+                icon.classList.remove('fa-moon');
+                icon.classList.add('fa-sun');
+            } else {
+                icon.classList.remove('fa-sun');
+                icon.classList.add('fa-moon');
+            }
+        }
+
+        // 初始化事件监听
+        function initEventListeners() {
+            // 目录点击：平滑滚动并更新活动状态
+            document.getElementById('tocNav').addEventListener('click', function(e) {
+                const link = e.target.closest('.toc-link');
+                if (!link) {
+                    return;
+                }
+                e.preventDefault();
+                smoothScroll(link.getAttribute('href').slice(1));
+                setActiveTocLink(link);
+            });
+
+            // 主题切换
+            document.getElementById('themeBtn').addEventListener('click', function() {
+                const currentTheme = document.documentElement.getAttribute('data-theme');
+                const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+                document.documentElement.setAttribute('data-theme', newTheme);
+                localStorage.setItem(PAGE_CONFIG.themeStorageKey, newTheme);
+                updateThemeIcon(newTheme);
+            });
+
+            // 侧边栏切换
+            const sidebarToggle = document.getElementById('sidebarToggle');
+            const sidebar = document.getElementById('sidebar');
+            const mainContent = document.getElementById('mainContent');
+
+            sidebarToggle.addEventListener('click', function() {
+                sidebar.classList.toggle('active');
+                sidebarToggle.classList.toggle('active');
+                mainContent.classList.toggle('full-width');
+            });
+
+            // 搜索功能
+            const searchBtn = document.getElementById('searchBtn');
+            const searchContainer = document.getElementById('searchContainer');
+            const searchInput = document.getElementById('searchInput');
+
+            searchBtn.addEventListener('click', function() {
+                searchContainer.classList.toggle('active');
+                if (searchContainer.classList.contains('active')) {
+                    searchInput.focus();
+                    // 打开搜索框时就在后台解析索引，输入第一个字时已经准备好
+                    initSearchWorker();
+                }
+            });
+
+            // 搜索输入：停止输入一小段时间后才搜索，连续输入时不重复计算
+            let searchTimer = null;
+            searchInput.addEventListener('input', function() {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(() => performSearch(this.value), SEARCH_DELAY);
+            });
+
+            // 点击外部关闭搜索
+            document.addEventListener('click', function(e) {
+                if (!searchContainer.contains(e.target) && !searchBtn.contains(e.target)) {
+                    searchContainer.classList.remove('active');
+                }
+            });
+
+            // 打印
+            document.getElementById('printBtn').addEventListener('click', function() {
+                window.print();
+            });
+
+            // 下载（只有配置了提示的文档才有下载按钮）
+            const downloadBtn = document.getElementById('downloadBtn');
+            if (downloadBtn) {
+                downloadBtn.addEventListener('click', function() {
+                    alert(PAGE_CONFIG.downloadMessage);
+                });
+            }
+
+            // 返回顶部
+            document.getElementById('backToTop').addEventListener('click', function() {
+                window.scrollTo({
+                    top: 0,
+                    behavior: 'smooth'
+                });
+            });
+        }
+
+        // 当前高亮的目录项
+        let activeTocLink = null;
+
+        function setActiveTocLink(link) {
+            if (link === activeTocLink) {
+                return;
+            }
+            if (activeTocLink) {
+                activeTocLink.classList.remove('active');
+            }
+            if (link) {
+                link.classList.add('active');
+            }
+            activeTocLink = link;
+        }
+
+        // 初始化滚动监听
+        function initScrollListener() {
+            const navbar = document.getElementById('navbar');
+            const backToTop = document.getElementById('backToTop');
+            const progressBar = document.getElementById('progressBar');
+
+            // 进度条、导航栏和返回顶部按钮：scroll 事件只登记，每帧最多更新一次
+            let maxScroll = 0;
+            let ticking = false;
+
+            function measure() {
+                maxScroll = document.documentElement.scrollHeight - document.documentElement.clientHeight;
+            }
+
+            function updateScrollState() {
+                ticking = false;
+                const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+                const scrollProgress = maxScroll > 0 ? Math.min(scrollTop / maxScroll, 1) * 100 : 0;
+
+                // 更新进度条
+                progressBar.style.width = scrollProgress + '%';
+
+                // 导航栏样式
+                navbar.classList.toggle('scrolled', scrollTop > PAGE_CONFIG.navbarThreshold);
+
+                // 返回顶部按钮
+                backToTop.classList.toggle('visible', scrollTop > PAGE_CONFIG.backToTopThreshold);
+            }
+
+            window.addEventListener('scroll', function() {
+                if (!ticking) {
+                    ticking = true;
+                    requestAnimationFrame(updateScrollState);
+                }
+            }, { passive: true });
+
+            // 页面高度只在尺寸变化时重新读取
+            measure();
+            window.addEventListener('resize', measure);
+            if ('ResizeObserver' in window) {
+                new ResizeObserver(measure).observe(document.body);
+            }
+            updateScrollState();
+
+            initSectionObserver();
+        }
+
+        // 开始跟踪 root 中的标题；延迟渲染的章节插入后再调用
+        let observeHeadings = () => {};
+
+        // 用 IntersectionObserver 跟踪当前章节，滚动时不读取任何标题的位置
+        function initSectionObserver() {
+            if (!('IntersectionObserver' in window)) {
+                return;
+            }
+
+            const tocLinks = new Map();
+            document.querySelectorAll('.toc-link').forEach(link => {
+                tocLinks.set(link.getAttribute('href').slice(1), link);
+            });
+            const headings = [];
+            const position = new Map();
+
+            // below[i]：第 i 个标题是否在高亮线（距顶部 activeOffset）以下；
+            // 还没有插入的章节都在已插入部分的后面，不在数组中也就相当于在高亮线以下
+            const below = [];
+
+            // 观察区域从高亮线一直延伸到页面下方很远处，
+            // 标题越过高亮线（无论滚动多快、跳多远）都会触发一次回调
+            const observer = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    const top = entry.rootBounds ? entry.rootBounds.top : PAGE_CONFIG.activeOffset;
+                    below[position.get(entry.target)] = entry.isIntersecting || entry.boundingClientRect.top >= top;
+                });
+
+                // 标题按文档顺序排列，高亮线以上的最后一个标题就是当前章节
+                let current = below.indexOf(true);
+                current = (current === -1 ? headings.length : current) - 1;
+                setActiveTocLink(current >= 0 ? tocLinks.get(headings[current].id) : null);
+            }, {
+                rootMargin: `-${PAGE_CONFIG.activeOffset}px 0px 1000000px 0px`
+            });
+
+            observeHeadings = function(root) {
+                root.querySelectorAll('h2, h3').forEach(heading => {
+                    if (tocLinks.has(heading.id) && !position.has(heading)) {
+                        position.set(heading, headings.length);
+                        headings.push(heading);
+                        below.push(true);
+                        observer.observe(heading);
+                    }
+                });
+            };
+            observeHeadings(document);
+        }
+
+        // 初始化代码复制（root 为整个页面或新插入的章节）
+        function initCodeCopy(root) {
+            root.querySelectorAll('pre').forEach(pre => {
+                const button = document.createElement('button');
+                button.className = 'code-copy-btn';
+                button.innerHTML = '<i class="fas fa-copy"></i> 复制';
+
+                button.addEventListener('click', function() {
+                    const code = pre.querySelector('code');
+                    const text = code.textContent;
+
+                    navigator.clipboard.writeText(text).then(() => {
+                        button.innerHTML = '<i class="fas fa-check"></i> 已复制';
+                        setTimeout(() => {
+                            button.innerHTML = '<i class="fas fa-copy"></i> 复制';
+                        }, 2000);
+                    });
+                });
+
+                pre.appendChild(button);
+            });
+        }
+
+        // 输入停止多久后开始搜索（毫秒）
+        const SEARCH_DELAY = 150;
+
+        // 搜索索引（生成时由 search_index.py 建立，首次搜索时才解析）
+        let searchData = null;
+        let searchKeys = null;
+
+        function loadSearchIndex() {
+            if (!searchData) {
+                const indexElement = document.getElementById('searchIndex');
+                searchData = indexElement ? JSON.parse(indexElement.textContent) : { sections: [], index: {} };
+                searchKeys = Object.keys(searchData.index);
+            }
+            return searchData;
+        }
+
+        // 只转换 ASCII 大写字母，保证文本长度和下标不变
+        function asciiLower(text) {
+            return text.replace(/[A-Z]+/g, s => s.toLowerCase());
+        }
+
+        // 分词规则与 search_index.py 保持一致：汉字二元组 + 英文数字单词
+        function tokenize(text) {
+            const tokens = [];
+            const pattern = /[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[a-z0-9]+/g;
+            let match;
+            while ((match = pattern.exec(text)) !== null) {
+                const word = match[0];
+                if (/^[a-z0-9]/.test(word) || word.length === 1) {
+                    tokens.push(word);
+                } else {
+                    for (let i = 0; i < word.length - 1; i++) {
+                        tokens.push(word.slice(i, i + 2));
+                    }
+                }
+            }
+            return [...new Set(tokens)];
+        }
+
+        // 查询词对应的索引词：最后一个英文词按前缀匹配（边输入边搜索），单个汉字匹配包含它的二元组
+        function matchingKeys(token, isLast) {
+            if (/^[a-z0-9]/.test(token)) {
+                return isLast ? searchKeys.filter(key => key.startsWith(token)) : [token];
+            }
+            if (token.length === 1) {
+                return searchKeys.filter(key => key.length <= 2 && key.includes(token));
+            }
+            return [token];
+        }
+
+        // 在索引中查找，返回按相关度排序的章节
+        function searchSections(query) {
+            const data = loadSearchIndex();
+            const normalized = asciiLower(query.trim());
+            const tokens = tokenize(normalized);
+            if (tokens.length === 0) {
+                return [];
+            }
+
+            const total = data.sections.length;
+            const hits = new Map();
+            tokens.forEach((token, tokenIndex) => {
+                // 汇总该查询词在每个章节的出现次数和首次出现位置
+                const counts = new Map();
+                matchingKeys(token, tokenIndex === tokens.length - 1).forEach(key => {
+                    if (!Object.prototype.hasOwnProperty.call(data.index, key)) {
+                        return;
+                    }
+                    const postings = data.index[key];
+                    for (let i = 0; i < postings.length; i += 3) {
+                        const entry = counts.get(postings[i]) || { count: 0, offset: Infinity, length: key.length };
+                        entry.count += postings[i + 1];
+                        if (postings[i + 2] < entry.offset) {
+                            entry.offset = postings[i + 2];
+                            entry.length = key.length;
+                        }
+                        counts.set(postings[i], entry);
+                    }
+                });
+
+                const idf = Math.log(1 + total / Math.max(counts.size, 1));
+                counts.forEach((entry, section) => {
+                    const hit = hits.get(section) || { section: section, score: 0, matched: 0, offset: entry.offset, length: entry.length };
+                    hit.score += (1 + Math.log(entry.count)) * idf;
+                    hit.matched += 1;
+                    hits.set(section, hit);
+                });
+            });
+
+            const results = [];
+            hits.forEach(hit => {
+                // 所有查询词都出现的章节才算命中
+                if (hit.matched < tokens.length) {
+                    return;
+                }
+                const section = data.sections[hit.section];
+                const phrase = asciiLower(section.text).indexOf(normalized);
+                if (phrase >= 0) {
+                    hit.score *= 2;
+                    hit.offset = phrase;
+                    hit.length = normalized.length;
+                }
+                if (asciiLower(section.title).includes(normalized)) {
+                    hit.score += 10;
+                }
+                results.push(hit);
+            });
+
+            results.sort((a, b) => b.score - a.score);
+            return results.slice(0, 20);
+        }
+
+        function escapeHTML(text) {
+            return text.replace(/[&<>"']/g, ch => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' })[ch]);
+        }
+
+        // 截取命中位置附近的文字作为摘要，命中部分高亮
+        function buildSnippet(text, offset, length) {
+            const start = Math.max(0, offset - 30);
+            const end = Math.min(text.length, offset + length + 60);
+            return (start > 0 ? '…' : '') +
+                escapeHTML(text.slice(start, offset)) +
+                '<mark>' + escapeHTML(text.slice(offset, offset + length)) + '</mark>' +
+                escapeHTML(text.slice(offset + length, end)) +
+                (end < text.length ? '…' : '');
+        }
+
+        // 搜索结果的显示内容：章节信息和已转义、带高亮的摘要
+        function describeResults(query) {
+            return searchSections(query).map(result => {
+                const section = searchData.sections[result.section];
+                return {
+                    level: section.level,
+                    title: section.title,
+                    doc: section.doc,
+                    url: section.url,
+                    id: section.id,
+                    snippet: buildSnippet(section.text, result.offset, result.length)
+                };
+            });
+        }
+
+        // 搜索在 Web Worker 中进行：索引的解析和查找都不占用主线程，输入时页面不卡顿。
+        // Worker 的代码就是上面这几个函数，不需要额外的文件；无法创建 Worker 时在主线程搜索
+        let searchWorker = null;
+        let searchRequest = 0;
+
+        function initSearchWorker() {
+            if (searchWorker !== null) {
+                return searchWorker;
+            }
+            searchWorker = false;
+            if (!('Worker' in window) || !('Blob' in window)) {
+                return searchWorker;
+            }
+            const source = [asciiLower, tokenize, matchingKeys, searchSections, escapeHTML, buildSnippet, describeResults]
+                .map(fn => fn.toString()).join('\n') + `
+                let searchData = null;
+                let searchKeys = null;
+                function loadSearchIndex() {
+                    return searchData;
+                }
+                onmessage = function(e) {
+                    if (e.data.index !== undefined) {
+                        searchData = JSON.parse(e.data.index);
+                        searchKeys = Object.keys(searchData.index);
+                    } else {
+                        postMessage({ request: e.data.request, results: describeResults(e.data.query) });
+                    }
+                };`;
+            try {
+                const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                const worker = new Worker(url);
+                URL.revokeObjectURL(url);
+                const indexElement = document.getElementById('searchIndex');
+                worker.postMessage({ index: indexElement ? indexElement.textContent : '{"sections":[],"index":{}}' });
+                worker.onmessage = function(e) {
+                    // 只显示最后一次输入的结果
+                    if (e.data.request === searchRequest) {
+                        showSearchResults(e.data.results);
+                    }
+                };
+                worker.onerror = function() {
+                    // Worker 运行出错时改回主线程，重新搜索当前输入
+                    searchWorker = false;
+                    performSearch(document.getElementById('searchInput').value);
+                };
+                searchWorker = worker;
+            } catch (error) {
+                searchWorker = false;  // 例如页面的 CSP 不允许 blob: Worker
+            }
+            return searchWorker;
+        }
+
+        // 搜索功能
+        function performSearch(query) {
+            searchRequest += 1;
+            // 单个英文字母或数字命中太多，至少输入两个字符；单个汉字可以直接搜索
+            const trimmed = query.trim();
+            if (trimmed.length < 2 && /^[\x00-\x7f]*$/.test(trimmed)) {
+                document.getElementById('searchResults').innerHTML = '';
+                return;
+            }
+
+            const worker = initSearchWorker();
+            if (worker) {
+                worker.postMessage({ request: searchRequest, query: query });
+            } else {
+                loadSearchIndex();
+                showSearchResults(describeResults(query));
+            }
+        }
+
+        // 显示搜索结果（摘要已在 buildSnippet 中转义）
+        function showSearchResults(results) {
+            const searchResults = document.getElementById('searchResults');
+            searchResults.innerHTML = '';
+
+            if (results.length > 0) {
+                results.forEach(section => {
+                    const item = document.createElement('div');
+                    // 站点首页的全站索引中，章节带有所属文档（doc）和页面地址（url）
+                    const docLabel = section.doc ? `${escapeHTML(section.doc)} › ` : '';
+                    item.className = 'search-result-item';
+                    item.innerHTML = `<strong>${section.level || '正文'}</strong>: ${docLabel}` +
+                        `${escapeHTML(section.title || section.doc || document.title)}` +
+                        `<div class="search-result-snippet">${section.snippet}</div>`;
+                    item.addEventListener('click', function() {
+                        if (section.url) {
+                            window.location.href = section.url;
+                        } else if (section.id) {
+                            smoothScroll(section.id);
+                        } else {
+                            window.scrollTo({ top: 0, behavior: 'smooth' });
+                        }
+                        document.getElementById('searchContainer').classList.remove('active');
+                    });
+                    searchResults.appendChild(item);
+                });
+            } else {
+                searchResults.innerHTML = '<div class="search-result-item">没有找到相关内容</div>';
+            }
+        }
+{% block page_scripts %}{% endblock %}
+        // 键盘快捷键
+        document.addEventListener('keydown', function(e) {
+            // Ctrl/Cmd + K 打开搜索
+            if ((e.ctrlKey || e.metaKey) && e.key === 'k') {
+                e.preventDefault();
+                document.getElementById('searchBtn').click();
+            }
+
+            // Escape 关闭搜索
+            if (e.key === 'Escape') {
+                document.getElementById('searchContainer').classList.remove('active');
+            }
+{% block shortcuts %}{% endblock %}        });
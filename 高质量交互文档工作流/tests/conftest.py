@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""测试从工作流目录和仓库根目录导入脚本（与 all-in 入口相同）"""
+
+import os
+import sys
+
+WORKFLOW_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(WORKFLOW_DIR)
+
+for path in (WORKFLOW_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""batch_convert_to_pdf 的多进程批量转换"""
+
+import multiprocessing
+
+import pytest
+
+import batch_convert_to_pdf
+import pdf_renderer
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="子进程需要继承替换后的渲染器")
+def test_broken_renderer_reported_per_file(tmp_path, monkeypatch, capsys):
+    def broken_renderer():
+        raise RuntimeError("无法加载渲染器")
+    monkeypatch.setattr(pdf_renderer, 'get_local_renderer', broken_renderer)
+    monkeypatch.setattr(batch_convert_to_pdf, 'get_local_renderer', broken_renderer)
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f'{name}.md').write_text(f'# {name}\n\n正文\n', encoding='utf-8')
+
+    # 子进程预热失败不能让进程池失效，错误按文件报告
+    batch_convert_to_pdf.batch_convert([str(tmp_path)], str(tmp_path / 'pdf'), jobs=2)
+    out = capsys.readouterr().out
+    assert out.count('❌ 转换失败') == 3
+    assert '无法加载渲染器' in out
+    assert '共转换 0/3 个文件' in out
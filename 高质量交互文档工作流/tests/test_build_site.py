@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""build_site 的增量构建"""
+
+import json
+
+import build_site
+
+def build(source_dir, output_dir):
+    build_site.build_site(str(source_dir), str(output_dir), jobs=1)
+    with open(output_dir / build_site.MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        return json.load(f)['pages']
+
+def test_code_change_rebuilds_pages(tmp_path, monkeypatch, capsys):
+    source_dir, output_dir = tmp_path / 'docs', tmp_path / 'site'
+    source_dir.mkdir()
+    (source_dir / '方案.md').write_text('# 方案\n\n## 背景\n\n正文\n', encoding='utf-8')
+
+    first = build(source_dir, output_dir)
+    second = build(source_dir, output_dir)
+    assert first == second
+    assert '生成 0 个页面' in capsys.readouterr().out
+
+    # 生成脚本改动后，内容不变的页面也要重新生成
+    monkeypatch.setattr(build_site, 'code_digest', lambda exclude=(): 'changed')
+    third = build(source_dir, output_dir)
+    assert third['方案.md']['key'] != first['方案.md']['key']
+    assert '生成 1 个页面' in capsys.readouterr().out
+
+def test_code_digest(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_site, 'WORKFLOW_DIR', str(tmp_path))
+    (tmp_path / 'a.py').write_text('x = 1\n')
+    (tmp_path / 'b.py').write_text('y = 1\n')
+    (tmp_path / 'notes.txt').write_text('不计入')
+    digest = build_site.code_digest()
+    (tmp_path / 'notes.txt').write_text('改动')
+    assert build_site.code_digest() == digest
+    (tmp_path / 'b.py').write_text('y = 2\n')
+    assert build_site.code_digest() != digest
+    assert build_site.code_digest(exclude={'b.py'}) != digest
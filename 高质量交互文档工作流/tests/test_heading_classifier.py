@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""convert_word_to_md.HeadingClassifier 的标题判断"""
+
+from convert_word_to_md import DEFAULT_CLASSIFIER, HeadingClassifier
+
+def test_numbered_headings():
+    assert DEFAULT_CLASSIFIER.classify('第一章 项目背景') == 2
+    assert DEFAULT_CLASSIFIER.classify('一、市场分析') == 2
+    assert DEFAULT_CLASSIFIER.classify('（二）竞品对比') == 3
+    assert DEFAULT_CLASSIFIER.classify('1.2 用户画像') == 3
+    assert DEFAULT_CLASSIFIER.classify('1.2.3 访谈记录') == 4
+    assert DEFAULT_CLASSIFIER.classify('短标题') == 2
+
+def test_long_numbered_sentence_stays_paragraph():
+    sentence = '1. ' + '这是一个编号开头的很长的句子，用来说明列表中的一项具体内容' * 8 + '。'
+    assert len(sentence) > 200
+    assert DEFAULT_CLASSIFIER.classify(sentence) == 0
+    assert DEFAULT_CLASSIFIER.classify('第一章 ' + '很长的章节说明' * 10) == 0
+
+def test_numbered_sentence_with_sentence_end_stays_paragraph():
+    assert DEFAULT_CLASSIFIER.classify('1. 先准备材料。') == 0
+    assert DEFAULT_CLASSIFIER.classify('一、这样可以吗？') == 0
+
+def test_speaker_and_url_demoted():
+    assert DEFAULT_CLASSIFIER.classify('周子轩(00:00:04): 我们开始吧') == 0
+    assert DEFAULT_CLASSIFIER.classify('主持人（01:02:03）') == 0
+    assert DEFAULT_CLASSIFIER.classify('Kaid:') == 0
+    assert DEFAULT_CLASSIFIER.classify('https://example.com/docs') == 0
+    assert DEFAULT_CLASSIFIER.classify('www.example.com') == 0
+
+def test_styles_bypass_heuristics():
+    long_text = '很长的标题样式段落' * 10 + '。'
+    assert DEFAULT_CLASSIFIER.classify(long_text, style_name='Heading 1') == 2
+    assert DEFAULT_CLASSIFIER.classify(long_text, outline_level=1) == 3
+    assert DEFAULT_CLASSIFIER.classify('周子轩(00:00:04)', style_name='Heading 2') == 3
+
+def test_custom_max_length():
+    classifier = HeadingClassifier(max_length=10)
+    assert classifier.classify('1. 十个字以内') == 3
+    assert classifier.classify('1. 超过十个字的编号标题行') == 0
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""convert_research_to_pdf.replace_image_placeholders 与原来的正则实现输出相同"""
+
+import os
+import re
+
+import pytest
+
+from convert_research_to_pdf import render_image_placeholder, replace_image_placeholders
+
+# 原来的实现：一次 re.sub，遇到很长且没有换行的标记行时会回溯很久
+OLD_PATTERN = re.compile(r'> (📌 \*\*图片位置.*?\n(?:> .*\n)*)', flags=re.MULTILINE)
+
+def old_replace_image_placeholders(markdown_content):
+    def replace_image_placeholder(match):
+        text = match.group(1)
+        if "图片位置" in text:
+            return render_image_placeholder(text)
+        return match.group(0)
+    return OLD_PATTERN.sub(replace_image_placeholder, markdown_content)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def repo_markdown_files():
+    for dirpath, dirnames, filenames in os.walk(REPO_ROOT):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+        for filename in sorted(filenames):
+            if filename.endswith('.md'):
+                yield os.path.join(dirpath, filename)
+
+REPORT = """# 个人信息管理系统调研报告
+
+## 一、系统架构
+
+> 📌 **图片位置1：系统架构图**
+> 展示数据层、服务层和界面层
+> 以及它们之间的调用关系
+
+正文段落。
+
+> 普通引用，不是占位符
+> 📌 不是加粗的标记
+
+## 二、界面
+> 📌 **图片位置2：主界面截图**
+"""
+
+EDGE_CASES = {
+    '报告': REPORT,
+    '相邻的占位符': "> 📌 **图片位置1：甲**\n> 说明甲\n> 📌 **图片位置2：乙**\n> 📌 **图片位置3：丙**\n> 说明丙\n后文\n",
+    '末尾没有换行': "前文\n> 📌 **图片位置1：结尾图**",
+    '末尾引用行没有换行': "> 📌 **图片位置1：结尾图**\n> 最后一行说明",
+    '未知的图片名': "> 📌 **图片位置：**\n> 📌 **图片位置?? <未知> & 名称**\n> 📌 **图片说明：不是占位符**\n",
+    '行中间的标记': "列表项 > 📌 **图片位置9：行内**\n> 说明\n",
+    '回车换行': "> 📌 **图片位置1：Windows**\r\n> 说明\r\n正文\r\n",
+    '空引用行': "> 📌 **图片位置1：图**\n>\n> 说明\n",
+    '空文档': "",
+}
+
+@pytest.mark.parametrize('name', list(EDGE_CASES))
+def test_edge_cases(name):
+    markdown_content = EDGE_CASES[name]
+    assert replace_image_placeholders(markdown_content) == old_replace_image_placeholders(markdown_content)
+
+def test_repo_markdown():
+    files = list(repo_markdown_files())
+    assert files
+    for path in files:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            markdown_content = f.read()
+        for content in (markdown_content, markdown_content + '\n' + REPORT):
+            assert replace_image_placeholders(content) == old_replace_image_placeholders(content), path
+
+def test_placeholders_replaced():
+    html = replace_image_placeholders(REPORT)
+    assert html.count('class="image-placeholder"') == 2
+    assert '图片位置1：系统架构图' in html and '以及它们之间的调用关系' in html
+    assert '> 普通引用，不是占位符' in html
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""各Markdown引擎与参考实现 markdown2 的一致性，按生成脚本用到的扩展分组
+
+比较方式见 benchmark_markdown.compare_html：章节的 id、级别和标题，元素结构，以及页面文字。
+仓库全部文档上的比较和速度对比用 benchmark_markdown.py。
+"""
+
+import pytest
+
+from benchmark_markdown import compare_html
+from interactive_page import MARKDOWN_EXTRAS
+from markdown_engines import REFERENCE_ENGINE, render_markdown
+
+# 扩展 → 样例；None 是不依赖扩展的基本语法
+CONFORMANCE_CASES = [
+    ('header-ids', "# 概述 Overview\n\n## 1. 背景：现状\n\n## 1. 背景：现状\n\n### **重点** `代码` 与 [链接](a.md)\n\n"
+                   "> ### 引用中的标题\n\n设置标题\n====\n\n#没有空格的标题\n"),
+    ('break-on-newline', "第一行\n第二行 with **粗体** 和 *斜体*\n\n另一段\n"),
+    ('tables', "| 项目 | 数量 | 说明 |\n|:-----|-----:|:----:|\n| 音响 | 2 | 租赁 |\n| 灯光 | 4 | `DMX` |\n"),
+    ('fenced-code-blocks', "```python\ndef f(x):\n    return x < 1 and '<b>'\n```\n\n```\n# 不是标题\n```\n\n"
+                           "行内 `a < b` 代码\n"),
+    ('strike', "原价 ~~199~~ 现价 99\n"),
+    ('task_list', "- [ ] 待办事项\n- [x] 已完成\n- 普通项\n"),
+    ('footnotes', "正文引用[^1]，再次引用[^note]。\n\n[^1]: 第一个脚注。\n[^note]: 命名脚注。\n"),
+    (None, "1. 第一步\n2. 第二步\n   - 子项 A\n   - 子项 B\n3. 第三步\n\n- 甲\n\n- 乙\n"),
+    (None, "> 引用第一行\n> 引用第二行\n\n---\n\n结尾\n"),
+    (None, '<div class="note">\n提示内容\n</div>\n\n段落里的 <span class="tag">标签</span>\n'),
+    (None, "[文档](docs/guide.md) 和 ![图](img/a.png)\n\n<https://example.com>\n"),
+]
+
+def test_cases_cover_extras():
+    assert set(MARKDOWN_EXTRAS) <= {extra for extra, _ in CONFORMANCE_CASES}
+
+@pytest.mark.parametrize('extra, markdown_content', CONFORMANCE_CASES,
+                         ids=[f'{extra or "基本语法"}-{i}' for i, (extra, _) in enumerate(CONFORMANCE_CASES)])
+def test_cmarkgfm_matches_reference(extra, markdown_content):
+    pytest.importorskip('cmarkgfm')
+    reference = render_markdown(markdown_content, MARKDOWN_EXTRAS, REFERENCE_ENGINE)
+    candidate = render_markdown(markdown_content, MARKDOWN_EXTRAS, 'cmarkgfm')
+    assert compare_html(reference, candidate) == {}
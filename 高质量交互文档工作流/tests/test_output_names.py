@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""convert_word_to_md 的输出文件名分配：不覆盖输出目录中已有的文件"""
+
+import os
+
+from docx import Document
+
+from convert_word_to_md import OutputNameIndex, convert_word_to_markdown
+
+def test_existing_files_are_taken():
+    names = OutputNameIndex({'a.docx': {'output': '甲.md'}}, existing=['甲.md', '手写.md'])
+    assert names.owner('手写.md') is OutputNameIndex.EXISTING
+    assert names.owner('甲.md') == 'a.docx'
+    assert names.claim('a.docx', '甲.md', '甲.md') == '甲.md'
+    assert names.claim('b.docx', '手写.md') == '手写_2.md'
+    assert names.claim('c.docx', '手写.md') == '手写_3.md'
+
+def test_first_run_keeps_hand_written_file(tmp_path):
+    input_dir, output_dir = tmp_path / 'inbox', tmp_path / 'out'
+    input_dir.mkdir()
+    document = Document()
+    document.add_paragraph('会议纪要')
+    document.add_paragraph('这是会议的正文内容，记录了讨论的要点。')
+    document.save(str(input_dir / '会议.docx'))
+
+    # 先转换一次，得到这份文档的输出文件名
+    convert_word_to_markdown(str(input_dir), str(tmp_path / 'probe'))
+    filename = next(name for name in os.listdir(tmp_path / 'probe') if name.endswith('.md'))
+
+    output_dir.mkdir()
+    (output_dir / filename).write_text('手写的内容\n', encoding='utf-8')
+    convert_word_to_markdown(str(input_dir), str(output_dir))
+    stem, ext = os.path.splitext(filename)
+    assert (output_dir / filename).read_text(encoding='utf-8') == '手写的内容\n'
+    assert '会议的正文内容' in (output_dir / f'{stem}_2{ext}').read_text(encoding='utf-8')
+
+    # 再次运行：文档未变化，沿用带后缀的文件名
+    convert_word_to_markdown(str(input_dir), str(output_dir))
+    assert sorted(name for name in os.listdir(output_dir) if name.endswith('.md')) == [filename, f'{stem}_2{ext}']
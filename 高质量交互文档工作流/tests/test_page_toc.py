@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""page_toc 的服务端目录"""
+
+from interactive_page import build_interactive_page
+from page_toc import add_heading_ids, build_toc_html
+from search_index import extract_sections
+
+def test_add_heading_ids():
+    html_content = ('<h2 id="intro">简介</h2><h3>细节</h3><h4>不处理</h4>'
+                    '<h2 class="raw">原始标题</h2><p>&lt;h2&gt;代码里的不算</p>')
+    assert add_heading_ids(html_content) == (
+        '<h2 id="intro">简介</h2><h3 id="heading-1">细节</h3><h4>不处理</h4>'
+        '<h2 id="heading-2" class="raw">原始标题</h2><p>&lt;h2&gt;代码里的不算</p>')
+
+def test_toc_includes_headings_without_id():
+    sections = extract_sections(add_heading_ids('<h2>第一章</h2><p>正文</p><h3>小节</h3><p>正文</p>'))
+    toc = build_toc_html(sections)
+    assert 'href="#heading-0">第一章</a>' in toc
+    assert 'href="#heading-1">小节</a>' in toc
+
+def test_page_with_raw_html_heading():
+    markdown_content = "## 概述\n\n正文\n\n<h2>手写的标题</h2>\n\n### 子标题\n\n内容\n"
+    html_document, search_index = build_interactive_page(markdown_content, 'research.html', title='测试')
+    assert '<h2 id="heading-1">手写的标题</h2>' in html_document
+    assert 'href="#heading-1">手写的标题</a>' in html_document
+    assert 'heading-1' in [section['id'] for section in search_index['sections']]
+    assert 'href="#概述">概述</a>' in html_document and 'href="#子标题">子标题</a>' in html_document
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""PDF转换脚本按Markdown所在目录解析相对路径"""
+
+import os
+
+import pytest
+
+import convert_research_to_pdf
+import convert_to_pdf
+
+@pytest.fixture
+def document(tmp_path):
+    md_file = tmp_path / 'docs' / '报告.md'
+    md_file.parent.mkdir()
+    md_file.write_text('# 报告\n\n## 一\n\n![图](img/a.png)\n\n## 二\n\n正文\n', encoding='utf-8')
+    return md_file
+
+def record_render(monkeypatch, module, calls):
+    def fake_render_pdf(html_document, css_text, pdf_file, base_url=None, **kwargs):
+        calls.append(base_url)
+    monkeypatch.setattr(module, 'render_pdf', fake_render_pdf)
+
+@pytest.mark.parametrize('module', [convert_research_to_pdf, convert_to_pdf])
+def test_full_render_base_url(module, document, tmp_path, monkeypatch):
+    calls = []
+    record_render(monkeypatch, module, calls)
+    module.convert_markdown_to_pdf(str(document), str(tmp_path / 'out.pdf'))
+    assert calls == [os.path.dirname(str(document))]
+
+def test_incremental_render_same_base_url(document, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(convert_research_to_pdf, 'render_chapters',
+                        lambda *args, base_url=None, **kwargs: (calls.append(base_url), (1, 0))[1])
+    convert_research_to_pdf.convert_markdown_to_pdf(str(document), str(tmp_path / 'out.pdf'), incremental=True)
+    assert calls == [os.path.dirname(str(document))]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""pdf_renderer 的样式表缓存和渲染服务的 socket 权限"""
+
+import os
+import socket
+from collections import OrderedDict
+
+import pytest
+
+import pdf_renderer
+from pdf_renderer import STYLESHEET_CACHE_SIZE, PdfRenderer
+
+def make_renderer(parsed):
+    """不导入 WeasyPrint 的渲染器，parsed 记录每次解析的样式表"""
+    renderer = PdfRenderer.__new__(PdfRenderer)
+    renderer.font_config = None
+    renderer._stylesheets = OrderedDict()
+
+    def parse(string, font_config):
+        parsed.append(string)
+        return object()
+    renderer._css_class = parse
+    return renderer
+
+def test_stylesheet_cache_is_bounded():
+    parsed = []
+    renderer = make_renderer(parsed)
+    first = renderer.stylesheet('body {}')
+    assert renderer.stylesheet('body {}') is first
+    for i in range(STYLESHEET_CACHE_SIZE * 3):
+        renderer.stylesheet(f'p {{ margin: {i}px; }}')
+        renderer.stylesheet('body {}')  # 常用的样式表一直留在缓存中
+    assert len(renderer._stylesheets) == STYLESHEET_CACHE_SIZE
+    assert renderer.stylesheet('body {}') is first
+    assert parsed.count('body {}') == 1
+
+    renderer.stylesheet('p { margin: 0px; }')  # 早已被挤出，重新解析
+    assert parsed.count('p { margin: 0px; }') == 2
+
+@pytest.mark.skipif(bool(os.environ.get('ALLIN_PDF_SOCKET')), reason="socket 路径由环境变量指定")
+def test_default_socket_in_private_dir():
+    assert os.path.dirname(pdf_renderer.DEFAULT_SOCKET) == pdf_renderer.SOCKET_DIR
+    assert os.path.basename(pdf_renderer.SOCKET_DIR) == f'all-in-pdf-{os.getuid()}'
+
+def test_prepare_socket_dir(tmp_path):
+    socket_dir = tmp_path / 'all-in-pdf'
+    socket_path = str(socket_dir / 'render.sock')
+    pdf_renderer._prepare_socket_dir(socket_path, str(socket_dir))
+    assert socket_dir.stat().st_mode & 0o777 == 0o700
+
+    socket_dir.chmod(0o755)
+    with pytest.raises(RuntimeError):
+        pdf_renderer._prepare_socket_dir(socket_path, str(socket_dir))
+
+def test_foreign_socket_not_used(tmp_path):
+    assert not pdf_renderer._owned_socket(str(tmp_path / 'missing.sock'))
+    not_a_socket = tmp_path / 'render.sock'
+    not_a_socket.write_text('')
+    assert not pdf_renderer._owned_socket(str(not_a_socket))
+
+@pytest.mark.skipif(not hasattr(socket, 'SO_PEERCRED'), reason="需要 SO_PEERCRED")
+def test_server_accepts_same_user(tmp_path):
+    socket_path = str(tmp_path / 'render.sock')
+    with pdf_renderer._RenderServer(socket_path, pdf_renderer._RenderHandler) as server:
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        assert pdf_renderer._owned_socket(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            connection, address = server.get_request()
+            with connection:
+                assert server.verify_request(connection, address)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""all-in build 的目标图"""
+
+import sys
+
+import pytest
+
+import pipeline
+
+def run_build(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['all-in', 'build', *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        pipeline.main()
+    return exit_info.value.code
+
+def test_empty_docx_inbox(tmp_path, monkeypatch, capsys):
+    docx_dir, md_dir = tmp_path / '待处理', tmp_path / 'md'
+    docx_dir.mkdir()
+    md_dir.mkdir()
+    state_file = tmp_path / 'state.json'
+    common = ['--docx-dir', str(docx_dir), '--md-dir', str(md_dir), '--state', str(state_file), '-j', '1']
+
+    assert run_build(monkeypatch, *common, '-n') == 0
+    assert 'docx:' in capsys.readouterr().out
+
+    # 执行后再次构建：空收件箱的目标未变化，跳过
+    assert run_build(monkeypatch, *common) == 0
+    assert run_build(monkeypatch, *common) == 0
+    assert '跳过未变化的 1 个' in capsys.readouterr().out
+
+def test_make_target_name():
+    assert pipeline.make_target('docx', [], [], {}, name='docx:待处理')['name'] == 'docx:待处理'
+    target = pipeline.make_target('pdf', ['a.md'], ['out/a.pdf'], {})
+    assert target['name'] == 'pdf:' + pipeline._rel('out/a.pdf')